@@ -6,10 +6,18 @@ This module contains common formatting functions, colors, and utilities
 used across subinfo, indexerinfo, and delegatorinfo.
 """
 
+import json
 import os
 import re
-from datetime import datetime
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 class Colors:
@@ -49,22 +57,41 @@ def terminal_link(url: str, text: str) -> str:
 def format_deployment_link(ipfs_hash: str, subgraph_id: Optional[str] = None) -> str:
     """Format IPFS hash as a clickable link to The Graph Explorer"""
     if subgraph_id:
-        url = f"https://thegraph.com/explorer/subgraphs/{subgraph_id}?view=Query&chain=arbitrum-one"
-        return terminal_link(url, ipfs_hash)
+        return _deployment_link(ipfs_hash, subgraph_id, os.environ.get('NO_HYPERLINKS') == '1')
     return ipfs_hash
 
 
-def format_tokens(tokens: str) -> str:
+@lru_cache(maxsize=4096)
+def _deployment_link(ipfs_hash: str, subgraph_id: str, no_hyperlinks: bool) -> str:
+    """Build the explorer link, memoized since the same deployments recur across rows
+    
+    no_hyperlinks only keys the cache on the NO_HYPERLINKS setting read by terminal_link.
+    """
+    url = f"https://thegraph.com/explorer/subgraphs/{subgraph_id}?view=Query&chain=arbitrum-one"
+    return terminal_link(url, ipfs_hash)
+
+
+def wei_to_grt(wei: Union[int, str]) -> float:
+    """Convert a wei amount (int or decimal string) to GRT as a float
+    
+    Parses straight to float: exact to ~15 significant digits, which is all
+    display and APR math need. Use format_tokens_int when exact whole GRT matter.
+    """
+    return float(wei) / 1e18
+
+
+@lru_cache(maxsize=2048)
+def format_tokens(tokens: Union[int, str]) -> str:
     """Format token amount with thousands separator
     
     Args:
-        tokens: Token amount as string (in wei, 18 decimals)
+        tokens: Token amount as int or string (in wei, 18 decimals)
     
     Returns:
         Formatted string like "1,234,567 GRT"
     """
     try:
-        amount = float(tokens) / 1e18
+        amount = wei_to_grt(tokens)
         if amount >= 1:
             return f"{amount:,.0f} GRT"
         elif amount > 0:
@@ -77,17 +104,18 @@ def format_tokens(tokens: str) -> str:
         return "0 GRT"
 
 
-def format_tokens_short(tokens: str) -> str:
+@lru_cache(maxsize=2048)
+def format_tokens_short(tokens: Union[int, str]) -> str:
     """Format token amount in short form (k, M)
     
     Args:
-        tokens: Token amount as string (in wei, 18 decimals)
+        tokens: Token amount as int or string (in wei, 18 decimals)
     
     Returns:
         Formatted string like "1.2M" or "456k"
     """
     try:
-        amount = float(tokens) / 1e18
+        amount = wei_to_grt(tokens)
         if amount >= 1_000_000:
             return f"{amount/1_000_000:.1f}M"
         elif amount >= 1_000:
@@ -100,16 +128,31 @@ def format_tokens_short(tokens: str) -> str:
         return "0"
 
 
+def format_tokens_int(wei: int) -> str:
+    """Format an integer wei amount as whole GRT with thousands separator
+    
+    Uses integer arithmetic only, so large amounts keep full precision.
+    
+    Args:
+        wei: Token amount in wei (18 decimals)
+    
+    Returns:
+        Formatted string like "1,234,567" (rounded to the nearest GRT)
+    """
+    return f"{(wei + 5 * 10**17) // 10**18:,}"
+
+
+@lru_cache(maxsize=2048)
 def format_percentage(value: float) -> str:
     """Format a PPM (parts per million) value as percentage"""
     return f"{value / 10000:.2f}%"
 
 
-def format_timestamp(ts: str) -> str:
-    """Format Unix timestamp to readable date string"""
+@lru_cache(maxsize=2048)
+def format_timestamp(ts: Union[int, str]) -> str:
+    """Format Unix timestamp (int or numeric string) to readable date string"""
     try:
-        dt = datetime.fromtimestamp(int(ts))
-        return dt.strftime('%Y-%m-%d %H:%M')
+        return time.strftime('%Y-%m-%d %H:%M', time.localtime(int(ts)))
     except:
         return 'Unknown'
 
@@ -153,13 +196,28 @@ def print_section(title: str, colors: type = Colors):
     print(f"\n{colors.CYAN}▸ {title}{colors.RESET}")
 
 
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
 def strip_ansi(text: str) -> str:
     """Remove ANSI color codes from text"""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    return _ANSI_ESCAPE_RE.sub('', text)
 
 
 def get_display_width(text: str) -> int:
     """Get display width of text without ANSI codes"""
     return len(strip_ansi(text))
 
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
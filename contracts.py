@@ -120,8 +120,10 @@ class HorizonStakingClient:
     with the contract's getTokensAvailable value.
     """
 
-    def __init__(self, rpc_url: str):
+    def __init__(self, rpc_url: str, session: Optional[requests.Session] = None):
         self.rpc_url = rpc_url
+        # Keep the connection open between the successive eth_calls
+        self._session = session or requests.Session()
         self._delegation_ratio: Optional[int] = None
 
     def _eth_call(self, to: str, data: str) -> Optional[str]:
@@ -133,7 +135,7 @@ class HorizonStakingClient:
             "id": 1,
         }
         try:
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
+            response = self._session.post(self.rpc_url, json=payload, timeout=10)
             response.raise_for_status()
             result = response.json()
             if "error" in result:
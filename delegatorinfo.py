@@ -45,9 +45,9 @@ log = get_logger(__name__)
 class TheGraphClient:
     """Client to query The Graph Network subgraph"""
     
-    def __init__(self, network_subgraph_url: str):
+    def __init__(self, network_subgraph_url: str, session: Optional[requests.Session] = None):
         self.network_subgraph_url = network_subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
     
     def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query"""
@@ -206,9 +206,9 @@ class TheGraphClient:
 class AnalyticsClient:
     """Client to query The Graph Analytics subgraph"""
     
-    def __init__(self, analytics_subgraph_url: str):
+    def __init__(self, analytics_subgraph_url: str, session: Optional[requests.Session] = None):
         self.analytics_subgraph_url = analytics_subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
     
     def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query"""
@@ -739,9 +739,11 @@ Examples:
     
     ens_url = get_ens_subgraph_url()
     
-    client = TheGraphClient(network_url)
-    analytics_client = AnalyticsClient(analytics_url) if analytics_url else None
-    ens_client = ENSClient(ens_url) if ens_url else None
+    # One HTTP session for all clients, so connections are reused across them
+    session = requests.Session()
+    client = TheGraphClient(network_url, session=session)
+    analytics_client = AnalyticsClient(analytics_url, session=session) if analytics_url else None
+    ens_client = ENSClient(ens_url, session=session) if ens_url else None
     
     # Resolve delegator address
     delegator_id = args.delegator
@@ -1408,15 +1410,13 @@ Examples:
         total_accrued = 0.0
         total_delegator_share = 0.0
         
+        # Resolve ENS names for all indexers in batch (served from the cache if resolved earlier)
+        accrued_ens_names = {}
+        if ens_client and indexer_allocations:
+            accrued_ens_names = ens_client.resolve_addresses_batch(list(indexer_allocations))
+        
         for indexer_id, allocs in indexer_allocations.items():
-            # Use batch-resolved ENS names if available, otherwise resolve individually
-            indexer_ens = None
-            if ens_client:
-                # Try batch first (if we resolved earlier)
-                if 'ens_names_batch' in locals() and indexer_id.lower() in ens_names_batch:
-                    indexer_ens = ens_names_batch[indexer_id.lower()]
-                else:
-                    indexer_ens = ens_client.resolve_address(indexer_id)
+            indexer_ens = accrued_ens_names.get(indexer_id.lower())
             indexer_display = indexer_ens or f"{indexer_id[:10]}.."
             
             # Batch fetch rewards for this indexer's allocations
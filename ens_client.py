@@ -5,12 +5,17 @@ ENS (Ethereum Name Service) client for grtinfo CLI tools
 This module provides ENS name resolution with caching.
 """
 
+import atexit
 import json
+import os
+import tempfile
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 import requests
 
+from common import json_loads
+
 
 class ENSClient:
     """Client to resolve ENS names from a subgraph
@@ -22,26 +27,34 @@ class ENSClient:
     - Persistent disk cache with TTL
     """
     
-    def __init__(self, ens_subgraph_url: str, cache_ttl: int = 86400):
+    # Upper bound on cached addresses; the oldest lookups are dropped first
+    MAX_CACHE_ENTRIES = 50000
+    
+    def __init__(self, ens_subgraph_url: str, cache_ttl: int = 86400,
+                 session: Optional[requests.Session] = None):
         """Initialize ENS client
         
         Args:
             ens_subgraph_url: URL of the ENS subgraph
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
+            session: Optional HTTP session to share with other clients
         """
         self.ens_subgraph_url = ens_subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
         self._cache: Dict[str, dict] = {}
         self._cache_file = Path.home() / '.grtinfo' / 'ens_cache.json'
         self._cache_ttl = cache_ttl
+        self._cache_dirty = False
         self._load_cache()
+        # Lookups only mark the cache dirty; it is written once when the process exits
+        atexit.register(self._save_cache)
     
     def _load_cache(self):
         """Load ENS cache from disk"""
         try:
             if self._cache_file.exists():
-                with open(self._cache_file, 'r') as f:
-                    cache_data = json.load(f)
+                with open(self._cache_file, 'rb') as f:
+                    cache_data = json_loads(f.read())
                     now = time.time()
                     for addr, entry in cache_data.items():
                         if isinstance(entry, dict) and 'name' in entry and 'timestamp' in entry:
@@ -55,13 +68,33 @@ class ENSClient:
             pass
     
     def _save_cache(self):
-        """Save ENS cache to disk"""
+        """Save ENS cache to disk if it changed
+        
+        Writes to a temporary file and renames it over the cache, so a concurrent
+        run or an interrupted write never leaves a truncated file behind.
+        """
+        if not self._cache_dirty:
+            return
+        tmp_path = None
         try:
+            if len(self._cache) > self.MAX_CACHE_ENTRIES:
+                newest = sorted(self._cache.items(), key=lambda item: item[1].get('timestamp', 0), reverse=True)
+                self._cache = dict(newest[:self.MAX_CACHE_ENTRIES])
             self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._cache_file, 'w') as f:
-                json.dump(self._cache, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._cache_file.parent), prefix='.ens_cache.')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self._cache, f, separators=(',', ':'))
+            os.replace(tmp_path, self._cache_file)
+            tmp_path = None
+            self._cache_dirty = False
         except:
             pass
+        finally:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query against the ENS subgraph"""
@@ -73,7 +106,7 @@ class ENSClient:
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             if 'errors' in data:
                 return {}
             return data.get('data', {})
@@ -122,14 +155,14 @@ class ENSClient:
                 name = domains[0].get('name')
                 if name:
                     self._cache[address_lower] = {'name': name, 'timestamp': time.time()}
-                    self._save_cache()
+                    self._cache_dirty = True
                     return name
         except:
             pass
         
         # Cache negative result
         self._cache[address_lower] = {'name': None, 'timestamp': time.time()}
-        self._save_cache()
+        self._cache_dirty = True
         return None
     
     def resolve_addresses_batch(self, addresses: List[str]) -> Dict[str, Optional[str]]:
@@ -163,12 +196,16 @@ class ENSClient:
         if not to_query:
             return results
         
-        # Batch query uncached addresses
+        # Batch query uncached addresses. An address may own several domains, so allow
+        # well over one row per address. Oldest first, so the newest name wins below
+        # (same choice as resolve_address)
         query = """
         query ResolveAddresses($addresses: [String!]!) {
             domains(
                 where: { resolvedAddress_in: $addresses }
-                first: 100
+                orderBy: createdAt
+                orderDirection: asc
+                first: 1000
             ) {
                 name
                 resolvedAddress { id }
@@ -187,13 +224,15 @@ class ENSClient:
                     results[addr] = name
                     self._cache[addr] = {'name': name, 'timestamp': time.time()}
             
-            # Cache negative results
+            # Cache negative results, unless the response may have been truncated
+            truncated = len(domains) == 1000
             for addr in to_query:
                 if addr not in results:
                     results[addr] = None
-                    self._cache[addr] = {'name': None, 'timestamp': time.time()}
+                    if not truncated:
+                        self._cache[addr] = {'name': None, 'timestamp': time.time()}
             
-            self._save_cache()
+            self._cache_dirty = True
         except:
             pass
         
@@ -18,52 +18,473 @@ Configuration:
 import sys
 import json
 import argparse
+import heapq
+import importlib.util
 import os
+import re
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import requests
 from pathlib import Path
 
-try:
-    from web3 import Web3
-    HAS_WEB3 = True
-except ImportError:
-    HAS_WEB3 = False
+# web3 is slow to import: only check it is installed, import it where it is used
+HAS_WEB3 = importlib.util.find_spec('web3') is not None
 
 # Import shared modules
 from common import (
     Colors, terminal_link, format_deployment_link,
-    format_tokens, format_tokens_short, format_percentage,
-    format_timestamp, format_duration, print_section
+    format_tokens, format_tokens_short, format_tokens_int, wei_to_grt, format_percentage,
+    format_timestamp, format_duration, print_section, json_loads
 )
 from config import get_network_subgraph_url, get_ens_subgraph_url, get_rpc_url
 from contracts import HorizonStakingClient
 from ens_client import ENSClient
 from sync_status import IndexerStatusClient, format_sync_status as _format_sync_status
 from logger import setup_logging, get_logger
+from query_cache import QueryCache
 from rewards import get_rewards_batch, calculate_reward_split
 
 log = get_logger(__name__)
 
+# Short-lived results cache for repeated runs (opt-in with --cache)
+RUN_CACHE_DIR = Path.home() / '.grtinfo' / 'cache'
+SYNC_STATUS_CACHE_TTL = 30  # seconds
+INDEXER_DETAILS_CACHE_TTL = 30  # seconds, also used for the full report query
+NETWORK_STATS_CACHE_TTL = 60  # seconds
+REPORT_CUTOFF_GRANULARITY = 60  # seconds, report cutoff is rounded down so --cache can match
+ACCRUED_REWARDS_CACHE_TTL = 5  # seconds, rewards only move at block boundaries
+
+
+# Matches search terms that could be (part of) an address without the 0x prefix
+_HEX_RE = re.compile(r'[0-9a-f]*')
+
+# Padding used to turn an address prefix into an id range (addresses are 42 chars)
+ADDRESS_LENGTH = 42
+_ADDR_PAD_MIN = '0' * ADDRESS_LENGTH
+_ADDR_PAD_MAX = 'f' * ADDRESS_LENGTH
+
+
+# Subgraph ID by deployment hash: the same deployment shows up across open/close/collect
+# events and top allocations, and its subgraph never changes within a run
+_subgraph_id_cache: Dict[str, Optional[str]] = {}
+
 
 def get_subgraph_id_from_deployment(deployment: Dict) -> Optional[str]:
-    """Extract subgraph ID from deployment data"""
+    """Extract subgraph ID from deployment data (memoized by deployment hash)"""
+    ipfs_hash = deployment.get('ipfsHash')
+    if ipfs_hash in _subgraph_id_cache:
+        return _subgraph_id_cache[ipfs_hash]
+    subgraph_id = None
     versions = deployment.get('versions', [])
     if versions:
-        return versions[0].get('subgraph', {}).get('id')
-    return None
+        subgraph_id = versions[0].get('subgraph', {}).get('id')
+    if ipfs_hash:
+        _subgraph_id_cache[ipfs_hash] = subgraph_id
+    return subgraph_id
+
+
+# Network subgraph queries. Values are always passed as GraphQL variables so the
+# query text stays constant (cacheable server-side, no string interpolation).
+
+# Allocation fields shared by the activity and top allocations queries
+ALLOCATION_FRAGMENT = """
+fragment AllocationSummary on Allocation {
+    id
+    allocatedTokens
+    createdAt
+    status
+    subgraphDeployment {
+        ipfsHash
+        signalledTokens
+        versions(first: 1, orderBy: createdAt, orderDirection: desc) {
+            subgraph { id }
+        }
+    }
+}
+"""
+
+SEARCH_BY_ADDRESS_QUERY = """
+query SearchByAddress($min: String!, $max: String!) {
+    indexers(
+        where: { id_gte: $min, id_lte: $max }
+        first: 10
+        orderBy: stakedTokens
+        orderDirection: desc
+    ) {
+        id
+        url
+        stakedTokens
+        delegatedTokens
+        allocatedTokens
+        indexingRewardCut
+        queryFeeCut
+        indexingRewardEffectiveCut
+        queryFeeEffectiveCut
+        delegatorShares
+        allocationCount
+    }
+}
+"""
+
+SEARCH_BY_URL_QUERY = """
+query SearchByUrl($search: String!) {
+    indexers(
+        where: { url_contains: $search }
+        first: 10
+        orderBy: stakedTokens
+        orderDirection: desc
+    ) {
+        id
+        url
+        stakedTokens
+        delegatedTokens
+        allocatedTokens
+        indexingRewardCut
+        queryFeeCut
+        indexingRewardEffectiveCut
+        queryFeeEffectiveCut
+        delegatorShares
+        allocationCount
+    }
+}
+"""
+
+INDEXER_DETAILS_QUERY = """
+query GetIndexer($id: String!) {
+    indexer(id: $id) {
+        id
+        url
+        stakedTokens
+        delegatedTokens
+        delegatedCapacity
+        delegatedThawingTokens
+        allocatedTokens
+        availableStake
+        tokenCapacity
+        lockedTokens
+        unstakedTokens
+        indexingRewardCut
+        queryFeeCut
+        indexingRewardEffectiveCut
+        queryFeeEffectiveCut
+        delegatorShares
+        delegatorIndexingRewards
+        delegatorQueryFees
+        delegationExchangeRate
+        allocationCount
+        totalAllocationCount
+        createdAt
+    }
+}
+"""
+
+ACTIVE_ALLOCATIONS_QUERY = """
+query GetActiveAllocations($indexer: String!, $first: Int!) {
+    allocations(
+        where: { indexer: $indexer, status: Active }
+        orderBy: createdAt
+        orderDirection: desc
+        first: $first
+    ) {
+        ...AllocationSummary
+    }
+}
+""" + ALLOCATION_FRAGMENT
+
+CLOSED_ALLOCATIONS_QUERY = """
+query GetClosedAllocations($indexer: String!, $cutoff: Int!, $first: Int!) {
+    allocations(
+        where: { indexer: $indexer, status: Closed, closedAt_gte: $cutoff }
+        orderBy: closedAt
+        orderDirection: desc
+        first: $first
+    ) {
+        ...AllocationSummary
+        closedAt
+        indexingRewards
+        isLegacy
+    }
+}
+""" + ALLOCATION_FRAGMENT
+
+POI_SUBMISSIONS_QUERY = """
+query GetPoiSubmissions($indexer: String!, $cutoff: Int!, $first: Int!) {
+    poiSubmissions(
+        where: {
+            allocation_: { indexer: $indexer, status: Active }
+            presentedAtTimestamp_gte: $cutoff
+        }
+        orderBy: presentedAtTimestamp
+        orderDirection: desc
+        first: $first
+    ) {
+        id
+        presentedAtTimestamp
+        allocation {
+            ...AllocationSummary
+            indexingRewards
+        }
+    }
+}
+""" + ALLOCATION_FRAGMENT
+
+TOP_ALLOCATIONS_QUERY = """
+query GetTopAllocations($indexer: String!, $first: Int!) {
+    allocations(
+        where: { indexer: $indexer, status: Active }
+        orderBy: allocatedTokens
+        orderDirection: desc
+        first: $first
+    ) {
+        ...AllocationSummary
+    }
+}
+""" + ALLOCATION_FRAGMENT
+
+NETWORK_STATS_QUERY = """
+{
+    graphNetwork(id: "1") {
+        totalTokensAllocated
+        totalTokensSignalled
+        networkGRTIssuancePerBlock
+    }
+}
+"""
+
+ALL_ACTIVE_ALLOCATIONS_QUERY = """
+query GetAllActiveAllocations($indexer: String!, $first: Int!, $lastId: String!) {
+    allocations(
+        where: { indexer: $indexer, status: Active, id_gt: $lastId }
+        orderBy: id
+        orderDirection: asc
+        first: $first
+    ) {
+        id
+        createdAt
+        allocatedTokens
+        subgraphDeployment {
+            signalledTokens
+            stakedTokens
+        }
+    }
+}
+"""
+
+ACTIVE_ALLOCATION_IDS_QUERY = """
+query GetActiveAllocationIds($indexer: String!, $first: Int!, $lastId: String!) {
+    allocations(
+        where: { indexer: $indexer, status: Active, id_gt: $lastId }
+        orderBy: id
+        orderDirection: asc
+        first: $first
+    ) {
+        id
+    }
+}
+"""
+
+ACTIVE_ALLOCATIONS_CREATED_QUERY = """
+query GetActiveAllocationsCreated($indexer: String!, $first: Int!, $lastId: String!) {
+    allocations(
+        where: { indexer: $indexer, status: Active, id_gt: $lastId }
+        orderBy: id
+        orderDirection: asc
+        first: $first
+    ) {
+        id
+        createdAt
+        allocatedTokens
+    }
+}
+"""
+
+DELEGATIONS_QUERY = """
+query GetDelegations($indexer: String!, $cutoff: Int!, $first: Int!) {
+    delegatedStakes(
+        where: { indexer: $indexer, lastDelegatedAt_gte: $cutoff }
+        orderBy: lastDelegatedAt
+        orderDirection: desc
+        first: $first
+    ) {
+        id
+        delegator { id }
+        stakedTokens
+        createdAt
+        lastDelegatedAt
+    }
+}
+"""
+
+# lockedTokens = amount in thawing period after undelegation
+UNDELEGATIONS_QUERY = """
+query GetUndelegations($indexer: String!, $cutoff: Int!, $first: Int!) {
+    delegatedStakes(
+        where: { indexer: $indexer, lastUndelegatedAt_gte: $cutoff }
+        orderBy: lastUndelegatedAt
+        orderDirection: desc
+        first: $first
+    ) {
+        id
+        delegator { id }
+        stakedTokens
+        lockedTokens
+        lastUndelegatedAt
+    }
+}
+"""
+
+# Everything the indexer report needs, in one request (see TheGraphClient.fetch_all)
+INDEXER_REPORT_QUERY = """
+query IndexerReport(
+    $indexer: String!, $cutoff: Int!, $activity: Int!,
+    $delegations: Int!, $top: Int!, $pageSize: Int!
+) {
+    indexer(id: $indexer) {
+        id
+        url
+        stakedTokens
+        delegatedTokens
+        delegatedCapacity
+        delegatedThawingTokens
+        allocatedTokens
+        availableStake
+        tokenCapacity
+        lockedTokens
+        unstakedTokens
+        indexingRewardCut
+        queryFeeCut
+        indexingRewardEffectiveCut
+        queryFeeEffectiveCut
+        delegatorShares
+        delegatorIndexingRewards
+        delegatorQueryFees
+        delegationExchangeRate
+        allocationCount
+        totalAllocationCount
+        createdAt
+    }
+    network: graphNetwork(id: "1") {
+        totalTokensAllocated
+        totalTokensSignalled
+        networkGRTIssuancePerBlock
+    }
+    allActive: allocations(
+        where: { indexer: $indexer, status: Active }
+        orderBy: id
+        orderDirection: asc
+        first: $pageSize
+    ) {
+        id
+        createdAt
+        allocatedTokens
+        subgraphDeployment {
+            signalledTokens
+            stakedTokens
+        }
+    }
+    active: allocations(
+        where: { indexer: $indexer, status: Active, createdAt_gte: $cutoff }
+        orderBy: createdAt
+        orderDirection: desc
+        first: $activity
+    ) {
+        ...AllocationSummary
+    }
+    closed: allocations(
+        where: { indexer: $indexer, status: Closed, closedAt_gte: $cutoff }
+        orderBy: closedAt
+        orderDirection: desc
+        first: $activity
+    ) {
+        ...AllocationSummary
+        closedAt
+        indexingRewards
+        isLegacy
+    }
+    pois: poiSubmissions(
+        where: {
+            allocation_: { indexer: $indexer, status: Active }
+            presentedAtTimestamp_gte: $cutoff
+        }
+        orderBy: presentedAtTimestamp
+        orderDirection: desc
+        first: $activity
+    ) {
+        id
+        presentedAtTimestamp
+        allocation {
+            ...AllocationSummary
+            indexingRewards
+        }
+    }
+    top: allocations(
+        where: { indexer: $indexer, status: Active }
+        orderBy: allocatedTokens
+        orderDirection: desc
+        first: $top
+    ) {
+        ...AllocationSummary
+    }
+    delegated: delegatedStakes(
+        where: { indexer: $indexer, lastDelegatedAt_gte: $cutoff }
+        orderBy: lastDelegatedAt
+        orderDirection: desc
+        first: $delegations
+    ) {
+        id
+        delegator { id }
+        stakedTokens
+        createdAt
+        lastDelegatedAt
+    }
+    undelegated: delegatedStakes(
+        where: { indexer: $indexer, lastUndelegatedAt_gte: $cutoff }
+        orderBy: lastUndelegatedAt
+        orderDirection: desc
+        first: $delegations
+    ) {
+        id
+        delegator { id }
+        stakedTokens
+        lockedTokens
+        lastUndelegatedAt
+    }
+}
+""" + ALLOCATION_FRAGMENT
 
 
 class TheGraphClient:
     """Client to query The Graph Network subgraph"""
     
-    def __init__(self, network_subgraph_url: str):
+    def __init__(self, network_subgraph_url: str, session: Optional[requests.Session] = None,
+                 cache: Optional[QueryCache] = None):
         self.network_subgraph_url = network_subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
+        self._cache = cache
     
-    def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
-        """Execute a GraphQL query"""
+    def query(self, query: str, variables: Optional[Dict] = None, ttl: int = 0) -> Dict:
+        """Execute a GraphQL query
+        
+        With a cache configured, results are reused for `ttl` seconds (0 = never cached).
+        """
+        cache_key = None
+        if self._cache is not None and ttl > 0:
+            cache_key = QueryCache.make_key(self.network_subgraph_url, query, variables)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = self._query(query, variables)
+        if cache_key and result:
+            self._cache.set(cache_key, result, ttl)
+        return result
+    
+    def _query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """POST a query to the network subgraph, returning {} on any error"""
         try:
             response = self._session.post(
                 self.network_subgraph_url,
@@ -72,7 +493,7 @@ class TheGraphClient:
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             if 'errors' in data:
                 return {}
             return data.get('data', {})
@@ -86,374 +507,143 @@ class TheGraphClient:
         search_lower = search_term.lower()
         
         # If it looks like an address (starts with 0x or is hex)
-        if search_lower.startswith('0x') or all(c in '0123456789abcdef' for c in search_lower):
+        if search_lower.startswith('0x') or _HEX_RE.fullmatch(search_lower):
             # Search by address prefix using range query
             addr_search = search_lower if search_lower.startswith('0x') else f"0x{search_lower}"
-            # Pad to create a range: 0x8bbe -> 0x8bbe0000... to 0x8bbeffff...
-            addr_min = addr_search.ljust(42, '0')
-            addr_max = addr_search.ljust(42, 'f')
-            
-            query = f"""
-            {{
-                indexers(
-                    where: {{ id_gte: "{addr_min}", id_lte: "{addr_max}" }}
-                    first: 10
-                    orderBy: stakedTokens
-                    orderDirection: desc
-                ) {{
-                    id
-                    url
-                    stakedTokens
-                    delegatedTokens
-                    allocatedTokens
-                    indexingRewardCut
-                    queryFeeCut
-                    indexingRewardEffectiveCut
-                    queryFeeEffectiveCut
-                    delegatorShares
-                    allocationCount
-                }}
-            }}
-            """
-            result = self.query(query)
-            results.extend(result.get('indexers', []))
+            if len(addr_search) == ADDRESS_LENGTH:
+                # Full address: direct lookup instead of a range scan
+                indexer = self.get_indexer_details(addr_search)
+                if indexer:
+                    results.append(indexer)
+            else:
+                # Pad to create a range: 0x8bbe -> 0x8bbe0000... to 0x8bbeffff...
+                addr_min = addr_search + _ADDR_PAD_MIN[len(addr_search):]
+                addr_max = addr_search + _ADDR_PAD_MAX[len(addr_search):]
+                
+                result = self.query(SEARCH_BY_ADDRESS_QUERY, {'min': addr_min, 'max': addr_max})
+                results.extend(result.get('indexers', []))
         
         # Search by URL containing the term
         if not results:
-            query = """
-            query SearchByUrl($search: String!) {
-                indexers(
-                    where: { url_contains: $search }
-                    first: 10
-                    orderBy: stakedTokens
-                    orderDirection: desc
-                ) {
-                    id
-                    url
-                    stakedTokens
-                    delegatedTokens
-                    allocatedTokens
-                    indexingRewardCut
-                    queryFeeCut
-                    indexingRewardEffectiveCut
-                    queryFeeEffectiveCut
-                    delegatorShares
-                    allocationCount
-                }
-            }
-            """
-            result = self.query(query, {'search': search_lower})
+            result = self.query(SEARCH_BY_URL_QUERY, {'search': search_lower})
             results.extend(result.get('indexers', []))
         
         return results
     
     def get_indexer_details(self, indexer_id: str) -> Optional[Dict]:
         """Get detailed information about an indexer"""
-        query = """
-        query GetIndexer($id: String!) {
-            indexer(id: $id) {
-                id
-                url
-                stakedTokens
-                delegatedTokens
-                delegatedCapacity
-                delegatedThawingTokens
-                allocatedTokens
-                availableStake
-                tokenCapacity
-                lockedTokens
-                unstakedTokens
-                indexingRewardCut
-                queryFeeCut
-                indexingRewardEffectiveCut
-                queryFeeEffectiveCut
-                delegatorShares
-                delegatorIndexingRewards
-                delegatorQueryFees
-                delegationExchangeRate
-                allocationCount
-                totalAllocationCount
-                createdAt
-            }
-        }
-        """
-        result = self.query(query, {'id': indexer_id.lower()})
+        result = self.query(INDEXER_DETAILS_QUERY, {'id': indexer_id.lower()}, ttl=INDEXER_DETAILS_CACHE_TTL)
         return result.get('indexer')
     
-    def get_indexer_allocations(self, indexer_id: str, hours: int = 48) -> Tuple[List[Dict], List[Dict]]:
-        """Get active allocations and recent closed allocations for an indexer"""
-        cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
+    def get_indexer_allocations(self, indexer_id: str, hours: int = 48, limit: int = 100,
+                                cutoff_time: Optional[int] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Get active allocations and recent closed allocations for an indexer
         
-        # Active allocations
-        active_query = """
-        query GetActiveAllocations($indexer: String!) {
-            allocations(
-                where: { indexer: $indexer, status: Active }
-                orderBy: createdAt
-                orderDirection: desc
-                first: 100
-            ) {
-                id
-                allocatedTokens
-                createdAt
-                status
-                subgraphDeployment {
-                    ipfsHash
-                    signalledTokens
-                    versions(first: 1, orderBy: createdAt, orderDirection: desc) {
-                        subgraph { id }
-                    }
-                }
-            }
-        }
+        Both lists are returned newest first (by createdAt / closedAt) and capped at `limit`.
+        Closed allocations go back `hours`, or to `cutoff_time` (unix seconds) when given.
         """
-        active_result = self.query(active_query, {'indexer': indexer_id.lower()})
+        if cutoff_time is None:
+            cutoff_time = int(time.time()) - hours * 3600
+        indexer = indexer_id.lower()
+        
+        active_result = self.query(ACTIVE_ALLOCATIONS_QUERY, {'indexer': indexer, 'first': limit})
         active = active_result.get('allocations', [])
         
         # Recent closed allocations (include isLegacy field)
-        closed_query = f"""
-        {{
-            allocations(
-                where: {{ indexer: "{indexer_id.lower()}", status: Closed, closedAt_gte: {cutoff_time} }}
-                orderBy: closedAt
-                orderDirection: desc
-                first: 100
-            ) {{
-                id
-                allocatedTokens
-                createdAt
-                closedAt
-                status
-                indexingRewards
-                isLegacy
-                subgraphDeployment {{
-                    ipfsHash
-                    signalledTokens
-                    versions(first: 1, orderBy: createdAt, orderDirection: desc) {{
-                        subgraph {{ id }}
-                    }}
-                }}
-            }}
-        }}
-        """
-        closed_result = self.query(closed_query)
+        closed_result = self.query(CLOSED_ALLOCATIONS_QUERY, {'indexer': indexer, 'cutoff': cutoff_time, 'first': limit})
         closed = closed_result.get('allocations', [])
         
         return active, closed
     
-    def get_indexer_poi_submissions(self, indexer_id: str, hours: int = 48) -> List[Dict]:
-        """Get POI submissions (reward collections) for an indexer"""
-        cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
+    def get_indexer_poi_submissions(self, indexer_id: str, hours: int = 48, limit: int = 100,
+                                    cutoff_time: Optional[int] = None) -> List[Dict]:
+        """Get POI submissions (reward collections) for an indexer, newest first"""
+        if cutoff_time is None:
+            cutoff_time = int(time.time()) - hours * 3600
         
-        query = f"""
-        {{
-            poiSubmissions(
-                where: {{ 
-                    allocation_: {{ indexer: "{indexer_id.lower()}", status: Active }}
-                    presentedAtTimestamp_gte: {cutoff_time}
-                }}
-                orderBy: presentedAtTimestamp
-                orderDirection: desc
-                first: 100
-            ) {{
-                id
-                presentedAtTimestamp
-                allocation {{
-                    id
-                    status
-                    allocatedTokens
-                    indexingRewards
-                    subgraphDeployment {{
-                        ipfsHash
-                        versions(first: 1, orderBy: createdAt, orderDirection: desc) {{
-                            subgraph {{ id }}
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-        result = self.query(query)
+        result = self.query(POI_SUBMISSIONS_QUERY, {'indexer': indexer_id.lower(), 'cutoff': cutoff_time, 'first': limit})
         return result.get('poiSubmissions', [])
     
     def get_top_allocations(self, indexer_id: str, limit: int = 10) -> List[Dict]:
         """Get top allocations by size for an indexer"""
-        query = f"""
-        {{
-            allocations(
-                where: {{ indexer: "{indexer_id.lower()}", status: Active }}
-                orderBy: allocatedTokens
-                orderDirection: desc
-                first: {limit}
-            ) {{
-                id
-                allocatedTokens
-                createdAt
-                status
-                subgraphDeployment {{
-                    ipfsHash
-                    signalledTokens
-                    versions(first: 1, orderBy: createdAt, orderDirection: desc) {{
-                        subgraph {{ id }}
-                    }}
-                }}
-            }}
-        }}
-        """
-        result = self.query(query)
+        result = self.query(TOP_ALLOCATIONS_QUERY, {'indexer': indexer_id.lower(), 'first': limit})
         return result.get('allocations', [])
     
     def get_network_stats(self) -> Dict:
         """Get network-wide statistics for APR calculation"""
-        query = """
-        {
-            graphNetwork(id: "1") {
-                totalTokensAllocated
-                totalTokensSignalled
-                networkGRTIssuancePerBlock
-            }
-        }
-        """
-        result = self.query(query)
+        result = self.query(NETWORK_STATS_QUERY, ttl=NETWORK_STATS_CACHE_TTL)
         return result.get('graphNetwork', {})
     
-    def get_all_active_allocations(self, indexer_id: str) -> List[Dict]:
-        """Get all active allocations with signal data for APR calculation"""
+    def _get_all_active(self, query: str, indexer_id: str, after: str = '') -> List[Dict]:
+        """Page through all active allocations of an indexer with the given query
+        
+        Pages are keyed on the last allocation ID seen (id_gt) rather than skip,
+        which the subgraph caps and has to scan past on every page.
+        """
         all_allocations = []
-        skip = 0
+        last_id = after
         batch_size = 1000
 
         while True:
-            query = f"""
-            {{
-                allocations(
-                    where: {{ indexer: "{indexer_id.lower()}", status: Active }}
-                    first: {batch_size}
-                    skip: {skip}
-                ) {{
-                    allocatedTokens
-                    subgraphDeployment {{
-                        signalledTokens
-                        stakedTokens
-                    }}
-                }}
-            }}
-            """
-            result = self.query(query)
+            result = self.query(query, {'indexer': indexer_id.lower(), 'first': batch_size, 'lastId': last_id})
             batch = result.get('allocations', [])
             if not batch:
                 break
             all_allocations.extend(batch)
             if len(batch) < batch_size:
                 break
-            skip += batch_size
+            last_id = batch[-1]['id']
 
         return all_allocations
     
+    def get_all_active_allocations(self, indexer_id: str, after: str = '') -> List[Dict]:
+        """Get all active allocations with signal data for APR calculation (and creation time for rewards)
+        
+        Allocations come in ID order; pass `after` to continue past an allocation ID already fetched.
+        """
+        return self._get_all_active(ALL_ACTIVE_ALLOCATIONS_QUERY, indexer_id, after)
+    
     def get_all_active_allocation_ids(self, indexer_id: str) -> List[str]:
         """Get all active allocation IDs for an indexer"""
-        all_ids = []
-        skip = 0
-        batch_size = 1000
-
-        while True:
-            query = f"""
-            {{
-                allocations(
-                    where: {{ indexer: "{indexer_id.lower()}", status: Active }}
-                    first: {batch_size}
-                    skip: {skip}
-                ) {{
-                    id
-                }}
-            }}
-            """
-            result = self.query(query)
-            batch = result.get('allocations', [])
-            if not batch:
-                break
-            all_ids.extend([a['id'] for a in batch if a.get('id')])
-            if len(batch) < batch_size:
-                break
-            skip += batch_size
-
-        return all_ids
+        return [a['id'] for a in self._get_all_active(ACTIVE_ALLOCATION_IDS_QUERY, indexer_id) if a.get('id')]
     
     def get_all_active_allocations_with_created(self, indexer_id: str) -> List[Dict]:
         """Get all active allocations with their IDs and creation timestamps"""
-        all_allocations = []
-        skip = 0
-        batch_size = 1000
-
-        while True:
-            query = f"""
-            {{
-                allocations(
-                    where: {{ indexer: "{indexer_id.lower()}", status: Active }}
-                    first: {batch_size}
-                    skip: {skip}
-                ) {{
-                    id
-                    createdAt
-                    allocatedTokens
-                }}
-            }}
-            """
-            result = self.query(query)
-            batch = result.get('allocations', [])
-            if not batch:
-                break
-            all_allocations.extend(batch)
-            if len(batch) < batch_size:
-                break
-            skip += batch_size
-
-        return all_allocations
+        return self._get_all_active(ACTIVE_ALLOCATIONS_CREATED_QUERY, indexer_id)
     
-    def get_delegation_events(self, indexer_id: str, hours: int = 48) -> Tuple[List[Dict], List[Dict]]:
-        """Get recent delegation/undelegation events for an indexer"""
-        cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
+    def get_delegation_events(self, indexer_id: str, hours: int = 48, limit: int = 100,
+                              cutoff_time: Optional[int] = None) -> Tuple[List[Dict], List[Dict]]:
+        """Get recent delegation/undelegation events for an indexer, newest first"""
+        if cutoff_time is None:
+            cutoff_time = int(time.time()) - hours * 3600
+        variables = {'indexer': indexer_id.lower(), 'cutoff': cutoff_time, 'first': limit}
         
-        # Get recent delegations (based on lastDelegatedAt)
-        delegation_query = f"""
-        {{
-            delegatedStakes(
-                where: {{ indexer: "{indexer_id.lower()}", lastDelegatedAt_gte: {cutoff_time} }}
-                orderBy: lastDelegatedAt
-                orderDirection: desc
-                first: 100
-            ) {{
-                id
-                delegator {{ id }}
-                stakedTokens
-                createdAt
-                lastDelegatedAt
-            }}
-        }}
-        """
-        delegations = self.query(delegation_query).get('delegatedStakes', [])
-        
-        # Get recent undelegations (based on lastUndelegatedAt)
-        # lockedTokens = amount in thawing period after undelegation
-        undelegation_query = f"""
-        {{
-            delegatedStakes(
-                where: {{ indexer: "{indexer_id.lower()}", lastUndelegatedAt_gte: {cutoff_time} }}
-                orderBy: lastUndelegatedAt
-                orderDirection: desc
-                first: 100
-            ) {{
-                id
-                delegator {{ id }}
-                stakedTokens
-                lockedTokens
-                lastUndelegatedAt
-            }}
-        }}
-        """
-        undelegations = self.query(undelegation_query).get('delegatedStakes', [])
+        # Recent delegations (based on lastDelegatedAt)
+        delegations = self.query(DELEGATIONS_QUERY, variables).get('delegatedStakes', [])
+        # Recent undelegations (based on lastUndelegatedAt)
+        undelegations = self.query(UNDELEGATIONS_QUERY, variables).get('delegatedStakes', [])
         
         return delegations, undelegations
+    
+    def fetch_all(self, indexer_id: str, cutoff_time: int, activity_limit: int = 50,
+                  delegation_limit: int = 30, top_limit: int = 10, page_size: int = 1000) -> Dict:
+        """Fetch everything the indexer report needs in a single request
+        
+        Returns a dict keyed by alias: indexer, network, allActive (first page of active
+        allocations for APR/rewards), active, closed, pois, top, delegated, undelegated.
+        Activity lists are newest first, like the per-query methods above.
+        The cutoff is rounded down to REPORT_CUTOFF_GRANULARITY so that runs a few
+        seconds apart share a cache key.
+        """
+        cutoff_time -= cutoff_time % REPORT_CUTOFF_GRANULARITY
+        return self.query(INDEXER_REPORT_QUERY, {
+            'indexer': indexer_id.lower(),
+            'cutoff': cutoff_time,
+            'activity': activity_limit,
+            'delegations': delegation_limit,
+            'top': top_limit,
+            'pageSize': page_size,
+        }, ttl=INDEXER_DETAILS_CACHE_TTL)
 
 
 class LegacyRewardsClient:
@@ -468,6 +658,7 @@ class LegacyRewardsClient:
     def __init__(self, rpc_url: str):
         if not HAS_WEB3:
             raise ImportError("web3 library is required for legacy rewards fetching")
+        from web3 import Web3
         self.w3 = Web3(Web3.HTTPProvider(rpc_url))
     
     def get_rewards_for_allocation(self, allocation_id: str, from_block: int, to_block: int) -> int:
@@ -551,6 +742,187 @@ def format_sync_status(status: Optional[Dict]) -> str:
     return _format_sync_status(status, Colors)
 
 
+def get_contract_capacity(rpc_url: str, indexer_id: str,
+                          session: Optional[requests.Session] = None) -> Optional[int]:
+    """Get the indexer's token capacity (wei) from the staking contract, or None"""
+    return HorizonStakingClient(rpc_url, session=session).get_tokens_available(indexer_id)
+
+
+def get_legacy_rewards(rpc_url: str, legacy_allocs: List[Dict], indexer_id: str) -> Dict[str, int]:
+    """Get rewards of closed legacy allocations from on-chain events, {} on error"""
+    try:
+        return LegacyRewardsClient(rpc_url).get_rewards_for_allocations(legacy_allocs, indexer_id)
+    except Exception:
+        return {}
+
+
+def get_sync_statuses(indexer_url: str, deployments: set, indexer_id: str,
+                      session: Optional[requests.Session] = None,
+                      cache: Optional[QueryCache] = None) -> Tuple[Dict, Optional[str]]:
+    """Get sync statuses of deployments from the indexer's status endpoint
+    
+    With a cache, statuses are reused for SYNC_STATUS_CACHE_TTL seconds.
+    
+    Returns:
+        Tuple of (statuses by deployment hash, error message or None)
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = QueryCache.make_key(indexer_url, 'indexingStatuses', {
+            'indexer': indexer_id.lower(),
+            'deployments': sorted(h for h in deployments if h),
+        })
+        cached = cache.get(cache_key)
+        if cached:
+            return cached, None
+    status_client = IndexerStatusClient(timeout=15, session=session)
+    sync_statuses = status_client.get_deployments_status(indexer_url, deployments)
+    if not sync_statuses and status_client.last_error:
+        return sync_statuses, status_client.last_error
+    if cache_key:
+        cache.set(cache_key, sync_statuses, SYNC_STATUS_CACHE_TTL)
+    return sync_statuses, None
+
+
+# Activity timeline symbols
+_SYMBOL_ALLOCATE = f"{Colors.BRIGHT_GREEN}+{Colors.RESET}"
+_SYMBOL_UNALLOCATE = f"{Colors.BRIGHT_RED}-{Colors.RESET}"
+_SYMBOL_COLLECT = f"{Colors.BRIGHT_CYAN}${Colors.RESET}"
+_SYMBOL_DELEGATE = f"{Colors.BRIGHT_MAGENTA}↑{Colors.RESET}"
+_SYMBOL_UNDELEGATE = f"{Colors.YELLOW}↓{Colors.RESET}"
+_LEGACY_MARKER = f" {Colors.DIM}(legacy){Colors.RESET}"
+
+
+class ActivityEvent(NamedTuple):
+    """One row of the activity timeline (tokens as a wei string, rewards in wei)"""
+    type: str
+    timestamp: int
+    tokens: str
+    subgraph: str = '?'
+    subgraph_id: Optional[str] = None
+    rewards: int = 0
+    is_legacy: bool = False
+    delegator: str = '?'
+    is_new: bool = False
+    remaining: int = 0
+
+
+def _deployment_target(event: ActivityEvent) -> str:
+    """Format the deployment of an allocation event as an explorer link"""
+    subgraph = event.subgraph
+    return format_deployment_link(subgraph, event.subgraph_id) if subgraph != '?' else subgraph
+
+
+def _fmt_allocate(event: ActivityEvent, tokens: str) -> Tuple[str, str, str]:
+    return _SYMBOL_ALLOCATE, _deployment_target(event), f"{tokens} GRT"
+
+
+def _fmt_unallocate(event: ActivityEvent, tokens: str) -> Tuple[str, str, str]:
+    rewards = event.rewards
+    legacy_marker = _LEGACY_MARKER if event.is_legacy else ""
+    rewards_str = f" → {format_tokens_int(rewards)} GRT{legacy_marker}" if rewards > 0 else ""
+    return _SYMBOL_UNALLOCATE, _deployment_target(event), f"{tokens} GRT{rewards_str}"
+
+
+def _fmt_collect(event: ActivityEvent, tokens: str) -> Tuple[str, str, str]:
+    rewards = format_tokens_int(event.rewards)
+    return _SYMBOL_COLLECT, _deployment_target(event), f"{rewards} GRT collected"
+
+
+def _fmt_delegate(event: ActivityEvent, tokens: str) -> Tuple[str, str, str]:
+    if event.is_new:
+        details = f"{Colors.BRIGHT_MAGENTA}+{tokens} GRT delegated{Colors.RESET}"
+    else:
+        details = f"{Colors.BRIGHT_MAGENTA}now {tokens} GRT (increased){Colors.RESET}"
+    return _SYMBOL_DELEGATE, event.delegator, details
+
+
+def _fmt_undelegate(event: ActivityEvent, tokens: str) -> Tuple[str, str, str]:
+    remaining = event.remaining
+    remaining_str = format_tokens_int(remaining) if remaining >= 10**18 else "0"
+    details = f"{Colors.YELLOW}{tokens} GRT thawing, {remaining_str} remaining{Colors.RESET}"
+    return _SYMBOL_UNDELEGATE, event.delegator, details
+
+
+# Event type -> formatter returning (symbol, target, details)
+_ALLOCATION_EVENT_FORMATTERS = {
+    'allocate': _fmt_allocate,
+    'unallocate': _fmt_unallocate,
+    'collect': _fmt_collect,
+}
+_DELEGATION_EVENT_FORMATTERS = {
+    'delegate': _fmt_delegate,
+    'undelegate': _fmt_undelegate,
+}
+
+
+# Rewards histogram buckets by epochs until expiration: (label, color, prefix)
+# Negative epochs means the allocation is past max age (should have been closed).
+# Prefixes are 3 visual cells: emoji (2 cells) + space, or 3 spaces.
+_REWARD_BUCKETS = [
+    ("exp!", Colors.BRIGHT_RED, "⚠️ "),       # expired - CRITICAL
+    ("0d", Colors.BRIGHT_RED, "⚠️ "),         # expiring today - CRITICAL
+    ("1-3d", Colors.BRIGHT_YELLOW, "⏰ "),    # soon
+    ("4-7d", Colors.BRIGHT_GREEN, "   "),     # safe
+    ("8-14d", Colors.BRIGHT_GREEN, "   "),
+    ("15-21d", Colors.BRIGHT_GREEN, "   "),
+    ("22-28d", Colors.BRIGHT_GREEN, "   "),
+]
+
+
+def _reward_bucket_index(epochs_remaining: int) -> Optional[int]:
+    """Map epochs until expiration to its index in _REWARD_BUCKETS
+    
+    Buckets: expired (<0), 0, 1-3, 4-7, 8-14, 15-21, 22-28. Returns None when out of range.
+    """
+    if epochs_remaining < 0:
+        return 0
+    if epochs_remaining == 0:
+        return 1
+    if epochs_remaining <= 3:
+        return 2
+    if epochs_remaining <= 7:
+        return 3
+    if epochs_remaining <= 14:
+        return 4
+    if epochs_remaining <= 21:
+        return 5
+    if epochs_remaining <= 28:
+        return 6
+    return None
+
+
+def estimate_annual_rewards(allocations: List[Dict], annual_issuance: float,
+                            total_signal_network: float) -> float:
+    """Estimate the yearly indexing rewards (GRT) of a set of active allocations
+    
+    Formula: reward = annual_issuance × (signal_subgraph / total_signal_network) × (allocation / staked_on_subgraph)
+    annual_issuance / total_signal_network is the same for every allocation, so only
+    signal × allocation / staked is summed per row (in wei, the units cancel out).
+    Wei strings are parsed straight to float: an estimate only needs ~15 digits.
+    """
+    if total_signal_network <= 0:
+        return 0
+    weighted_signal = 0.0
+    for a in allocations:
+        deployment = a.get('subgraphDeployment', {})
+        staked = float(deployment.get('stakedTokens', '0'))
+        if staked > 0:
+            weighted_signal += float(deployment.get('signalledTokens', '0')) * float(a.get('allocatedTokens', '0')) / staked
+    return annual_issuance * (weighted_signal / 1e18) / total_signal_network
+
+
+_by_timestamp = attrgetter('timestamp')
+
+
+def merge_recent_events(limit: int, *event_lists: List[ActivityEvent]) -> List[ActivityEvent]:
+    """Merge newest-first event lists into the `limit` most recent events
+    
+    Each list must already be sorted newest first; ties keep the order of the lists.
+    """
+    return list(islice(heapq.merge(*event_lists, key=_by_timestamp, reverse=True), limit))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Display indexer information from The Graph Network',
@@ -569,6 +941,11 @@ Examples:
         action='store_true',
         help='Calculate total accrued rewards from all allocations (requires RPC)'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse subgraph queries (30-60s), sync status (30s) and accrued rewards (5s) from a recent run'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='count',
@@ -578,6 +955,10 @@ Examples:
     
     args = parser.parse_args()
     
+    # Block-buffer the report; it is flushed before each RPC/status wait below
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Setup logging based on verbosity
     setup_logging(verbosity=args.verbose)
     
@@ -588,26 +969,35 @@ Examples:
     
     ens_url = get_ens_subgraph_url()
     
-    client = TheGraphClient(network_url)
-    ens_client = ENSClient(ens_url) if ens_url else None
+    # RPC is optional: used for contract capacity, accrued rewards and legacy rewards
+    rpc_url = get_rpc_url()
+    rpc_enabled = bool(rpc_url) and HAS_WEB3
+    
+    # One keep-alive session for every HTTP endpoint (network/ENS subgraphs, status endpoint)
+    session = requests.Session()
+    query_cache = QueryCache(RUN_CACHE_DIR / 'queries.sqlite') if args.cache else None
+    client = TheGraphClient(network_url, session=session, cache=query_cache)
+    ens_client = ENSClient(ens_url, session=session) if ens_url else None
     
     # Search for indexers
     indexers = []
     
-    # First try ENS search if it doesn't look like an address
+    # First try ENS search if it doesn't look like an address; the resolved
+    # addresses are checked concurrently
     search_term = args.search_term
-    if ens_client and not search_term.startswith('0x') and not all(c in '0123456789abcdef' for c in search_term.lower()):
-        ens_results = ens_client.search_by_ens(search_term)
-        for domain in ens_results:
-            resolved = domain.get('resolvedAddress', {})
-            if resolved:
-                addr = resolved.get('id')
-                if addr:
-                    # Check if this address is an indexer
-                    indexer = client.get_indexer_details(addr)
-                    if indexer:
-                        indexer['ens_name'] = domain.get('name')
-                        indexers.append(indexer)
+    if ens_client and not search_term.startswith('0x') and not _HEX_RE.fullmatch(search_term.lower()):
+        ens_matches = []
+        for domain in ens_client.search_by_ens(search_term):
+            resolved = domain.get('resolvedAddress') or {}
+            if resolved.get('id'):
+                ens_matches.append((domain.get('name'), resolved['id']))
+        if ens_matches:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                details = list(executor.map(client.get_indexer_details, [addr for _, addr in ens_matches]))
+            for (name, _), indexer in zip(ens_matches, details):
+                if indexer:
+                    indexer['ens_name'] = name
+                    indexers.append(indexer)
     
     # Then try direct search
     if not indexers:
@@ -619,9 +1009,12 @@ Examples:
     
     if len(indexers) > 1:
         print(f"{Colors.YELLOW}Multiple indexers found:{Colors.RESET}")
+        # Resolve the names of all listed indexers in one ENS query
+        unnamed = [idx.get('id', '') for idx in indexers[:10] if not idx.get('ens_name')]
+        ens_names = ens_client.resolve_addresses_batch(unnamed) if ens_client and unnamed else {}
         for i, idx in enumerate(indexers[:10]):
             addr = idx.get('id', '')
-            ens = idx.get('ens_name') or (ens_client.resolve_address(addr) if ens_client else None)
+            ens = idx.get('ens_name') or ens_names.get(addr.lower())
             url = idx.get('url', '')[:40]
             stake = format_tokens_short(idx.get('stakedTokens', '0'))
             name_display = f"{ens} " if ens else ""
@@ -639,13 +1032,58 @@ Examples:
     else:
         indexer = indexers[0]
     
-    # Get full details if we only have partial info
     indexer_id = indexer.get('id')
-    if not indexer.get('createdAt'):
-        indexer = client.get_indexer_details(indexer_id) or indexer
+    cutoff_ts = int(time.time()) - args.hours * 3600
+    
+    # Everything below comes from a single network subgraph request
+    report = client.fetch_all(indexer_id, cutoff_ts, activity_limit=50, delegation_limit=30, top_limit=10)
+    # Full details replace the partial search result (keeping the ENS name if any)
+    if report.get('indexer'):
+        indexer = {**indexer, **report['indexer']}
+    
+    # Get allocation history
+    # Only the most recent events are displayed: the report holds a little more than that
+    # (some rows are filtered out below), already ordered by the subgraph
+    active_allocs = report.get('active') or []
+    closed_allocs = report.get('closed') or []
+    poi_submissions = report.get('pois') or []
+    recent_delegations = report.get('delegated') or []
+    recent_undelegations = report.get('undelegated') or []
+    top_allocs = report.get('top') or []
+    
+    # Parse closed allocation rewards once (used by the legacy filter and the timeline)
+    for alloc in closed_allocs:
+        alloc['_indexingRewardsInt'] = int(alloc.get('indexingRewards', '0') or 0)
+    
+    # The remaining lookups (ENS, contract, legacy reward events, status endpoint) only
+    # depend on the report: start them all now so their latencies overlap
+    pool = ThreadPoolExecutor(max_workers=4)
+    ens_future = None
+    if not indexer.get('ens_name') and ens_client:
+        ens_future = pool.submit(ens_client.resolve_address, indexer_id)
+    capacity_future = None
+    if rpc_url:
+        capacity_future = pool.submit(get_contract_capacity, rpc_url, indexer_id, session)
+    legacy_future = None
+    if rpc_enabled:
+        legacy_allocs = [a for a in closed_allocs if a.get('isLegacy') and a['_indexingRewardsInt'] == 0]
+        if legacy_allocs:
+            legacy_future = pool.submit(get_legacy_rewards, rpc_url, legacy_allocs, indexer_id)
+    status_future = None
+    if top_allocs and indexer.get('url'):
+        # Only ask for the deployments we are about to display
+        needed = {a.get('subgraphDeployment', {}).get('ipfsHash') for a in top_allocs}
+        status_future = pool.submit(get_sync_statuses, indexer['url'], needed, indexer_id,
+                                    session, query_cache)
+    pool.shutdown(wait=False)
+    
+    # First page of active allocations is in the report, fetch the rest only if needed
+    all_allocations = report.get('allActive') or []
+    if len(all_allocations) >= 1000:
+        all_allocations += client.get_all_active_allocations(indexer_id, after=all_allocations[-1]['id'])
     
     # Resolve ENS name
-    ens_name = indexer.get('ens_name') or (ens_client.resolve_address(indexer_id) if ens_client else None)
+    ens_name = indexer.get('ens_name') or (ens_future.result() if ens_future else None)
     
     # Display header
     if ens_name:
@@ -669,10 +1107,9 @@ Examples:
     # Workaround: fetch accurate tokenCapacity from contract
     # The subgraph's tokenCapacity can be stale due to delegationExchangeRate not being updated
     # See: https://github.com/graphprotocol/graph-network-subgraph/issues/323
-    rpc_url = get_rpc_url()
-    if rpc_url:
-        staking_client = HorizonStakingClient(rpc_url)
-        contract_capacity = staking_client.get_tokens_available(indexer_id)
+    if capacity_future:
+        sys.stdout.flush()
+        contract_capacity = capacity_future.result()
         if contract_capacity is not None and contract_capacity != token_capacity:
             log.debug(f"Using contract tokenCapacity ({contract_capacity}) instead of subgraph ({token_capacity})")
             token_capacity = contract_capacity
@@ -694,23 +1131,23 @@ Examples:
     delegation_remaining = max(0, max_delegation - delegated)
     delegation_used_pct = (delegated / max_delegation * 100) if max_delegation > 0 else 0
     
-    print(f"  Self stake:      {Colors.BRIGHT_GREEN}{format_tokens(str(self_stake))}{Colors.RESET}")
-    delegated_str = f"{Colors.BRIGHT_CYAN}{format_tokens(str(delegated))}{Colors.RESET} / {format_tokens(str(max_delegation))} ({delegation_used_pct:.0f}%)"
+    print(f"  Self stake:      {Colors.BRIGHT_GREEN}{format_tokens(self_stake)}{Colors.RESET}")
+    delegated_str = f"{Colors.BRIGHT_CYAN}{format_tokens(delegated)}{Colors.RESET} / {format_tokens(max_delegation)} ({delegation_used_pct:.0f}%)"
     if delegations_thawing > 0:
-        delegated_str += f" {Colors.DIM}({format_tokens(str(delegations_thawing))} thawing){Colors.RESET}"
+        delegated_str += f" {Colors.DIM}({format_tokens(delegations_thawing)} thawing){Colors.RESET}"
     print(f"  Delegated:       {delegated_str}")
     if delegation_remaining > 0:
-        print(f"  Delegation room: {Colors.BRIGHT_GREEN}{format_tokens(str(delegation_remaining))}{Colors.RESET}")
+        print(f"  Delegation room: {Colors.BRIGHT_GREEN}{format_tokens(delegation_remaining)}{Colors.RESET}")
     else:
         print(f"  Delegation room: {Colors.BRIGHT_RED}FULL{Colors.RESET}")
-    print(f"  {Colors.BOLD}Total:           {format_tokens(str(total_stake))}{Colors.RESET}")
-    print(f"  Allocated:       {format_tokens(str(allocated))}")
+    print(f"  {Colors.BOLD}Total:           {format_tokens(total_stake)}{Colors.RESET}")
+    print(f"  Allocated:       {format_tokens(allocated)}")
     if remaining < 0:
         # Over-allocated - show warning
-        print(f"  Remaining:       {Colors.BRIGHT_RED}{format_tokens(str(remaining))} ({remaining_pct:.1f}%) ⚠ OVER-ALLOCATED{Colors.RESET}")
+        print(f"  Remaining:       {Colors.BRIGHT_RED}{format_tokens(remaining)} ({remaining_pct:.1f}%) ⚠ OVER-ALLOCATED{Colors.RESET}")
     else:
         remaining_color = Colors.BRIGHT_GREEN if remaining_pct < 10 else (Colors.BRIGHT_YELLOW if remaining_pct > 30 else Colors.DIM)
-        print(f"  Remaining:       {remaining_color}{format_tokens(str(remaining))} ({remaining_pct:.1f}%){Colors.RESET}")
+        print(f"  Remaining:       {remaining_color}{format_tokens(remaining)} ({remaining_pct:.1f}%){Colors.RESET}")
     
     # Reward cuts
     # Raw cut applies to total rewards, but effective cut on delegators is different
@@ -738,42 +1175,23 @@ Examples:
     
     # Estimated APR calculation (based on current allocations)
     print_section("Instant APR (current allocations)")
-    network_stats = client.get_network_stats()
-    all_allocations = client.get_all_active_allocations(indexer_id)
+    network_stats = report.get('network') or {}
     
     if network_stats and all_allocations:
         # Network data
-        issuance_per_block = int(network_stats.get('networkGRTIssuancePerBlock', '0')) / 1e18
-        total_signal_network = int(network_stats.get('totalTokensSignalled', '0')) / 1e18
+        issuance_per_block = wei_to_grt(network_stats.get('networkGRTIssuancePerBlock', '0'))
+        total_signal_network = wei_to_grt(network_stats.get('totalTokensSignalled', '0'))
         
         # Ethereum blocks per year (~12s per block)
         eth_blocks_per_year = 2_628_000
         annual_issuance = issuance_per_block * eth_blocks_per_year
         
         # Calculate expected rewards by summing each allocation's contribution
-        # Formula: reward = annual_issuance × (signal_subgraph / total_signal_network) × (allocation / staked_on_subgraph)
-        total_alloc = 0
-        total_expected_rewards = 0
-        
-        for a in all_allocations:
-            alloc = int(a.get('allocatedTokens', '0')) / 1e18
-            signal = int(a.get('subgraphDeployment', {}).get('signalledTokens', '0')) / 1e18
-            staked = int(a.get('subgraphDeployment', {}).get('stakedTokens', '0')) / 1e18
-            
-            total_alloc += alloc
-            
-            if staked > 0 and total_signal_network > 0:
-                # Subgraph's share of total rewards
-                subgraph_share = signal / total_signal_network
-                # Indexer's share of this subgraph's rewards
-                indexer_share_of_subgraph = alloc / staked
-                # Expected reward for this allocation
-                alloc_reward = annual_issuance * subgraph_share * indexer_share_of_subgraph
-                total_expected_rewards += alloc_reward
+        total_expected_rewards = estimate_annual_rewards(all_allocations, annual_issuance, total_signal_network)
         
         # Convert stake values from wei to GRT for APR calculation
-        self_stake_grt = self_stake / 1e18
-        delegated_grt = delegated / 1e18
+        self_stake_grt = wei_to_grt(self_stake)
+        delegated_grt = wei_to_grt(delegated)
         
         # Calculate APRs
         if total_expected_rewards > 0:
@@ -795,7 +1213,6 @@ Examples:
     
     # Accrued rewards (on-chain) - only if --rewards flag is set
     if args.rewards:
-        rpc_url = get_rpc_url()
         if not rpc_url:
             print_section("Accrued Rewards")
             print(f"  {Colors.DIM}RPC URL not configured. Set RPC_URL or add rpc_url to config.{Colors.RESET}")
@@ -804,14 +1221,26 @@ Examples:
             print(f"  {Colors.DIM}web3 library not installed. Run: pip install web3{Colors.RESET}")
         else:
             # Get allocations with creation timestamps
-            allocations_with_created = client.get_all_active_allocations_with_created(indexer_id)
+            allocations_with_created = all_allocations
             if allocations_with_created:
                 allocation_ids = [a['id'] for a in allocations_with_created if a.get('id')]
                 
                 print_section(f"Accrued Rewards ({len(allocation_ids)} allocations)")
                 print(f"  {Colors.DIM}Fetching rewards from smart contract...{Colors.RESET}", end='', flush=True)
                 
-                rewards_map = get_rewards_batch(allocation_ids, rpc_url, max_workers=5)
+                # Key by lowercase allocation ID so lookups below need a single probe
+                rewards_key = None
+                rewards_map = None
+                if query_cache is not None:
+                    rewards_key = QueryCache.make_key(rpc_url, 'accruedRewards', {'allocations': sorted(allocation_ids)})
+                    rewards_map = query_cache.get(rewards_key)
+                if rewards_map is None:
+                    rewards_map = {
+                        alloc_id.lower(): reward
+                        for alloc_id, reward in get_rewards_batch(allocation_ids, rpc_url, max_workers=5).items()
+                    }
+                    if rewards_key:
+                        query_cache.set(rewards_key, rewards_map, ACCRUED_REWARDS_CACHE_TTL)
                 
                 # Calculate totals
                 total_rewards = sum(r for r in rewards_map.values() if r is not None and r > 0)
@@ -831,70 +1260,59 @@ Examples:
                     
                     # Build histogram by epochs until expiration
                     from contracts import EPOCH_DURATION_SECONDS, MAX_ALLOCATION_EPOCHS
-                    now = datetime.now().timestamp()
+                    now = time.time()
                     
                     # Group rewards by epochs remaining until expiration
-                    epoch_buckets = {}  # epoch_remaining -> (total_rewards, count)
+                    epoch_buckets = defaultdict(lambda: [0.0, 0])  # epoch_remaining -> [total_rewards, count]
                     
                     for alloc in allocations_with_created:
                         alloc_id = alloc.get('id', '').lower()
+                        reward = rewards_map.get(alloc_id, 0) or 0
                         created_at = int(alloc.get('createdAt', 0))
-                        reward = rewards_map.get(alloc_id) or rewards_map.get(alloc_id.lower()) or 0
+                        if created_at <= 0 or reward <= 0:
+                            continue
                         
-                        if created_at > 0 and reward and reward > 0:
-                            # Calculate age in epochs (days)
-                            age_seconds = now - created_at
-                            age_epochs = int(age_seconds / EPOCH_DURATION_SECONDS)
-                            # Can be negative if allocation is past max age
-                            epochs_remaining = MAX_ALLOCATION_EPOCHS - age_epochs
-                            
-                            if epochs_remaining not in epoch_buckets:
-                                epoch_buckets[epochs_remaining] = {'rewards': 0, 'count': 0}
-                            epoch_buckets[epochs_remaining]['rewards'] += reward
-                            epoch_buckets[epochs_remaining]['count'] += 1
+                        # Calculate age in epochs (days)
+                        age_seconds = now - created_at
+                        age_epochs = int(age_seconds / EPOCH_DURATION_SECONDS)
+                        # Can be negative if allocation is past max age
+                        epochs_remaining = MAX_ALLOCATION_EPOCHS - age_epochs
+                        
+                        bucket = epoch_buckets[epochs_remaining]
+                        bucket[0] += reward
+                        bucket[1] += 1
                     
                     # Display histogram
                     if epoch_buckets:
                         print(f"\n  {Colors.BOLD}Rewards by epochs until expiration:{Colors.RESET}")
                         print(f"  {Colors.DIM}(allocations expire after 28 epochs ≈ 28 days){Colors.RESET}")
                         
-                        max_reward = max(b['rewards'] for b in epoch_buckets.values()) if epoch_buckets else 0
+                        max_reward = max(b[0] for b in epoch_buckets.values()) if epoch_buckets else 0
                         bar_width = 30
+                        bar_full = '█' * bar_width
+                        c_dim, c_reset = Colors.DIM, Colors.RESET
                         
-                        # Group epochs into buckets: expired (<0), 0, 1-3, 4-7, 8-14, 15-21, 22-28
-                        # Note: negative epochs means allocation is past max age (should have been closed)
-                        # Use -9999 to catch all expired allocations regardless of how old
-                        bucket_ranges = [(-9999, -1), (0, 0), (1, 3), (4, 7), (8, 14), (15, 21), (22, 28)]
-                        bucket_labels = ["exp!", "0d", "1-3d", "4-7d", "8-14d", "15-21d", "22-28d"]
+                        # Classify each epoch once instead of summing every range separately
+                        range_rewards = [0] * len(_REWARD_BUCKETS)
+                        range_counts = [0] * len(_REWARD_BUCKETS)
+                        for epochs_remaining, (rewards, count) in epoch_buckets.items():
+                            idx = _reward_bucket_index(epochs_remaining)
+                            if idx is not None:
+                                range_rewards[idx] += rewards
+                                range_counts[idx] += count
                         
-                        for (start, end), label_text in zip(bucket_ranges, bucket_labels):
-                            # For expired bucket, sum all negative epochs
-                            if start < -100:
-                                bucket_rewards = sum(v['rewards'] for k, v in epoch_buckets.items() if k < 0)
-                                bucket_count = sum(v['count'] for k, v in epoch_buckets.items() if k < 0)
-                            else:
-                                bucket_rewards = sum(epoch_buckets.get(e, {}).get('rewards', 0) for e in range(start, end + 1))
-                                bucket_count = sum(epoch_buckets.get(e, {}).get('count', 0) for e in range(start, end + 1))
-                            
-                            # Color based on urgency
-                            if end <= 0:
-                                color = Colors.BRIGHT_RED  # Expired or expiring today - CRITICAL
-                                prefix = "⚠️ "  # emoji (2 visual cells) + space = 3 visual cells
-                            elif start <= 3:
-                                color = Colors.BRIGHT_YELLOW  # 1-3 days - soon
-                                prefix = "⏰ "  # emoji (2 visual cells) + space = 3 visual cells
-                            else:
-                                color = Colors.BRIGHT_GREEN  # Safe
-                                prefix = "   "  # 3 spaces to match emoji + space
-                            
+                        lines = []
+                        for (label_text, color, prefix), bucket_rewards, bucket_count in zip(
+                                _REWARD_BUCKETS, range_rewards, range_counts):
                             bar_len = min(bar_width, int((bucket_rewards / max_reward) * bar_width)) if max_reward > 0 and bucket_rewards > 0 else 0
-                            bar = '█' * bar_len + '░' * (bar_width - bar_len)
+                            bar = bar_full[:bar_len].ljust(bar_width, '░')
                             
                             # Consistent formatting: prefix (3 cells) + label (6 chars right-aligned) + bar
                             if bucket_rewards > 0:
-                                print(f"  {prefix}{label_text:>6} {color}{bar}{Colors.RESET} {bucket_rewards:>10,.0f} GRT ({bucket_count:>3})")
+                                lines.append(f"  {prefix}{label_text:>6} {color}{bar}{c_reset} {bucket_rewards:>10,.0f} GRT ({bucket_count:>3})")
                             else:
-                                print(f"  {prefix}{label_text:>6} {Colors.DIM}{bar}{Colors.RESET}          - GRT")
+                                lines.append(f"  {prefix}{label_text:>6} {c_dim}{bar}{c_reset}          - GRT")
+                        sys.stdout.write('\n'.join(lines) + '\n')
                 else:
                     print(f"  {Colors.DIM}No accrued rewards found (all allocations may be newly opened){Colors.RESET}")
             else:
@@ -907,72 +1325,61 @@ Examples:
     total_count = indexer.get('totalAllocationCount', 0)
     print(f"  Active: {Colors.BRIGHT_GREEN}{active_count}{Colors.RESET} | Total: {total_count}")
     
-    # Get allocation history
-    active_allocs, closed_allocs = client.get_indexer_allocations(indexer_id, args.hours)
-    poi_submissions = client.get_indexer_poi_submissions(indexer_id, args.hours)
-    recent_delegations, recent_undelegations = client.get_delegation_events(indexer_id, args.hours)
-    
     # Enrich legacy allocation rewards from on-chain events if RPC is available
     legacy_rewards_map = {}
-    rpc_url = get_rpc_url()
-    if rpc_url and HAS_WEB3:
-        legacy_allocs = [a for a in closed_allocs if a.get('isLegacy') and int(a.get('indexingRewards', '0')) == 0]
-        if legacy_allocs:
-            try:
-                legacy_client = LegacyRewardsClient(rpc_url)
-                legacy_rewards_map = legacy_client.get_rewards_for_allocations(legacy_allocs, indexer_id)
-            except Exception:
-                pass
-    
-    # Build timeline
-    events = []
-    
-    # Recent allocations (created in the period)
-    cutoff = datetime.now() - timedelta(hours=args.hours)
-    cutoff_ts = int(cutoff.timestamp())
+    if legacy_future:
+        sys.stdout.flush()
+        legacy_rewards_map = legacy_future.result()
+    
+    # Build timeline (each list stays newest first, in subgraph order)
+    allocate_events = []
+    unallocate_events = []
+    collect_events = []
+    delegate_events = []
+    undelegate_events = []
+    
+    # Recent allocations (the report only holds those created in the period)
     for alloc in active_allocs:
-        created_ts = int(alloc.get('createdAt', 0))
-        if datetime.fromtimestamp(created_ts) >= cutoff:
-            deployment = alloc.get('subgraphDeployment', {})
-            events.append({
-                'type': 'allocate',
-                'timestamp': created_ts,
-                'tokens': alloc.get('allocatedTokens', '0'),
-                'subgraph': deployment.get('ipfsHash', '?'),
-                'subgraph_id': get_subgraph_id_from_deployment(deployment)
-            })
+        deployment = alloc.get('subgraphDeployment', {})
+        allocate_events.append(ActivityEvent(
+            type='allocate',
+            timestamp=int(alloc.get('createdAt', 0)),
+            tokens=alloc.get('allocatedTokens', '0'),
+            subgraph=deployment.get('ipfsHash', '?'),
+            subgraph_id=get_subgraph_id_from_deployment(deployment)
+        ))
     
     # Closed allocations
     for alloc in closed_allocs:
         deployment = alloc.get('subgraphDeployment', {})
         # Use on-chain rewards for legacy allocations if available
-        rewards = int(alloc.get('indexingRewards', '0'))
+        rewards = alloc['_indexingRewardsInt']
         alloc_id = alloc.get('id', '').lower()
         if alloc.get('isLegacy') and rewards == 0 and alloc_id in legacy_rewards_map:
             rewards = legacy_rewards_map[alloc_id]
-        events.append({
-            'type': 'unallocate',
-            'timestamp': int(alloc.get('closedAt', 0)),
-            'tokens': alloc.get('allocatedTokens', '0'),
-            'rewards': rewards,
-            'subgraph': deployment.get('ipfsHash', '?'),
-            'subgraph_id': get_subgraph_id_from_deployment(deployment),
-            'is_legacy': alloc.get('isLegacy', False)
-        })
+        unallocate_events.append(ActivityEvent(
+            type='unallocate',
+            timestamp=int(alloc.get('closedAt', 0)),
+            tokens=alloc.get('allocatedTokens', '0'),
+            rewards=rewards,
+            subgraph=deployment.get('ipfsHash', '?'),
+            subgraph_id=get_subgraph_id_from_deployment(deployment),
+            is_legacy=alloc.get('isLegacy', False)
+        ))
     
     # POI submissions (collections)
     for poi in poi_submissions:
         alloc = poi.get('allocation', {})
         if alloc.get('status') == 'Active':
             deployment = alloc.get('subgraphDeployment', {})
-            events.append({
-                'type': 'collect',
-                'timestamp': int(poi.get('presentedAtTimestamp', 0)),
-                'tokens': alloc.get('allocatedTokens', '0'),
-                'rewards': int(alloc.get('indexingRewards', '0')),
-                'subgraph': deployment.get('ipfsHash', '?'),
-                'subgraph_id': get_subgraph_id_from_deployment(deployment)
-            })
+            collect_events.append(ActivityEvent(
+                type='collect',
+                timestamp=int(poi.get('presentedAtTimestamp', 0)),
+                tokens=alloc.get('allocatedTokens', '0'),
+                rewards=int(alloc.get('indexingRewards', '0')),
+                subgraph=deployment.get('ipfsHash', '?'),
+                subgraph_id=get_subgraph_id_from_deployment(deployment)
+            ))
     
     # Recent delegations
     for stake in recent_delegations:
@@ -983,134 +1390,94 @@ Examples:
         # If createdAt is within the period, it's a new delegation (initial amount)
         # Otherwise it's an increase to existing delegation (total shown)
         is_new = created_at >= cutoff_ts
-        events.append({
-            'type': 'delegate',
-            'timestamp': delegated_at,
-            'tokens': staked_tokens,
-            'delegator': delegator_id,
-            'is_new': is_new
-        })
+        delegate_events.append(ActivityEvent(
+            type='delegate',
+            timestamp=delegated_at,
+            tokens=staked_tokens,
+            delegator=delegator_id,
+            is_new=is_new
+        ))
     
     # Recent undelegations - use lockedTokens (amount in thawing) 
     for stake in recent_undelegations:
         delegator_id = stake.get('delegator', {}).get('id', '?')
         locked_tokens = stake.get('lockedTokens', '0')  # Amount being undelegated
-        remaining_tokens = stake.get('stakedTokens', '0')  # Amount still delegated
+        remaining_tokens = int(stake.get('stakedTokens', '0'))  # Amount still delegated
         undelegated_at = int(stake.get('lastUndelegatedAt') or 0)
-        events.append({
-            'type': 'undelegate',
-            'timestamp': undelegated_at,
-            'tokens': locked_tokens,  # Show the undelegated amount
-            'remaining': remaining_tokens,  # Keep track of remaining
-            'delegator': delegator_id
-        })
+        undelegate_events.append(ActivityEvent(
+            type='undelegate',
+            timestamp=undelegated_at,
+            tokens=locked_tokens,  # Show the undelegated amount
+            remaining=remaining_tokens,  # Keep track of remaining
+            delegator=delegator_id
+        ))
     
-    # Separate allocation events from delegation events
-    allocation_events = [e for e in events if e['type'] in ('allocate', 'unallocate', 'collect')]
-    delegation_events = [e for e in events if e['type'] in ('delegate', 'undelegate')]
+    # Merge the already-sorted lists instead of sorting everything
+    allocation_events = merge_recent_events(20, allocate_events, unallocate_events, collect_events)
+    delegation_events = merge_recent_events(15, delegate_events, undelegate_events)
 
     if allocation_events:
         print_section(f"Allocation Activity ({args.hours}h)")
-        allocation_events.sort(key=lambda x: x['timestamp'], reverse=True)
-
-        for event in allocation_events[:20]:
-            ts = format_timestamp(str(event['timestamp']))
-            tokens = format_tokens_short(event['tokens'])
-
-            if event['type'] == 'allocate':
-                symbol = f"{Colors.BRIGHT_GREEN}+{Colors.RESET}"
-                subgraph = event.get('subgraph', '?')
-                subgraph_id = event.get('subgraph_id')
-                target = format_deployment_link(subgraph, subgraph_id) if subgraph != '?' else subgraph
-                details = f"{tokens} GRT"
-            elif event['type'] == 'unallocate':
-                symbol = f"{Colors.BRIGHT_RED}-{Colors.RESET}"
-                subgraph = event.get('subgraph', '?')
-                subgraph_id = event.get('subgraph_id')
-                target = format_deployment_link(subgraph, subgraph_id) if subgraph != '?' else subgraph
-                rewards = event.get('rewards', 0) / 1e18
-                is_legacy = event.get('is_legacy', False)
-                legacy_marker = f" {Colors.DIM}(legacy){Colors.RESET}" if is_legacy else ""
-                rewards_str = f" → {rewards:,.0f} GRT{legacy_marker}" if rewards > 0 else ""
-                details = f"{tokens} GRT{rewards_str}"
-            elif event['type'] == 'collect':
-                symbol = f"{Colors.BRIGHT_CYAN}${Colors.RESET}"
-                subgraph = event.get('subgraph', '?')
-                subgraph_id = event.get('subgraph_id')
-                target = format_deployment_link(subgraph, subgraph_id) if subgraph != '?' else subgraph
-                rewards = event.get('rewards', 0) / 1e18
-                details = f"{rewards:,.0f} GRT collected"
-            else:
-                continue
 
-            print(f"  [{symbol}] {Colors.DIM}{ts}{Colors.RESET}  {target}  {details}")
+        lines = []
+        for event in allocation_events:
+            fmt = _ALLOCATION_EVENT_FORMATTERS.get(event.type)
+            if fmt is None:
+                continue
+            ts = format_timestamp(event.timestamp)
+            symbol, target, details = fmt(event, format_tokens_short(event.tokens))
+            lines.append(f"  [{symbol}] {Colors.DIM}{ts}{Colors.RESET}  {target}  {details}\n")
+        sys.stdout.writelines(lines)
 
     if delegation_events:
         print_section(f"Delegation Activity ({args.hours}h)")
-        delegation_events.sort(key=lambda x: x['timestamp'], reverse=True)
-
-        for event in delegation_events[:15]:
-            ts = format_timestamp(str(event['timestamp']))
-            tokens = format_tokens_short(event['tokens'])
-
-            if event['type'] == 'delegate':
-                symbol = f"{Colors.BRIGHT_MAGENTA}↑{Colors.RESET}"
-                target = event.get('delegator', '?')
-                is_new = event.get('is_new', False)
-                if is_new:
-                    details = f"{Colors.BRIGHT_MAGENTA}+{tokens} GRT delegated{Colors.RESET}"
-                else:
-                    details = f"{Colors.BRIGHT_MAGENTA}now {tokens} GRT (increased){Colors.RESET}"
-            elif event['type'] == 'undelegate':
-                symbol = f"{Colors.YELLOW}↓{Colors.RESET}"
-                target = event.get('delegator', '?')
-                thawing_tokens = format_tokens_short(event['tokens'])
-                remaining = int(event.get('remaining', '0')) / 1e18
-                remaining_str = f"{remaining:,.0f}" if remaining >= 1 else "0"
-                details = f"{Colors.YELLOW}{thawing_tokens} GRT thawing, {remaining_str} remaining{Colors.RESET}"
-            else:
-                continue
 
-            print(f"  [{symbol}] {Colors.DIM}{ts}{Colors.RESET}  {target}  {details}")
+        lines = []
+        for event in delegation_events:
+            fmt = _DELEGATION_EVENT_FORMATTERS.get(event.type)
+            if fmt is None:
+                continue
+            ts = format_timestamp(event.timestamp)
+            symbol, target, details = fmt(event, format_tokens_short(event.tokens))
+            lines.append(f"  [{symbol}] {Colors.DIM}{ts}{Colors.RESET}  {target}  {details}\n")
+        sys.stdout.writelines(lines)
     
     # Active allocations summary - use dedicated query for true top allocations
-    top_allocs = client.get_top_allocations(indexer_id, 10)
     if top_allocs:
-        # Get sync status from indexer's public status endpoint
-        indexer_url = indexer.get('url')
+        # Sync status from the indexer's public status endpoint (fetched in the background)
         sync_statuses = {}
         status_error = None
-        status_client = None
-        
-        if indexer_url:
-            status_client = IndexerStatusClient(timeout=15)
-            sync_statuses = status_client.get_all_deployments_status(indexer_url)
-            if not sync_statuses and status_client.last_error:
-                status_error = status_client.last_error
+        if status_future:
+            sys.stdout.flush()
+            sync_statuses, status_error = status_future.result()
         else:
             status_error = "No indexer URL in network subgraph"
         
         print_section("Top Active Allocations")
         if status_error:
             print(f"  {Colors.DIM}⚠ Sync status unavailable: {status_error}{Colors.RESET}")
+        now_ts = int(time.time())
+        c_dim, c_reset = Colors.DIM, Colors.RESET
+        lines = []
         for alloc in top_allocs:
             deployment = alloc.get('subgraphDeployment', {})
             subgraph_hash = deployment.get('ipfsHash', '?')
             subgraph_id = get_subgraph_id_from_deployment(deployment)
             subgraph = format_deployment_link(subgraph_hash, subgraph_id) if subgraph_hash != '?' else subgraph_hash
             tokens = format_tokens(alloc.get('allocatedTokens', '0'))
-            signal = int(deployment.get('signalledTokens', '0')) / 1e18
+            signal = wei_to_grt(deployment.get('signalledTokens') or 0)
             created_ts = int(alloc.get('createdAt', 0))
-            age = format_duration(int(datetime.now().timestamp()) - created_ts)
+            age = format_duration(now_ts - created_ts)
             
             # Get sync status for this deployment
             sync_status = sync_statuses.get(subgraph_hash)
             sync_indicator = format_sync_status(sync_status) if sync_statuses else ""
             
             if sync_indicator:
-                print(f"  {subgraph}  {tokens:>12}  {Colors.DIM}{age:>8}{Colors.RESET}  {sync_indicator}")
+                lines.append(f"  {subgraph}  {tokens:>12}  {c_dim}{age:>8}{c_reset}  {sync_indicator}\n")
             else:
-                print(f"  {subgraph}  {tokens:>12}  {Colors.DIM}{age:>8}  signal: {signal:,.0f}{Colors.RESET}")
+                lines.append(f"  {subgraph}  {tokens:>12}  {c_dim}{age:>8}  signal: {signal:,.0f}{c_reset}\n")
+        sys.stdout.writelines(lines)
     
     print()
 
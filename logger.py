@@ -16,6 +16,15 @@ from typing import Optional
 from pathlib import Path
 
 
+# Log level by verbosity: 0=WARNING+, 1=INFO+, 2=DEBUG+
+_VERBOSITY_TO_LEVEL = (logging.WARNING, logging.INFO, logging.DEBUG)
+
+
+def _level_for(verbosity: int) -> int:
+    """Map a verbosity count (-v flags) to a logging level"""
+    return _VERBOSITY_TO_LEVEL[max(0, min(verbosity, 2))]
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with ANSI color codes for terminal output"""
     
@@ -32,16 +41,23 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt: str = None, use_colors: bool = True):
         super().__init__(fmt or '%(message)s')
         self.use_colors = use_colors and sys.stderr.isatty()
+        # (prefix, suffix) around the formatted record, by level number.
+        # For DEBUG, show the level name; INFO is left plain.
+        self._wrap = {}
+        if self.use_colors:
+            self._wrap = {
+                logging.DEBUG: (f"{self.DIM}[DEBUG] ", self.RESET),
+                logging.WARNING: (self.COLORS['WARNING'], self.RESET),
+                logging.ERROR: (self.COLORS['ERROR'], self.RESET),
+                logging.CRITICAL: (self.COLORS['CRITICAL'], self.RESET),
+            }
     
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_colors:
-            color = self.COLORS.get(record.levelname, '')
-            # For DEBUG, show the level name; for others, just the message
-            if record.levelno == logging.DEBUG:
-                record.msg = f"{self.DIM}[{record.levelname}] {record.msg}{self.RESET}"
-            elif record.levelno >= logging.WARNING:
-                record.msg = f"{color}{record.msg}{self.RESET}"
-        return super().format(record)
+        # The record is shared with other handlers (e.g. the log file): never modify it
+        wrap = self._wrap.get(record.levelno)
+        if wrap is None:
+            return super().format(record)
+        return f"{wrap[0]}{super().format(record)}{wrap[1]}"
 
 
 class GrtLogger:
@@ -70,6 +86,7 @@ class GrtLogger:
             return
         
         self._verbosity = 0
+        self._level = logging.WARNING
         self._loggers = {}
         self._handler = None
         self._file_handler = None
@@ -89,14 +106,7 @@ class GrtLogger:
             use_colors: Whether to use colored output (default True)
         """
         self._verbosity = verbosity
-        
-        # Map verbosity to log level
-        if verbosity >= 2:
-            level = logging.DEBUG
-        elif verbosity >= 1:
-            level = logging.INFO
-        else:
-            level = logging.WARNING
+        self._level = level = _level_for(verbosity)
         
         # Create console handler
         self._handler = logging.StreamHandler(sys.stderr)
@@ -134,15 +144,7 @@ class GrtLogger:
         """Get or create a logger for the given module name"""
         if name not in self._loggers:
             logger = logging.getLogger(f"grtinfo.{name}")
-            
-            # Set default level if not yet configured
-            level = logging.WARNING
-            if self._verbosity >= 2:
-                level = logging.DEBUG
-            elif self._verbosity >= 1:
-                level = logging.INFO
-            
-            self._configure_logger(logger, level)
+            self._configure_logger(logger, self._level)
             self._loggers[name] = logger
         
         return self._loggers[name]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Persistent GraphQL query cache for grtinfo CLI tools
+
+Stores query results in a small SQLite database, keyed by a hash of
+(url, query, variables), with a TTL chosen by the caller per query.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from common import json_loads
+
+
+class QueryCache:
+    """SQLite-backed TTL cache for GraphQL query results
+
+    Entries are only returned while younger than their TTL; expired rows
+    are overwritten on the next store. All errors are swallowed so a broken
+    cache never breaks a query.
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize query cache
+
+        Args:
+            db_path: Path of the SQLite database file (created if missing)
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()  # clients may query from worker threads
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS queries (hash TEXT PRIMARY KEY, expires REAL, body BLOB)'
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn = None
+
+    @staticmethod
+    def make_key(url: str, query: str, variables: Optional[Dict] = None) -> str:
+        """Hash url, query and canonical variables into a cache key"""
+        canonical_vars = json.dumps(variables or {}, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(f"{url}\n{query}\n{canonical_vars}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT body FROM queries WHERE hash = ? AND expires > ?', (key, time.time())
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return json_loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds"""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO queries (hash, expires, body) VALUES (?, ?, ?)',
+                    (key, time.time() + ttl, json.dumps(value).encode())
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -6,6 +6,7 @@ This module provides functions to query indexing rewards from
 both on-chain contracts and The Graph Network subgraph.
 """
 
+import importlib.util
 from typing import Dict, List, Optional
 import requests
 
@@ -14,12 +15,9 @@ from contracts import (
     PPM_BASE, GRT_DECIMALS
 )
 
-# Check if web3 is available
-try:
-    from web3 import Web3
-    HAS_WEB3 = True
-except ImportError:
-    HAS_WEB3 = False
+# Check if web3 is available without importing it: it is slow to import and
+# only needed once rewards are actually fetched
+HAS_WEB3 = importlib.util.find_spec('web3') is not None
 
 
 def get_accrued_rewards(
@@ -42,6 +40,8 @@ def get_accrued_rewards(
         return None
     
     try:
+        from web3 import Web3
+        
         w3 = Web3(Web3.HTTPProvider(rpc_url))
         
         # Function selector for getRewards(address,address)
@@ -160,6 +160,7 @@ def get_legacy_rewards_from_events(
     
     try:
         from contracts import HORIZON_REWARD_ASSIGNED_TOPIC, pad_address
+        from web3 import Web3
         
         w3 = Web3(Web3.HTTPProvider(rpc_url))
         
@@ -211,6 +212,7 @@ def get_rewards_batch(
     
     from concurrent.futures import ThreadPoolExecutor, as_completed
     import threading
+    from web3 import Web3
     
     results = {}
     
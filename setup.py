@@ -12,6 +12,10 @@ setup(
         'requests>=2.31.0',
         'web3>=6.0.0',
     ],
+    extras_require={
+        # Faster JSON decoding of subgraph responses (used automatically when installed)
+        'fast': ['orjson>=3.6'],
+    },
     entry_points={
         'console_scripts': [
             'subinfo=subinfo:main',
@@ -4,13 +4,75 @@ Subgraph Health Monitor - Monitor health of subgraphs with active allocations
 """
 
 import argparse
+import io
 import json
 import os
 import requests
+import sqlite3
+import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common import json_dumps, json_loads
+
+# Max concurrent requests to other indexers' status endpoints
+STATUS_PROBE_WORKERS = 16
+
+# Max concurrent id ranges when paging through an indexer's allocations
+ALLOCATION_FETCH_WORKERS = 8
+
+# Expected blocks per hour per network, used to tell a growing gap from normal sync.
+# Read-only: config files override it by supplying their own chain_blocks_per_hour.
+CHAIN_BLOCKS_PER_HOUR = MappingProxyType({
+    'mainnet': 300,
+    'matic': 1800,
+    'arbitrum-one': 15000,
+    'base': 1800,
+    'bsc': 1200,
+    'avalanche': 1800,
+    'gnosis': 720,
+    'optimism': 1800,
+    'celo': 720,
+    'fantom': 3600,
+    'moonbeam': 500,
+    'moonriver': 500,
+    'polygon-zkevm': 300,
+    'zksync-era': 720,
+    'linea': 300,
+    'scroll': 300,
+    'sonic': 1800,
+    'arbitrum-sepolia': 15000
+})
+
+# Shared HTTP session: keeps connections to Prometheus, the network subgraph and
+# status endpoints open across calls. The pool is sized for the probe workers.
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+
+def _write_json_atomic(path: Path, obj: Any):
+    """Write obj as indented JSON through a temp file and rename
+    A crash mid-write leaves the previous file intact instead of a truncated one
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(json_dumps(obj, indent=True))
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _iso_timestamp(value: str) -> float:
+    """Parse a stored ISO datetime (local time) into a Unix timestamp"""
+    return datetime.fromisoformat(value).timestamp()
+
 
 # ANSI Colors
 class Colors:
@@ -38,13 +100,30 @@ def format_deployment_link(ipfs_hash: str, subgraph_id: str = None) -> str:
 
 
 class Cache:
-    """Simple file-based cache with TTL"""
+    """SQLite-backed cache with TTL
+    
+    All entries live in one cache.sqlite file under cache_dir, with an in-memory
+    layer in front. Errors are swallowed so a broken cache never breaks a run.
+    """
     
     def __init__(self, cache_dir: Path, ttl_seconds: int = 300):
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_seconds
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._memory_cache = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = sqlite3.connect(str(cache_dir / 'cache.sqlite'))
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, expires REAL, data BLOB)'
+            )
+            # Drop expired entries so the file does not grow across runs
+            self._conn.execute('DELETE FROM kv WHERE expires <= ?', (time.time(),))
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn = None
     
     def get(self, key: str) -> Optional[dict]:
         # Check memory cache first
@@ -53,18 +132,51 @@ class Cache:
             if time.time() < entry['expires']:
                 return entry['data']
         
-        # Check file cache
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
+        # Check database
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                'SELECT data, expires FROM kv WHERE key = ? AND expires > ?', (key, time.time())
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        entry = {'data': json_loads(row[0]), 'expires': row[1]}
+        self._memory_cache[key] = entry
+        return entry['data']
+    
+    def get_many(self, keys: List[str]) -> Dict[str, dict]:
+        """Look up several keys at once, returns {key: data} for the ones cached"""
+        now = time.time()
+        found = {}
+        missing = []
+        for key in keys:
+            entry = self._memory_cache.get(key)
+            if entry is not None and now < entry['expires']:
+                found[key] = entry['data']
+            else:
+                missing.append(key)
+        
+        if self._conn is None:
+            return found
+        # Stay under SQLite's default limit on bound parameters
+        for i in range(0, len(missing), 500):
+            chunk = missing[i:i + 500]
             try:
-                with open(cache_file, 'r') as f:
-                    entry = json.load(f)
-                if time.time() < entry.get('expires', 0):
-                    self._memory_cache[key] = entry
-                    return entry['data']
-            except:
-                pass
-        return None
+                rows = self._conn.execute(
+                    'SELECT key, data, expires FROM kv WHERE expires > ? AND key IN (%s)'
+                    % ','.join('?' * len(chunk)),
+                    (now, *chunk)
+                ).fetchall()
+            except sqlite3.Error:
+                continue
+            for key, data, expires in rows:
+                entry = {'data': json_loads(data), 'expires': expires}
+                self._memory_cache[key] = entry
+                found[key] = entry['data']
+        return found
     
     def set(self, key: str, data: dict):
         entry = {
@@ -72,33 +184,112 @@ class Cache:
             'expires': time.time() + self.ttl_seconds
         }
         self._memory_cache[key] = entry
-        cache_file = self.cache_dir / f"{key}.json"
+        if self._conn is None:
+            return
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(entry, f)
-        except:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO kv (key, expires, data) VALUES (?, ?, ?)',
+                (key, entry['expires'], json_dumps(data))
+            )
+            self._conn.commit()
+        except sqlite3.Error:
             pass
 
 
 class HistoryManager:
-    """Manage history of issues for tracking regressions/corrections"""
+    """Manage history of issues for tracking regressions/corrections
+    
+    State is a history.json snapshot plus history-events.jsonl, which gets one
+    line per run with only the issues that appeared, changed type or resolved.
+    The snapshot is only rewritten (and the event log emptied) every
+    COMPACT_EVERY runs. Events carry a sequence number and the snapshot records
+    the last one it includes, so a crash between writing the snapshot and
+    removing the log does not replay runs twice.
+    
+    last_seen is stored when an issue changes and refreshed for active issues
+    at compaction; an active issue was always seen in the last run.
+    """
+    
+    COMPACT_EVERY = 50
     
     def __init__(self, config_dir: Path):
         self.history_file = config_dir / 'history.json'
+        self.events_file = config_dir / 'history-events.jsonl'
+        self._event_count = 0
+        # Hashes of unresolved issues, kept in step by _apply_event
+        self._active_hashes = {}
         self._data = self._load()
     
     def _load(self) -> Dict:
+        data = {'issues': {}, 'runs': [], 'last_run': None}
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    data = json_loads(f.read())
             except:
                 pass
-        return {'issues': {}, 'runs': [], 'last_run': None}
-    
-    def _save(self):
-        with open(self.history_file, 'w') as f:
-            json.dump(self._data, f, indent=2)
+        data.setdefault('seq', 0)
+        self._active_hashes = {
+            h: None for h, d in data['issues'].items() if d.get('resolved_at') is None
+        }
+        
+        # Replay runs recorded since the last snapshot
+        if self.events_file.exists():
+            try:
+                with open(self.events_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            event = json_loads(line)
+                        except ValueError:
+                            continue  # Partial line from an interrupted write
+                        self._event_count += 1
+                        # Already in the snapshot: the log outlived a compaction
+                        if event.get('seq', data['seq'] + 1) <= data['seq']:
+                            continue
+                        self._apply_event(data, self._active_hashes, event)
+            except OSError:
+                pass
+        return data
+    
+    @staticmethod
+    def _apply_event(data: Dict, active_hashes: Dict, event: Dict):
+        """Apply one run's changes to the history state and the active hashes"""
+        for ipfs_hash, entry in event.get('issues', {}).items():
+            data['issues'][ipfs_hash] = entry
+            if entry.get('resolved_at') is None:
+                active_hashes[ipfs_hash] = None
+            else:
+                active_hashes.pop(ipfs_hash, None)
+        data['runs'].append(event['t'])
+        if len(data['runs']) > 100:
+            data['runs'] = data['runs'][-100:]  # Keep last 100 runs
+        data['last_run'] = event.get('last_run')
+        if 'seq' in event:
+            data['seq'] = event['seq']
+    
+    def _save(self, event: Dict):
+        """Append the run's event, or compact into a new snapshot when due"""
+        if self._event_count + 1 >= self.COMPACT_EVERY:
+            issues = self._data['issues']
+            for ipfs_hash in self._active_hashes:
+                issues[ipfs_hash]['last_seen'] = event['t']
+            _write_json_atomic(self.history_file, self._data)
+            try:
+                self.events_file.unlink()
+            except FileNotFoundError:
+                pass
+            self._event_count = 0
+        else:
+            with open(self.events_file, 'a+b') as f:
+                # Terminate a line left partial by an interrupted write, so it
+                # is not glued to this event
+                line = json_dumps(event) + b'\n'
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        line = b'\n' + line
+                f.write(line)
+            self._event_count += 1
     
     def get_issue_duration(self, ipfs_hash: str) -> Optional[str]:
         """Get how long an issue has been present"""
@@ -107,30 +298,29 @@ class HistoryManager:
             return self._calculate_duration(issue['first_seen'])
         return None
     
-    def _calculate_duration(self, first_seen_str: str) -> str:
-        """Calculate human-readable duration from first_seen to now"""
+    def _calculate_duration(self, first_seen_str: str, now_ts: Optional[float] = None) -> str:
+        """Calculate human-readable duration from first_seen to now_ts (default: now)"""
         try:
-            first_seen = datetime.fromisoformat(first_seen_str)
-            delta = datetime.now() - first_seen
+            delta = (now_ts or time.time()) - _iso_timestamp(first_seen_str)
             
-            if delta.total_seconds() < 60:
+            if delta < 60:
                 return "just now"
-            elif delta.total_seconds() < 3600:
-                mins = int(delta.total_seconds() / 60)
+            elif delta < 3600:
+                mins = int(delta / 60)
                 return f"{mins}m"
-            elif delta.total_seconds() < 86400:
-                hours = int(delta.total_seconds() / 3600)
+            elif delta < 86400:
+                hours = int(delta / 3600)
                 return f"{hours}h"
             else:
-                days = int(delta.total_seconds() / 86400)
+                days = int(delta / 86400)
                 return f"{days}d"
         except:
             return "?"
     
     def record_run(self, results: List[Dict]) -> Dict:
         """Record current run and return changes since last run"""
-        now = datetime.now()
-        now_str = now.isoformat()
+        now_ts = time.time()
+        now_str = datetime.fromtimestamp(now_ts).isoformat()
         current_issues = {}
         
         # Extract current issues from results
@@ -172,68 +362,71 @@ class HistoryManager:
         
         new_issues = []
         resolved_issues = []
+        changed = {}  # ipfs_hash -> updated entry, the only issues written to the event
         
-        # Get previous active issues (not resolved)
-        previous_active = {h: d for h, d in self._data.get('issues', {}).items() 
-                         if d.get('resolved_at') is None}
-        
-        # Find NEW issues (not in previous active issues)
+        previous_active = self._active_hashes
+        issues = self._data['issues']
         for ipfs_hash, issue_info in current_issues.items():
-            existing = previous_active.get(ipfs_hash)
+            entry = issues.get(ipfs_hash)
+            if ipfs_hash in previous_active:
+                # Issue already tracked - only a type change needs recording
+                if entry.get('issue_type') != issue_info['type']:
+                    changed[ipfs_hash] = dict(entry, last_seen=now_str, issue_type=issue_info['type'])
+                continue
             
-            if existing:
-                # Issue already tracked - update last_seen and type
-                self._data['issues'][ipfs_hash]['last_seen'] = now_str
-                self._data['issues'][ipfs_hash]['issue_type'] = issue_info['type']
-            else:
-                # Truly new issue (or was resolved and came back)
-                new_issues.append({
-                    'ipfsHash': ipfs_hash,
-                    'type': issue_info['type'],
+            # Truly new issue (or was resolved and came back)
+            new_issues.append({
+                'ipfsHash': ipfs_hash,
+                'type': issue_info['type'],
+                'network': issue_info['network'],
+                'allocated': issue_info['allocated']
+            })
+            if entry is None:
+                changed[ipfs_hash] = {
+                    'first_seen': now_str,
+                    'last_seen': now_str,
+                    'issue_type': issue_info['type'],
                     'network': issue_info['network'],
-                    'allocated': issue_info['allocated']
-                })
-                # Record in history (or update if it was resolved before)
-                if ipfs_hash in self._data.get('issues', {}):
-                    # Issue came back - update first_seen to now
-                    self._data['issues'][ipfs_hash]['first_seen'] = now_str
-                    self._data['issues'][ipfs_hash]['resolved_at'] = None
-                else:
-                    self._data['issues'][ipfs_hash] = {
-                        'first_seen': now_str,
-                        'last_seen': now_str,
-                        'issue_type': issue_info['type'],
-                        'network': issue_info['network'],
-                        'resolved_at': None
-                    }
-                self._data['issues'][ipfs_hash]['last_seen'] = now_str
-                self._data['issues'][ipfs_hash]['issue_type'] = issue_info['type']
+                    'resolved_at': None
+                }
+            else:
+                # Issue came back - restart first_seen from now
+                changed[ipfs_hash] = dict(
+                    entry,
+                    first_seen=now_str,
+                    resolved_at=None,
+                    last_seen=now_str,
+                    issue_type=issue_info['type']
+                )
         
-        # Find RESOLVED issues (were in previous active, not in current)
-        for ipfs_hash, issue_data in previous_active.items():
-            if ipfs_hash not in current_issues:
-                # Issue was resolved since last run
-                self._data['issues'][ipfs_hash]['resolved_at'] = now_str
-                resolved_issues.append({
-                    'ipfsHash': ipfs_hash,
-                    'type': issue_data.get('issue_type', 'unknown'),
-                    'network': issue_data.get('network', ''),
-                    'duration': self._calculate_duration(issue_data.get('first_seen'))
-                })
+        # Find RESOLVED issues (were in previous active, not in current).
+        # They were last seen in the previous run
+        last_run = self._data.get('last_run') or {}
+        previous_run = last_run.get('timestamp', now_str)
+        for ipfs_hash in sorted(previous_active.keys() - current_issues.keys()):
+            issue_data = issues[ipfs_hash]
+            changed[ipfs_hash] = dict(issue_data, resolved_at=now_str, last_seen=previous_run)
+            resolved_issues.append({
+                'ipfsHash': ipfs_hash,
+                'type': issue_data.get('issue_type', 'unknown'),
+                'network': issue_data.get('network', ''),
+                'duration': self._calculate_duration(issue_data.get('first_seen'), now_ts)
+            })
         
         # Record run
-        self._data['runs'].append(now_str)
-        if len(self._data['runs']) > 100:
-            self._data['runs'] = self._data['runs'][-100:]  # Keep last 100 runs
-        
-        self._data['last_run'] = {
-            'timestamp': now_str,
-            'total_issues': len(current_issues),
-            'new_count': len(new_issues),
-            'resolved_count': len(resolved_issues)
+        event = {
+            'seq': self._data['seq'] + 1,
+            't': now_str,
+            'issues': changed,
+            'last_run': {
+                'timestamp': now_str,
+                'total_issues': len(current_issues),
+                'new_count': len(new_issues),
+                'resolved_count': len(resolved_issues)
+            }
         }
-        
-        self._save()
+        self._apply_event(self._data, self._active_hashes, event)
+        self._save(event)
         
         return {
             'new': new_issues,
@@ -253,19 +446,34 @@ class AcknowledgementManager:
     def __init__(self, config_dir: Path):
         self.ack_file = config_dir / 'acknowledged.json'
         self._data = self._load()
+        # Parsed expiry per acknowledgement (None = never expires)
+        self._expires_ts = {h: self._expiry_timestamp(ack) for h, ack in self._data.items()}
     
     def _load(self) -> Dict:
         if self.ack_file.exists():
             try:
-                with open(self.ack_file, 'r') as f:
-                    return json.load(f)
+                with open(self.ack_file, 'rb') as f:
+                    return json_loads(f.read())
             except:
                 pass
         return {}
     
     def _save(self):
-        with open(self.ack_file, 'w') as f:
-            json.dump(self._data, f, indent=2)
+        _write_json_atomic(self.ack_file, self._data)
+    
+    @staticmethod
+    def _expiry_timestamp(ack: Dict) -> Optional[float]:
+        """Unix timestamp an acknowledgement expires at, None if it never does"""
+        if ack.get('expires'):
+            try:
+                return _iso_timestamp(ack['expires'])
+            except:
+                pass
+        return None
+    
+    def _remove(self, ipfs_hash: str):
+        del self._data[ipfs_hash]
+        del self._expires_ts[ipfs_hash]
     
     def acknowledge(self, ipfs_hash: str, reason: str = "", category: str = "wip", expires: str = None) -> bool:
         """Acknowledge an issue"""
@@ -291,13 +499,14 @@ class AcknowledgementManager:
             'acknowledged_at': datetime.now().isoformat(),
             'expires': expires_dt.isoformat() if expires_dt else None
         }
+        self._expires_ts[ipfs_hash] = expires_dt.timestamp() if expires_dt else None
         self._save()
         return True
     
     def unacknowledge(self, ipfs_hash: str) -> bool:
         """Remove acknowledgement for an issue"""
         if ipfs_hash in self._data:
-            del self._data[ipfs_hash]
+            self._remove(ipfs_hash)
             self._save()
             return True
         return False
@@ -307,35 +516,23 @@ class AcknowledgementManager:
         if ipfs_hash not in self._data:
             return None
         
-        ack = self._data[ipfs_hash]
-        if ack.get('expires'):
-            try:
-                expires = datetime.fromisoformat(ack['expires'])
-                if datetime.now() > expires:
-                    # Expired - remove it
-                    del self._data[ipfs_hash]
-                    self._save()
-                    return None
-            except:
-                pass
+        expires = self._expires_ts[ipfs_hash]
+        if expires is not None and time.time() > expires:
+            # Expired - remove it
+            self._remove(ipfs_hash)
+            self._save()
+            return None
         
-        return ack
+        return self._data[ipfs_hash]
     
     def list_all(self) -> Dict:
         """List all acknowledgements"""
         # Clean expired ones first
-        to_remove = []
-        for ipfs_hash, ack in self._data.items():
-            if ack.get('expires'):
-                try:
-                    expires = datetime.fromisoformat(ack['expires'])
-                    if datetime.now() > expires:
-                        to_remove.append(ipfs_hash)
-                except:
-                    pass
+        now = time.time()
+        to_remove = [h for h, expires in self._expires_ts.items() if expires is not None and now > expires]
         
         for h in to_remove:
-            del self._data[h]
+            self._remove(h)
         
         if to_remove:
             self._save()
@@ -346,19 +543,23 @@ class AcknowledgementManager:
 class PrometheusClient:
     """Client for querying Prometheus metrics"""
     
-    def __init__(self, base_url: str):
+    # Max length of a deployment regex matcher, keeps query URLs well under 8KB
+    MAX_SELECTOR_LENGTH = 6000
+    
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip('/')
+        self._session = session or _session
     
     def query(self, query: str) -> Optional[List[Dict]]:
         """Execute a PromQL query"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/v1/query",
                 params={'query': query},
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             if data.get('status') == 'success':
                 return data.get('data', {}).get('result', [])
         except Exception as e:
@@ -411,12 +612,45 @@ class PrometheusClient:
         4: 'syncing'
     }
     
-    def get_all_deployment_metrics(self) -> Dict[str, Dict]:
-        """Get metrics for all deployments at once"""
+    def _deployment_selectors(self, deployments: Optional[List[str]]) -> List[str]:
+        """Build label matchers selecting the given deployments
+        Long lists are split into several matchers; None selects every deployment
+        """
+        if deployments is None:
+            return ['']
+        selectors = []
+        chunk = []
+        length = 0
+        for deployment in deployments:
+            if length + len(deployment) + 1 > self.MAX_SELECTOR_LENGTH and chunk:
+                selectors.append('{deployment=~"%s"}' % '|'.join(chunk))
+                chunk = []
+                length = 0
+            chunk.append(deployment)
+            length += len(deployment) + 1
+        if chunk:
+            selectors.append('{deployment=~"%s"}' % '|'.join(chunk))
+        return selectors
+    
+    def query_deployments(self, query: str, deployments: Optional[List[str]] = None) -> Optional[List[Dict]]:
+        """Execute a PromQL query restricted to the given deployments
+        query has a {selector} placeholder for the label matcher,
+        e.g. 'rate(deployment_head{selector}[10m])'
+        """
+        results = None
+        for selector in self._deployment_selectors(deployments):
+            # Not str.format: the query may hold PromQL braces of its own
+            chunk_results = self.query(query.replace('{selector}', selector))
+            if chunk_results is not None:
+                results = (results or []) + chunk_results
+        return results
+    
+    def get_all_deployment_metrics(self, deployments: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get metrics for the given deployments (default: all) at once"""
         metrics = {}
         
         # Get all deployment heads
-        heads = self.query('deployment_head')
+        heads = self.query_deployments('deployment_head{selector}', deployments)
         if heads:
             for r in heads:
                 dep = r.get('metric', {}).get('deployment', '')
@@ -429,7 +663,7 @@ class PrometheusClient:
                         pass
         
         # Get all deployment statuses (value is numeric: 1=unknown, 2=synced, 3=failed, 4=syncing)
-        statuses = self.query('deployment_status')
+        statuses = self.query_deployments('deployment_status{selector}', deployments)
         if statuses:
             for r in statuses:
                 dep = r.get('metric', {}).get('deployment', '')
@@ -462,57 +696,111 @@ class PrometheusClient:
 class NetworkSubgraphClient:
     """Client for querying The Graph Network subgraph"""
     
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: Optional[requests.Session] = None):
         self.url = url
+        self._session = session or _session
+        self._other_indexers = {}  # (deployment_ipfs, exclude_indexer) -> indexers
     
     def query(self, query: str, variables: dict = None) -> Optional[Dict]:
         """Execute a GraphQL query"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.url,
                 json={'query': query, 'variables': variables or {}},
                 timeout=30
             )
             response.raise_for_status()
-            return response.json().get('data')
+            return json_loads(response.content).get('data')
         except Exception as e:
             return None
     
+    # Active allocations between two ids, in id order. %s is where the
+    # indexer's allocation count is added for the first page.
+    ALLOCATIONS_QUERY = """
+    query($indexer: String!, $lastId: String!, $maxId: String!, $first: Int!) {
+        allocations(
+            where: {indexer: $indexer, status: Active, id_gt: $lastId, id_lte: $maxId}
+            orderBy: id
+            orderDirection: asc
+            first: $first
+        ) {
+            id
+            allocatedTokens
+            createdAt
+            subgraphDeployment {
+                ipfsHash
+                manifest {
+                    network
+                }
+                versions(first: 1, orderBy: createdAt, orderDirection: desc) {
+                    subgraph {
+                        id
+                    }
+                }
+            }
+        }
+        %s
+    }
+    """
+    
+    # Allocation ids are lowercase 20-byte hex addresses
+    MAX_ALLOCATION_ID = '0x' + 'f' * 40
+    
     def get_indexer_allocations(self, indexer_id: str) -> List[Dict]:
-        """Get all active allocations for an indexer"""
-        allocations = []
-        skip = 0
+        """Get all active allocations for an indexer
+        The first page also returns the indexer's allocation count. When there are
+        more pages, the remaining id space is split into ranges fetched in parallel.
+        """
+        indexer_id = indexer_id.lower()
         batch_size = 1000
         
+        data = self.query(self.ALLOCATIONS_QUERY % 'indexer(id: $indexer) { allocationCount }', {
+            'indexer': indexer_id,
+            'lastId': '',
+            'maxId': self.MAX_ALLOCATION_ID,
+            'first': batch_size
+        })
+        if not data or not data.get('allocations'):
+            return []
+        
+        allocations = data['allocations']
+        if len(allocations) < batch_size:
+            return allocations
+        
+        # Split the ids after the first page into one range per remaining page (capped)
+        remaining = int((data.get('indexer') or {}).get('allocationCount') or 0) - len(allocations)
+        num_ranges = max(1, min(ALLOCATION_FETCH_WORKERS, -(-remaining // batch_size)))
+        last_id = allocations[-1]['id']
+        try:
+            start = int(last_id, 16)
+        except ValueError:
+            num_ranges = 1
+            start = 0
+        bounds = [last_id]
+        end = int(self.MAX_ALLOCATION_ID, 16)
+        for i in range(1, num_ranges):
+            bounds.append('0x%040x' % (start + (end - start) * i // num_ranges))
+        bounds.append(self.MAX_ALLOCATION_ID)
+        
+        ranges = list(zip(bounds, bounds[1:]))
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            for batch in executor.map(
+                lambda r: self._get_allocations_range(indexer_id, r[0], r[1], batch_size), ranges
+            ):
+                allocations.extend(batch)
+        
+        return allocations
+    
+    def _get_allocations_range(self, indexer_id: str, after: str, until: str, batch_size: int) -> List[Dict]:
+        """Get active allocations with after < id <= until, paging by id cursor"""
+        allocations = []
+        query = self.ALLOCATIONS_QUERY % ''
+        
         while True:
-            query = """
-            query($indexer: String!, $skip: Int!, $first: Int!) {
-                allocations(
-                    where: {indexer: $indexer, status: Active}
-                    first: $first
-                    skip: $skip
-                ) {
-                    id
-                    allocatedTokens
-                    createdAt
-                    subgraphDeployment {
-                        ipfsHash
-                        manifest {
-                            network
-                        }
-                        versions(first: 1, orderBy: createdAt, orderDirection: desc) {
-                            subgraph {
-                                id
-                            }
-                        }
-                    }
-                }
-            }
-            """
-            
             data = self.query(query, {
-                'indexer': indexer_id.lower(),
-                'skip': skip,
+                'indexer': indexer_id,
+                'lastId': after,
+                'maxId': until,
                 'first': batch_size
             })
             
@@ -525,12 +813,79 @@ class NetworkSubgraphClient:
             if len(batch) < batch_size:
                 break
             
-            skip += batch_size
+            after = batch[-1]['id']
         
         return allocations
     
+    def prefetch_other_indexers(self, deployment_ipfs_list: List[str], exclude_indexer: str):
+        """Fetch other indexers for several deployments in one query
+        Results are kept for get_other_indexers_for_deployment
+        """
+        exclude_indexer = exclude_indexer.lower()
+        pending = [d for d in deployment_ipfs_list if (d, exclude_indexer) not in self._other_indexers]
+        if not pending:
+            return
+        
+        query = """
+        query($deployments: [String!]!, $excludeIndexer: String!, $lastId: String!, $first: Int!) {
+            allocations(
+                where: {
+                    subgraphDeployment_: {ipfsHash_in: $deployments}
+                    status: Active
+                    indexer_not: $excludeIndexer
+                    id_gt: $lastId
+                }
+                orderBy: id
+                orderDirection: asc
+                first: $first
+            ) {
+                id
+                subgraphDeployment { ipfsHash }
+                indexer {
+                    id
+                    url
+                }
+            }
+        }
+        """
+        batch_size = 1000
+        found = {d: [] for d in pending}
+        seen = set()
+        last_id = ''
+        
+        while True:
+            data = self.query(query, {
+                'deployments': pending,
+                'excludeIndexer': exclude_indexer,
+                'lastId': last_id,
+                'first': batch_size
+            })
+            if data is None:
+                return  # Leave uncached, get_other_indexers_for_deployment queries on its own
+            
+            batch = data.get('allocations') or []
+            for alloc in batch:
+                deployment_ipfs = alloc.get('subgraphDeployment', {}).get('ipfsHash')
+                indexer = alloc.get('indexer', {})
+                indexer_id = indexer.get('id')
+                # Deduplicate by indexer per deployment
+                if deployment_ipfs in found and indexer_id and (deployment_ipfs, indexer_id) not in seen:
+                    seen.add((deployment_ipfs, indexer_id))
+                    found[deployment_ipfs].append(indexer)
+            
+            if len(batch) < batch_size:
+                break
+            last_id = batch[-1]['id']
+        
+        for deployment_ipfs, indexers in found.items():
+            self._other_indexers[(deployment_ipfs, exclude_indexer)] = indexers
+    
     def get_other_indexers_for_deployment(self, deployment_ipfs: str, exclude_indexer: str) -> List[Dict]:
         """Get other indexers with allocations on a deployment"""
+        prefetched = self._other_indexers.get((deployment_ipfs, exclude_indexer.lower()))
+        if prefetched is not None:
+            return prefetched
+        
         query = """
         query($deployment: String!, $excludeIndexer: String!) {
             allocations(
@@ -581,26 +936,11 @@ def get_config() -> Dict:
             'https://api.thegraph.com/subgraphs/name/graphprotocol/graph-network-arbitrum'),
         'indexer_id': os.environ.get('INDEXER_ID', ''),
         'allocation_max_days': int(os.environ.get('ALLOCATION_MAX_DAYS', '28')),
-        'chain_blocks_per_hour': {
-            'mainnet': 300,
-            'matic': 1800,
-            'arbitrum-one': 15000,
-            'base': 1800,
-            'bsc': 1200,
-            'avalanche': 1800,
-            'gnosis': 720,
-            'optimism': 1800,
-            'celo': 720,
-            'fantom': 3600,
-            'moonbeam': 500,
-            'moonriver': 500,
-            'polygon-zkevm': 300,
-            'zksync-era': 720,
-            'linea': 300,
-            'scroll': 300,
-            'sonic': 1800,
-            'arbitrum-sepolia': 15000
-        }
+        # PromQL for blocks/hour per deployment, {selector} is replaced by the deployment
+        # matcher. Point it at a recording rule (e.g. 'deployment:bph{selector}') to
+        # avoid evaluating the rate on every run.
+        'blocks_per_hour_query': 'rate(deployment_head{selector}[10m]) * 3600',
+        'chain_blocks_per_hour': CHAIN_BLOCKS_PER_HOUR
     }
     
     if config_file.exists():
@@ -614,6 +954,9 @@ def get_config() -> Dict:
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
     
+    # Unknown networks default to 300 blocks/hour
+    config['chain_blocks_per_hour'] = defaultdict(lambda: 300, config['chain_blocks_per_hour'])
+    
     return config
 
 
@@ -628,26 +971,10 @@ def create_default_config():
         'network_subgraph_url': 'https://api.thegraph.com/subgraphs/name/graphprotocol/graph-network-arbitrum',
         'indexer_id': '0x...',
         'allocation_max_days': 28,
-        'chain_blocks_per_hour': {
-            'mainnet': 300,
-            'matic': 1800,
-            'arbitrum-one': 15000,
-            'base': 1800,
-            'bsc': 1200,
-            'avalanche': 1800,
-            'gnosis': 720,
-            'optimism': 1800,
-            'celo': 720,
-            'fantom': 3600,
-            'moonbeam': 500,
-            'moonriver': 500,
-            'polygon-zkevm': 300,
-            'zksync-era': 720,
-            'linea': 300,
-            'scroll': 300,
-            'sonic': 1800,
-            'arbitrum-sepolia': 15000
-        }
+        # {selector} is replaced by the deployment matcher, e.g. 'deployment:bph{selector}'
+        # for a recording rule
+        'blocks_per_hour_query': 'rate(deployment_head{selector}[10m]) * 3600',
+        'chain_blocks_per_hour': dict(CHAIN_BLOCKS_PER_HOUR)
     }
     
     with open(config_file, 'w') as f:
@@ -666,6 +993,7 @@ def format_blocks(blocks: int) -> str:
     return str(blocks)
 
 
+@lru_cache(maxsize=4096)
 def format_tokens(tokens: int) -> str:
     """Format token amount in GRT"""
     grt = tokens / 1e18
@@ -690,110 +1018,199 @@ def format_duration(seconds: float) -> str:
         return f"{days}d {hours}h"
 
 
-def check_other_indexers_status(
-    deployment_ipfs: str, 
-    our_head: int,
-    other_indexers: List[Dict],
-    cache: Cache
-) -> Tuple[int, int, Optional[int]]:
-    """Check status of other indexers for a deployment
-    Returns: (healthy_count, failed_count, common_fail_block)
+def _fetch_indexing_statuses(status_url: str, deployments: List[str]) -> List[Dict]:
+    """POST one indexingStatuses query for the given deployments, raises on failure"""
+    response = _session.post(
+        status_url,
+        json={
+            'query': '''
+            query($deployments: [String!]!) {
+                indexingStatuses(subgraphs: $deployments) {
+                    subgraph
+                    synced
+                    health
+                    fatalError { message block { number } }
+                    chains { latestBlock { number } chainHeadBlock { number } }
+                }
+            }
+            ''',
+            'variables': {'deployments': deployments}
+        },
+        timeout=10
+    )
+    response.raise_for_status()
+    data = json_loads(response.content)
+    if data.get('errors'):
+        raise ValueError(f"indexingStatuses errors: {data['errors']}")
+    return (data.get('data') or {}).get('indexingStatuses') or []
+
+
+def _probe_indexer(indexer_url: str, heads: Dict[str, int]) -> Dict[str, Dict]:
+    """Query an indexer's status endpoint for several deployments in one request
+    heads maps each deployment to our head block. Returns a cache entry per
+    deployment: {'latestBlock': n} plus one of healthy/failed/unknown.
+    If the batched request is rejected, each deployment is retried on its own
+    so one bad deployment does not hide the status of the others.
     """
-    healthy = 0
-    failed = 0
-    fail_blocks = []
+    results = {deployment: {'unknown': True} for deployment in heads}
+    status_url = f"{indexer_url}/status"
+    try:
+        statuses = _fetch_indexing_statuses(status_url, list(heads))
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        return results  # Unreachable, retrying per deployment would not help
+    except Exception:
+        if len(heads) == 1:
+            return results
+        statuses = []
+        for deployment in heads:
+            try:
+                statuses.extend(_fetch_indexing_statuses(status_url, [deployment]))
+            except Exception:
+                pass
     
-    for indexer in other_indexers:
-        indexer_url = indexer.get('url', '')
-        if not indexer_url:
+    for status in statuses:
+        deployment = status.get('subgraph')
+        if deployment not in heads:
             continue
+        health = status.get('health', '')
+        latest_block = 0
+        
+        chains = status.get('chains', [])
+        if chains:
+            latest_block = int(chains[0].get('latestBlock', {}).get('number', 0) or 0)
         
-        # Clean up URL
-        if not indexer_url.startswith('http'):
-            indexer_url = f"https://{indexer_url}"
-        indexer_url = indexer_url.rstrip('/')
+        result = {'latestBlock': latest_block}
         
-        # Check cache first
-        cache_key = f"status_{indexer['id']}_{deployment_ipfs}"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            if cached.get('healthy'):
+        if health == 'failed':
+            result['failed'] = True
+        elif health == 'healthy' and latest_block >= heads[deployment]:
+            # Only count as healthy if they're at or ahead of us
+            result['healthy'] = True
+        else:
+            # Behind us or unknown - don't count
+            result['unknown'] = True
+        results[deployment] = result
+    return results
+
+
+def check_other_indexers_status(
+    checks: List[Tuple[str, int, List[Dict]]],
+    cache: Cache
+) -> List[Tuple[int, int, Optional[int]]]:
+    """Check status of other indexers for several deployments
+    checks holds (deployment_ipfs, our_head, other_indexers) tuples
+    Returns one (healthy_count, failed_count, common_fail_block) per check
+    """
+    # Split cache hits from (indexer, deployment) pairs that need a request
+    results = [[] for _ in checks]
+    to_probe = {}  # indexer_url -> {deployment_ipfs: our_head}
+    # (indexer_url, deployment_ipfs) -> [(check_index, cache_key)]: indexer ids sharing
+    # a URL wait on the same request instead of each sending one
+    waiters = {}
+    pairs = []  # (check_index, indexer_url, deployment_ipfs, our_head, cache_key)
+    for n, (deployment_ipfs, our_head, other_indexers) in enumerate(checks):
+        for indexer in other_indexers:
+            indexer_url = indexer.get('url', '')
+            if not indexer_url:
+                continue
+            
+            # Clean up URL
+            if not indexer_url.startswith('http'):
+                indexer_url = f"https://{indexer_url}"
+            indexer_url = indexer_url.rstrip('/')
+            
+            cache_key = f"status_{indexer['id']}_{deployment_ipfs}"
+            pairs.append((n, indexer_url, deployment_ipfs, our_head, cache_key))
+    
+    # Check cache first, all keys in one lookup
+    cached = cache.get_many([pair[4] for pair in pairs])
+    for n, indexer_url, deployment_ipfs, our_head, cache_key in pairs:
+        if cache_key in cached:
+            results[n].append(cached[cache_key])
+        else:
+            to_probe.setdefault(indexer_url, {})[deployment_ipfs] = our_head
+            waiters.setdefault((indexer_url, deployment_ipfs), []).append((n, cache_key))
+    
+    # One request per indexer covering all its deployments, indexers queried concurrently
+    if to_probe:
+        items = list(to_probe.items())
+        with ThreadPoolExecutor(max_workers=min(STATUS_PROBE_WORKERS, len(items))) as executor:
+            probed = executor.map(lambda item: _probe_indexer(*item), items)
+            for (indexer_url, heads), statuses in zip(items, probed):
+                for deployment_ipfs in heads:
+                    for n, cache_key in waiters[(indexer_url, deployment_ipfs)]:
+                        cache.set(cache_key, statuses[deployment_ipfs])
+                        results[n].append(statuses[deployment_ipfs])
+    
+    summaries = []
+    for (_, our_head, _), check_results in zip(checks, results):
+        healthy = 0
+        failed = 0
+        fail_blocks = []
+        for result in check_results:
+            if result.get('healthy'):
                 # Only count as healthy if they're at or ahead of our block
-                if cached.get('latestBlock', 0) >= our_head:
+                if result.get('latestBlock', 0) >= our_head:
                     healthy += 1
                 else:
                     # They're behind us, don't count as healthy or failed
                     pass
-            elif cached.get('failed'):
+            elif result.get('failed'):
                 failed += 1
-                if cached.get('latestBlock'):
-                    fail_blocks.append(cached['latestBlock'])
-            continue
+                if result.get('latestBlock'):
+                    fail_blocks.append(result['latestBlock'])
         
-        # Query the indexer's status endpoint
-        status_url = f"{indexer_url}/status"
-        try:
-            response = requests.post(
-                status_url,
-                json={
-                    'query': '''
-                    query($deployment: String!) {
-                        indexingStatuses(subgraphs: [$deployment]) {
-                            synced
-                            health
-                            fatalError { message block { number } }
-                            chains { latestBlock { number } chainHeadBlock { number } }
-                        }
-                    }
-                    ''',
-                    'variables': {'deployment': deployment_ipfs}
-                },
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            statuses = data.get('data', {}).get('indexingStatuses', [])
-            if statuses:
-                status = statuses[0]
-                health = status.get('health', '')
-                latest_block = 0
-                
-                chains = status.get('chains', [])
-                if chains:
-                    latest_block = int(chains[0].get('latestBlock', {}).get('number', 0) or 0)
-                
-                result = {'latestBlock': latest_block}
-                
-                if health == 'failed':
-                    failed += 1
-                    result['failed'] = True
-                    if latest_block:
-                        fail_blocks.append(latest_block)
-                elif health == 'healthy' and latest_block >= our_head:
-                    # Only count as healthy if they're at or ahead of us
-                    healthy += 1
-                    result['healthy'] = True
-                else:
-                    # Behind us or unknown - don't count
-                    result['unknown'] = True
-                
-                cache.set(cache_key, result)
-            else:
-                cache.set(cache_key, {'unknown': True})
-        except:
-            cache.set(cache_key, {'unknown': True})
-    
-    # Determine common fail block (if all failures are at similar block)
-    common_fail_block = None
-    if fail_blocks:
-        # Check if all fail blocks are within 100 blocks of each other
-        min_block = min(fail_blocks)
-        max_block = max(fail_blocks)
-        if max_block - min_block < 100:
-            common_fail_block = min_block
-    
-    return healthy, failed, common_fail_block
+        # Determine common fail block (if all failures are at similar block)
+        common_fail_block = None
+        if fail_blocks:
+            # Check if all fail blocks are within 100 blocks of each other
+            min_block = min(fail_blocks)
+            max_block = max(fail_blocks)
+            if max_block - min_block < 100:
+                common_fail_block = min_block
+        
+        summaries.append((healthy, failed, common_fail_block))
+    
+    return summaries
+
+
+def add_other_indexers_status(
+    results: List[Dict],
+    network_client: NetworkSubgraphClient,
+    indexer_id: str,
+    cache: Cache
+):
+    """Fill in other indexers' status for failed deployments
+    All pending peer checks from check_deployment_health are resolved together:
+    other indexers are looked up in one network subgraph query, and each of them
+    is queried once for all the deployments it shares with us.
+    """
+    failed = [r for r in results if 'pendingPeerCheck' in r]
+    if not failed:
+        return
+    network_client.prefetch_other_indexers([r['info']['ipfsHash'] for r in failed], indexer_id)
+    
+    pending = []
+    checks = []
+    for result in failed:
+        check = result.pop('pendingPeerCheck')
+        ipfs_hash = result['info']['ipfsHash']
+        other_indexers = network_client.get_other_indexers_for_deployment(ipfs_hash, indexer_id)
+        if other_indexers:
+            pending.append(result)
+            checks.append((ipfs_hash, check['head'], other_indexers))
+    
+    summaries = check_other_indexers_status(checks, cache)
+    for result, (_, head, _), (healthy, failed, common_fail_block) in zip(pending, checks, summaries):
+        result['info']['othersHealthy'] = healthy > 0
+        result['info']['othersFailed'] = failed
+        result['info']['othersHealthyCount'] = healthy
+        result['info']['commonFailBlock'] = common_fail_block
+        
+        # Determine if it's at same block as others
+        if common_fail_block and head:
+            if abs(head - common_fail_block) < 100:
+                result['info']['sameBlockFailure'] = True
 
 
 def check_deployment_health(
@@ -801,20 +1218,23 @@ def check_deployment_health(
     prom_metrics: Dict,
     chain_heads: Dict[str, int],
     config: Dict,
-    network_client: NetworkSubgraphClient,
-    cache: Cache
+    now_ts: Optional[float] = None,
+    allocation_max_seconds: Optional[int] = None
 ) -> Dict:
-    """Check health of a single deployment"""
-    ipfs_hash = deployment.get('subgraphDeployment', {}).get('ipfsHash', '')
-    network = deployment.get('subgraphDeployment', {}).get('manifest', {}).get('network', '')
+    """Check health of a single deployment
+    now_ts and allocation_max_seconds can be computed once by the caller for a whole run
+    """
+    subgraph_deployment = deployment.get('subgraphDeployment') or {}
+    ipfs_hash = subgraph_deployment.get('ipfsHash', '')
+    network = (subgraph_deployment.get('manifest') or {}).get('network', '')
     allocated = int(deployment.get('allocatedTokens', 0))
     created_at = int(deployment.get('createdAt', 0))
     
     # Get subgraph ID for explorer links
-    versions = deployment.get('subgraphDeployment', {}).get('versions', [])
+    versions = subgraph_deployment.get('versions')
     subgraph_id = None
-    if versions and len(versions) > 0:
-        subgraph_id = versions[0].get('subgraph', {}).get('id')
+    if versions:
+        subgraph_id = (versions[0].get('subgraph') or {}).get('id')
     
     result = {
         'info': {
@@ -841,7 +1261,7 @@ def check_deployment_health(
     
     # Get chain head for this network
     chain_head = chain_heads.get(network) if network else None
-    expected_bph = config.get('chain_blocks_per_hour', {}).get(network, 300) if network else 300
+    expected_bph = config['chain_blocks_per_hour'][network] if network else 300
     
     # Calculate real gap
     gap = 0
@@ -861,28 +1281,8 @@ def check_deployment_health(
         })
         result['info']['blocksPerHour'] = blocks_per_hour
         
-        # Check other indexers
-        other_indexers = network_client.get_other_indexers_for_deployment(
-            ipfs_hash, 
-            config.get('indexer_id', '')
-        )
-        
-        if other_indexers:
-            healthy, failed, common_fail_block = check_other_indexers_status(
-                ipfs_hash, 
-                head or 0,
-                other_indexers,
-                cache
-            )
-            result['info']['othersHealthy'] = healthy > 0
-            result['info']['othersFailed'] = failed
-            result['info']['othersHealthyCount'] = healthy
-            result['info']['commonFailBlock'] = common_fail_block
-            
-            # Determine if it's at same block as others
-            if common_fail_block and head:
-                if abs(head - common_fail_block) < 100:
-                    result['info']['sameBlockFailure'] = True
+        # Other indexers are checked for all failed deployments at once by add_other_indexers_status
+        result['pendingPeerCheck'] = {'head': head or 0}
         
         return result
     
@@ -900,10 +1300,9 @@ def check_deployment_health(
     # Check for sync too slow
     if head and created_at and gap > 0:
         # Estimate remaining sync time
-        allocation_created = datetime.fromtimestamp(created_at)
-        allocation_max = timedelta(days=config.get('allocation_max_days', 28))
-        allocation_end = allocation_created + allocation_max
-        remaining_time = (allocation_end - datetime.now()).total_seconds()
+        if allocation_max_seconds is None:
+            allocation_max_seconds = config.get('allocation_max_days', 28) * 86400
+        remaining_time = created_at + allocation_max_seconds - (now_ts or time.time())
         
         result['info']['allocationRemaining'] = remaining_time
         
@@ -923,8 +1322,11 @@ def check_deployment_health(
     return result
 
 
-def print_item(result: Dict, history_manager: HistoryManager, ack_manager: AcknowledgementManager, show_ack: bool = False):
-    """Print a single health check result"""
+def print_item(result: Dict, history_manager: HistoryManager, acks: Dict,
+               write: Callable[[str], Any], show_ack: bool = False):
+    """Write a single health check result through write (e.g. a buffer's write)
+    acks holds the unexpired acknowledgements, from AcknowledgementManager.list_all()
+    """
     info = result.get('info', {})
     issues = result.get('issues', [])
     warnings = result.get('warnings', [])
@@ -939,7 +1341,7 @@ def print_item(result: Dict, history_manager: HistoryManager, ack_manager: Ackno
     duration_str = f" [{duration}]" if duration else ""
     
     # Check acknowledgement
-    ack = ack_manager.is_acknowledged(ipfs_hash)
+    ack = acks.get(ipfs_hash)
     ack_str = ""
     if ack:
         category = ack.get('category', 'wip')
@@ -952,7 +1354,7 @@ def print_item(result: Dict, history_manager: HistoryManager, ack_manager: Ackno
     # Format hash as clickable link
     hash_display = format_deployment_link(ipfs_hash, subgraph_id)
     
-    print(f"  {hash_display}{Colors.DIM}{duration_str}{Colors.RESET}{Colors.YELLOW}{ack_str}{Colors.RESET}")
+    write(f"  {hash_display}{Colors.DIM}{duration_str}{Colors.RESET}{Colors.YELLOW}{ack_str}{Colors.RESET}\n")
     
     # Build detail line
     details = [network, format_tokens(allocated)]
@@ -985,7 +1387,7 @@ def print_item(result: Dict, history_manager: HistoryManager, ack_manager: Ackno
         if common_block:
             details.append(f"@ block {common_block:,}")
     
-    print(f"    {' | '.join(details)}")
+    write(f"    {' | '.join(details)}\n")
 
 
 def main():
@@ -1063,12 +1465,22 @@ def main():
         print("No active allocations found")
         return
     
-    # Get all Prometheus metrics at once
-    prom_metrics = prom.get_all_deployment_metrics()
-    chain_heads = prom.get_all_chain_heads()
-    
-    # Get blocks per hour using rate of deployment_head change (more accurate for sync estimation)
-    bph_results = prom.query('rate(deployment_head[10m]) * 3600')
+    # Get Prometheus metrics for our allocated deployments only
+    deployments = sorted({
+        a['subgraphDeployment']['ipfsHash'] for a in allocations
+        if a.get('subgraphDeployment', {}).get('ipfsHash')
+    })
+    # The Prometheus queries are independent, run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        metrics_future = executor.submit(prom.get_all_deployment_metrics, deployments)
+        chain_heads_future = executor.submit(prom.get_all_chain_heads)
+        # Get blocks per hour using rate of deployment_head change (more accurate for sync estimation)
+        bph_future = executor.submit(
+            prom.query_deployments, config['blocks_per_hour_query'], deployments
+        )
+        prom_metrics = metrics_future.result()
+        chain_heads = chain_heads_future.result()
+        bph_results = bph_future.result()
     if bph_results:
         for r in bph_results:
             dep = r.get('metric', {}).get('deployment', '')
@@ -1079,10 +1491,13 @@ def main():
                     pass
     
     # Check each allocation
+    now_ts = time.time()
+    allocation_max_seconds = config.get('allocation_max_days', 28) * 86400
     results = []
     for alloc in allocations:
-        result = check_deployment_health(alloc, prom_metrics, chain_heads, config, network_client, cache)
+        result = check_deployment_health(alloc, prom_metrics, chain_heads, config, now_ts, allocation_max_seconds)
         results.append(result)
+    add_other_indexers_status(results, network_client, config.get('indexer_id', ''), cache)
     
     # Record run and get changes
     changes = history_manager.record_run(results)
@@ -1098,6 +1513,9 @@ def main():
     no_metrics = []
     acknowledged_count = 0
     
+    # Expired acknowledgements are dropped once here, then looked up per result
+    acks = ack_manager.list_all()
+    
     for result in results:
         info = result.get('info', {})
         issues = result.get('issues', [])
@@ -1105,7 +1523,7 @@ def main():
         ipfs_hash = info.get('ipfsHash', '')
         
         # Check if acknowledged
-        is_acked = ack_manager.is_acknowledged(ipfs_hash)
+        is_acked = acks.get(ipfs_hash)
         if is_acked and not args.show_ack:
             acknowledged_count += 1
             continue
@@ -1115,13 +1533,14 @@ def main():
         elif 'No Prometheus metrics found' in warnings:
             no_metrics.append(result)
         else:
-            issue_types = [i.get('type') for i in issues]
+            issue_types = {i.get('type') for i in issues}
             if 'error' in issue_types:
-                if info.get('othersHealthy') == True:
+                others_healthy = info.get('othersHealthy')
+                if others_healthy == True:
                     failed_our_issue.append(result)
                 elif info.get('sameBlockFailure'):
                     failed_same_block.append(result)
-                elif info.get('othersHealthy') == False:
+                elif others_healthy == False:
                     failed_subgraph.append(result)
                 else:
                     failed_unknown.append(result)
@@ -1130,97 +1549,103 @@ def main():
             elif 'gap_growing' in issue_types:
                 gap_growing.append(result)
     
+    # The report is built in memory and written to stdout in one call
+    report = io.StringIO()
+    w = report.write
+    
     # Print summary
-    print(f"\n\n{Colors.BOLD}Subgraph Health Report{Colors.RESET}")
-    print("=" * 70)
+    w(f"\n\n{Colors.BOLD}Subgraph Health Report{Colors.RESET}\n")
+    w("=" * 70 + "\n")
     
     total_issues = (len(failed_our_issue) + len(failed_same_block) + len(failed_subgraph) + 
                    len(failed_unknown) + len(sync_too_slow) + len(gap_growing) + len(no_metrics))
     
-    print(f"  {Colors.GREEN}Healthy: {len(healthy)}{Colors.RESET}")
+    w(f"  {Colors.GREEN}Healthy: {len(healthy)}{Colors.RESET}\n")
     if failed_our_issue or failed_same_block or failed_subgraph or failed_unknown:
         failed_total = len(failed_our_issue) + len(failed_same_block) + len(failed_subgraph) + len(failed_unknown)
-        print(f"  {Colors.RED}Indexing Failed: {failed_total}{Colors.RESET}")
+        w(f"  {Colors.RED}Indexing Failed: {failed_total}{Colors.RESET}\n")
     if sync_too_slow:
-        print(f"  {Colors.RED}Sync Too Slow: {len(sync_too_slow)}{Colors.RESET}")
+        w(f"  {Colors.RED}Sync Too Slow: {len(sync_too_slow)}{Colors.RESET}\n")
     if gap_growing:
-        print(f"  {Colors.YELLOW}Gap Growing: {len(gap_growing)}{Colors.RESET}")
+        w(f"  {Colors.YELLOW}Gap Growing: {len(gap_growing)}{Colors.RESET}\n")
     if no_metrics:
-        print(f"  {Colors.YELLOW}No Metrics: {len(no_metrics)}{Colors.RESET}")
+        w(f"  {Colors.YELLOW}No Metrics: {len(no_metrics)}{Colors.RESET}\n")
     if acknowledged_count > 0:
-        print(f"  {Colors.DIM}(includes {acknowledged_count} acknowledged){Colors.RESET}")
+        w(f"  {Colors.DIM}(includes {acknowledged_count} acknowledged){Colors.RESET}\n")
     
     # Print changes
     new_issues = changes.get('new', [])
     resolved_issues = changes.get('resolved', [])
     
     if new_issues or resolved_issues:
-        print(f"\n{Colors.BOLD}Changes since last run:{Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.BOLD}Changes since last run:{Colors.RESET}\n")
+        w("-" * 70 + "\n")
         
         if resolved_issues:
-            print(f"  {Colors.GREEN}✓ {len(resolved_issues)} resolved:{Colors.RESET}")
+            w(f"  {Colors.GREEN}✓ {len(resolved_issues)} resolved:{Colors.RESET}\n")
             for issue in resolved_issues[:10]:  # Limit to 10
                 duration = issue.get('duration', '?')
-                print(f"    {issue['ipfsHash']} (was failing for {duration})")
+                w(f"    {issue['ipfsHash']} (was failing for {duration})\n")
             if len(resolved_issues) > 10:
-                print(f"    ... and {len(resolved_issues) - 10} more")
+                w(f"    ... and {len(resolved_issues) - 10} more\n")
         
         if new_issues:
-            print(f"  {Colors.RED}✗ {len(new_issues)} new issues:{Colors.RESET}")
+            w(f"  {Colors.RED}✗ {len(new_issues)} new issues:{Colors.RESET}\n")
             for issue in new_issues[:20]:  # Limit to 20
                 issue_type = issue.get('type', 'unknown').replace('_', ' ')
-                print(f"    {issue['ipfsHash']} ({issue_type})")
+                w(f"    {issue['ipfsHash']} ({issue_type})\n")
             if len(new_issues) > 20:
-                print(f"    ... and {len(new_issues) - 20} more")
-        print()
+                w(f"    ... and {len(new_issues) - 20} more\n")
+        w("\n")
     
     # Print detailed sections
     if failed_our_issue:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - OUR ISSUE ({len(failed_our_issue)}){Colors.RESET}")
-        print(f"  {Colors.DIM}(Other indexers are healthy - problem is on our side){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - OUR ISSUE ({len(failed_our_issue)}){Colors.RESET}\n")
+        w(f"  {Colors.DIM}(Other indexers are healthy - problem is on our side){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in failed_our_issue:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if failed_same_block:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - SUBGRAPH ISSUE (same block) ({len(failed_same_block)}){Colors.RESET}")
-        print(f"  {Colors.DIM}(All indexers failing at the same block - definite subgraph bug){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - SUBGRAPH ISSUE (same block) ({len(failed_same_block)}){Colors.RESET}\n")
+        w(f"  {Colors.DIM}(All indexers failing at the same block - definite subgraph bug){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in failed_same_block:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if failed_subgraph:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - SUBGRAPH ISSUE ({len(failed_subgraph)}){Colors.RESET}")
-        print(f"  {Colors.DIM}(All indexers failing - likely a subgraph problem){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - SUBGRAPH ISSUE ({len(failed_subgraph)}){Colors.RESET}\n")
+        w(f"  {Colors.DIM}(All indexers failing - likely a subgraph problem){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in failed_subgraph:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if failed_unknown:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - UNKNOWN ({len(failed_unknown)}){Colors.RESET}")
-        print(f"  {Colors.DIM}(Could not check other indexers){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.RED}{Colors.BOLD}✗ INDEXING FAILED - UNKNOWN ({len(failed_unknown)}){Colors.RESET}\n")
+        w(f"  {Colors.DIM}(Could not check other indexers){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in failed_unknown:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if sync_too_slow:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ SYNC TOO SLOW ({len(sync_too_slow)}){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.RED}{Colors.BOLD}✗ SYNC TOO SLOW ({len(sync_too_slow)}){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in sync_too_slow:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if gap_growing:
-        print(f"\n{Colors.YELLOW}{Colors.BOLD}⚠ GAP GROWING ({len(gap_growing)}){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.YELLOW}{Colors.BOLD}⚠ GAP GROWING ({len(gap_growing)}){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in gap_growing:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
     
     if no_metrics:
-        print(f"\n{Colors.YELLOW}{Colors.BOLD}⚠ NO METRICS ({len(no_metrics)}){Colors.RESET}")
-        print("-" * 70)
+        w(f"\n{Colors.YELLOW}{Colors.BOLD}⚠ NO METRICS ({len(no_metrics)}){Colors.RESET}\n")
+        w("-" * 70 + "\n")
         for result in no_metrics:
-            print_item(result, history_manager, ack_manager, args.show_ack)
+            print_item(result, history_manager, acks, w, args.show_ack)
+    
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == '__main__':
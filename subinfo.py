@@ -79,9 +79,9 @@ def get_current_block_number(rpc_url: Optional[str] = None) -> Optional[int]:
 class AnalyticsClient:
     """Client to query The Graph Analytics subgraph"""
     
-    def __init__(self, analytics_subgraph_url: str):
+    def __init__(self, analytics_subgraph_url: str, session: Optional[requests.Session] = None):
         self.analytics_subgraph_url = analytics_subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
     
     def query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query"""
@@ -225,12 +225,14 @@ class AnalyticsClient:
 class TheGraphClient:
     """Client to query TheGraph Network subgraph"""
     
-    def __init__(self, subgraph_url: str):
+    def __init__(self, subgraph_url: str, session: Optional[requests.Session] = None):
         # The subgraph URL is directly the GraphQL endpoint
         self.subgraph_url = subgraph_url.rstrip('/')
-        self._session = requests.Session()
+        self._session = session or requests.Session()
         self._cache_file = Path.home() / '.grtinfo' / 'network_totals_cache.json'
         self._cache_duration = 3600  # Cache valid for 1 hour
+        self._deployment_id_cache: Dict[str, str] = {}  # ipfsHash -> deployment ID
+        self._bundle: Optional[Dict] = None  # set by fetch_subgraph_bundle
     
     def is_network_subgraph(self) -> bool:
         """Check if this subgraph is the TheGraph Network subgraph"""
@@ -300,30 +302,171 @@ class TheGraphClient:
             pass
         return None
     
+    def _resolve_deployment_id(self, subgraph_id: str) -> Optional[str]:
+        """Resolve an IPFS hash to its deployment ID (cached per client)"""
+        if subgraph_id.startswith('0x'):
+            return subgraph_id
+        if subgraph_id in self._deployment_id_cache:
+            return self._deployment_id_cache[subgraph_id]
+        
+        # Search for subgraphDeployment by its IPFS hash
+        deployment_query = """
+        query FindSubgraphDeployment($ipfsHash: String!) {
+            subgraphDeployments(
+                where: { ipfsHash: $ipfsHash }
+                first: 1
+            ) {
+                id
+            }
+        }
+        """
+        try:
+            deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
+            deployments = deployment_result.get('subgraphDeployments', [])
+            if not deployments:
+                return None
+        except Exception:
+            return None
+        self._deployment_id_cache[subgraph_id] = deployments[0]['id']
+        return deployments[0]['id']
+    
+    def fetch_subgraph_bundle(self, subgraph_id: str, hours: int = 48) -> Optional[Dict]:
+        """Fetch deployment, allocations, POIs and first signals page in one request
+        
+        The result is kept on the client so get_subgraph_metadata, get_curation_signal,
+        get_current_allocations, get_allocation_history, get_unallocations and
+        get_poi_submissions answer from it instead of issuing their own queries.
+        """
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return None
+        cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
+        
+        # Inline values (BigInt variables are problematic), one aliased root field per method
+        query = f"""
+        {{
+            deployment: subgraphDeployment(id: "{deployment_id}") {{
+                id
+                ipfsHash
+                signalledTokens
+                createdAt
+                stakedTokens
+                deniedAt
+                indexingRewardAmount
+                manifest {{
+                    network
+                }}
+            }}
+            currentAllocations: allocations(
+                where: {{ subgraphDeployment: "{deployment_id}", status: Active }}
+                orderBy: createdAt
+                orderDirection: desc
+            ) {{
+                id
+                indexer {{
+                    id
+                }}
+                allocatedTokens
+                createdAt
+                closedAt
+                status
+                indexingRewards
+                indexingIndexerRewards
+                indexingDelegatorRewards
+            }}
+            createdAllocations: allocations(
+                where: {{ subgraphDeployment: "{deployment_id}", createdAt_gte: {cutoff_time} }}
+                orderBy: createdAt
+                orderDirection: desc
+            ) {{
+                id
+                indexer {{
+                    id
+                }}
+                allocatedTokens
+                createdAt
+                closedAt
+                status
+            }}
+            closedAllocations: allocations(
+                where: {{ subgraphDeployment: "{deployment_id}", status: Closed, closedAt_gte: {cutoff_time} }}
+                orderBy: closedAt
+                orderDirection: desc
+            ) {{
+                id
+                indexer {{
+                    id
+                }}
+                allocatedTokens
+                createdAt
+                closedAt
+                status
+                indexingRewards
+            }}
+            poiSubmissions(
+                where: {{
+                    allocation_: {{ subgraphDeployment: "{deployment_id}" }}
+                    presentedAtTimestamp_gte: {cutoff_time}
+                }}
+                orderBy: presentedAtTimestamp
+                orderDirection: desc
+            ) {{
+                id
+                presentedAtTimestamp
+                poi
+                allocation {{
+                    id
+                    status
+                    indexer {{
+                        id
+                    }}
+                    allocatedTokens
+                    indexingRewards
+                    createdAt
+                }}
+            }}
+            signals(
+                where: {{ subgraphDeployment: "{deployment_id}" }}
+                first: 1000
+                orderBy: createdAt
+                orderDirection: desc
+            ) {{
+                id
+                signaller {{
+                    id
+                }}
+                signalledTokens
+                createdAt
+            }}
+        }}
+        """
+        try:
+            data = self.query(query)
+        except Exception as e:
+            # Callers fall back to their individual queries
+            log.debug(f"Error fetching subgraph bundle: {e}")
+            return None
+        self._bundle = {'deploymentId': deployment_id, 'hours': hours, 'data': data}
+        return data
+    
+    def _bundle_for(self, deployment_id: str, hours: Optional[int] = None) -> Optional[Dict]:
+        """Return the prefetched bundle if it matches deployment_id (and hours when given)"""
+        bundle = self._bundle
+        if not bundle or bundle['deploymentId'] != deployment_id:
+            return None
+        if hours is not None and bundle['hours'] != hours:
+            return None
+        return bundle['data']
+    
     def get_current_allocations(self, subgraph_id: str) -> List[Dict]:
         """Get current allocations for a subgraph"""
-        # First find the deployment ID if it's an IPFS hash
-        deployment_id = subgraph_id
-        if not deployment_id.startswith('0x'):
-            # Search for subgraphDeployment by its IPFS hash
-            deployment_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                }
-            }
-            """
-            try:
-                deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
-                deployments = deployment_result.get('subgraphDeployments', [])
-                if not deployments:
-                    return []
-                deployment_id = deployments[0]['id']
-            except:
-                return []
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return []
+        
+        bundle = self._bundle_for(deployment_id)
+        if bundle is not None:
+            return bundle.get('currentAllocations', [])
         
         # Now search for allocations with the deployment ID
         query = """
@@ -357,27 +500,13 @@ class TheGraphClient:
         """Get allocation history (created) for the last N hours"""
         cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
         
-        # First find the deployment ID if necessary
-        deployment_id = subgraph_id
-        if not deployment_id.startswith('0x'):
-            deployment_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                }
-            }
-            """
-            try:
-                deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
-                deployments = deployment_result.get('subgraphDeployments', [])
-                if not deployments:
-                    return []
-                deployment_id = deployments[0]['id']
-            except Exception as e:
-                return []
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return []
+        
+        bundle = self._bundle_for(deployment_id, hours)
+        if bundle is not None:
+            return bundle.get('createdAllocations', [])
         
         # Utiliser une query inline car les variables BigInt posent problème
         query = f"""
@@ -411,27 +540,13 @@ class TheGraphClient:
         """Get unallocations (closed allocations) for the last N hours"""
         cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
         
-        # First find the deployment ID if necessary
-        deployment_id = subgraph_id
-        if not deployment_id.startswith('0x'):
-            deployment_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                }
-            }
-            """
-            try:
-                deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
-                deployments = deployment_result.get('subgraphDeployments', [])
-                if not deployments:
-                    return []
-                deployment_id = deployments[0]['id']
-            except Exception as e:
-                return []
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return []
+        
+        bundle = self._bundle_for(deployment_id, hours)
+        if bundle is not None:
+            return bundle.get('closedAllocations', [])
         
         # Search for closed allocations in the period
         query = f"""
@@ -467,27 +582,13 @@ class TheGraphClient:
         """Get POI submissions (reward collections) for the last N hours"""
         cutoff_time = int((datetime.now() - timedelta(hours=hours)).timestamp())
         
-        # First find the deployment ID if necessary
-        deployment_id = subgraph_id
-        if not deployment_id.startswith('0x'):
-            deployment_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                }
-            }
-            """
-            try:
-                deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
-                deployments = deployment_result.get('subgraphDeployments', [])
-                if not deployments:
-                    return []
-                deployment_id = deployments[0]['id']
-            except Exception as e:
-                return []
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return []
+        
+        bundle = self._bundle_for(deployment_id, hours)
+        if bundle is not None:
+            return bundle.get('poiSubmissions', [])
         
         # Search for POI submissions in the period
         query = f"""
@@ -601,27 +702,9 @@ class TheGraphClient:
     
     def get_subgraph_metadata(self, subgraph_id: str) -> Optional[Dict]:
         """Get subgraph deployment metadata including network, grafting, and reward proportion"""
-        # First find the deployment ID if it's an IPFS hash
-        deployment_id = subgraph_id
-        if not deployment_id.startswith('0x'):
-            deployment_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                }
-            }
-            """
-            try:
-                deployment_result = self.query(deployment_query, {'ipfsHash': subgraph_id})
-                deployments = deployment_result.get('subgraphDeployments', [])
-                if not deployments:
-                    return None
-                deployment_id = deployments[0]['id']
-            except:
-                return None
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return None
         
         # Query metadata
         query = """
@@ -640,8 +723,12 @@ class TheGraphClient:
             }
         }
         """
-        result = self.query(query, {'deploymentId': deployment_id})
-        deployment = result.get('subgraphDeployment')
+        bundle = self._bundle_for(deployment_id)
+        if bundle is not None:
+            deployment = bundle.get('deployment')
+        else:
+            result = self.query(query, {'deploymentId': deployment_id})
+            deployment = result.get('subgraphDeployment')
         
         if not deployment:
             return None
@@ -769,7 +856,10 @@ class TheGraphClient:
     
     def get_curation_signal(self, subgraph_id: str) -> Optional[Dict]:
         """Get current curation signal and check if it's a new deployment"""
-        # Try first with subgraphDeployment
+        deployment_id = self._resolve_deployment_id(subgraph_id)
+        if not deployment_id:
+            return None
+        
         query = """
         query GetCurationSignal($subgraphId: String!) {
             subgraphDeployment(id: $subgraphId) {
@@ -779,30 +869,12 @@ class TheGraphClient:
             }
         }
         """
-        result = self.query(query, {'subgraphId': subgraph_id})
-        deployment = result.get('subgraphDeployment')
-        
-        # If not found, search by IPFS hash
-        if not deployment:
-            find_query = """
-            query FindSubgraphDeployment($ipfsHash: String!) {
-                subgraphDeployments(
-                    where: { ipfsHash: $ipfsHash }
-                    first: 1
-                ) {
-                    id
-                    signalledTokens
-                    createdAt
-                }
-            }
-            """
-            try:
-                find_result = self.query(find_query, {'ipfsHash': subgraph_id})
-                deployments = find_result.get('subgraphDeployments', [])
-                if deployments:
-                    deployment = deployments[0]
-            except:
-                pass
+        bundle = self._bundle_for(deployment_id)
+        if bundle is not None:
+            deployment = bundle.get('deployment')
+        else:
+            result = self.query(query, {'subgraphId': deployment_id})
+            deployment = result.get('subgraphDeployment')
         
         if not deployment:
             return None
@@ -819,8 +891,15 @@ class TheGraphClient:
         all_signals = []
         skip = 0
         batch_size = 1000
+        more = True
+        
+        # The first page comes with the prefetched bundle
+        if bundle is not None and 'signals' in bundle:
+            all_signals = list(bundle['signals'])
+            skip = len(all_signals)
+            more = skip == batch_size
         
-        while True:
+        while more:
             signals_query = """
             query GetSignals($deploymentId: String!, $skip: Int!) {
                 signals(
@@ -907,6 +986,7 @@ class TheGraphClient:
                 deployments = find_result.get('subgraphDeployments', [])
                 if deployments:
                     old_deployment_id = deployments[0]['id']
+                    self._deployment_id_cache[subgraph_id] = old_deployment_id
                     versions = deployments[0].get('versions', [])
                     if versions:
                         subgraph = versions[0].get('subgraph', {})
@@ -1263,7 +1343,7 @@ def print_allocations(allocations: List[Dict], title: str, my_indexer_id: Option
         url = indexer_urls.get(indexer_id.lower()) if indexer_urls and not ens_name else None
         indexer_display = format_indexer_display(indexer_id, ens_name, url)
         
-        created = format_timestamp(str(alloc.get('createdAt', '0')))[:16]  # YYYY-MM-DD HH:MM
+        created = format_timestamp(alloc.get('createdAt', '0'))[:16]  # YYYY-MM-DD HH:MM
         status = alloc.get('status', 'Active')
         status_color = Colors.BRIGHT_GREEN if status == 'Active' else Colors.DIM
         tokens_str = format_tokens(tokens)
@@ -1299,7 +1379,7 @@ def print_allocations(allocations: List[Dict], title: str, my_indexer_id: Option
         tokens_padding = max(0, 17 - tokens_str_width)
         
         if alloc.get('closedAt'):
-            closed = format_timestamp(str(alloc.get('closedAt', '0')))[:16]
+            closed = format_timestamp(alloc.get('closedAt', '0'))[:16]
             print(f"  {marker}{' ' * marker_padding}  {indexer_color}{indexer_display}{' ' * indexer_padding}{Colors.RESET}  {Colors.BRIGHT_GREEN}{' ' * tokens_padding}{tokens_str}{Colors.RESET}  {Colors.DIM}{created}{Colors.RESET}  {status_color}{status}{Colors.RESET}")
         else:
             print(f"  {marker}{' ' * marker_padding}  {indexer_color}{indexer_display}{' ' * indexer_padding}{Colors.RESET}  {Colors.BRIGHT_GREEN}{' ' * tokens_padding}{tokens_str}{Colors.RESET}  {Colors.DIM}{created}{Colors.RESET}  {status_color}{status}{Colors.RESET}{Colors.DIM}{duration_str}{Colors.RESET}{sync_indicator}")
@@ -1355,6 +1435,13 @@ def print_sync_status_summary(allocations: List[Dict], sync_statuses: Dict, ens_
     failed = []
     unknown = []
     
+    # Resolve ENS names in batch
+    ens_names = {}
+    if ens_client:
+        ens_names = ens_client.resolve_addresses_batch(
+            [alloc.get('indexer', {}).get('id', '') for alloc in allocations]
+        )
+    
     for alloc in allocations:
         indexer = alloc.get('indexer', {})
         indexer_id = indexer.get('id', '')
@@ -1364,9 +1451,7 @@ def print_sync_status_summary(allocations: List[Dict], sync_statuses: Dict, ens_
             continue
         
         # Get display name
-        ens_name = None
-        if ens_client:
-            ens_name = ens_client.resolve_address(indexer_id)
+        ens_name = ens_names.get(indexer_id.lower())
         display_name = ens_name if ens_name else f"{indexer_id[:10]}.."
         
         health = status.get('health', '')
@@ -1493,7 +1578,7 @@ def print_allocations_timeline(allocations: List[Dict], unallocations: List[Dict
         
         tokens = event['tokens']
         amount = float(tokens) / 1e18
-        timestamp = format_timestamp(str(event['timestamp']))[:16]
+        timestamp = format_timestamp(event['timestamp'])[:16]
         tokens_str = format_tokens(tokens)
         
         # Determine symbol and color based on event type
@@ -1526,7 +1611,7 @@ def print_allocations_timeline(allocations: List[Dict], unallocations: List[Dict
         
         if event['type'] == 'allocation':
             if event.get('closedAt'):
-                closed = format_timestamp(str(event['closedAt']))[:16]
+                closed = format_timestamp(event['closedAt'])[:16]
                 print(f"  [{symbol}]{' ' * symbol_padding} {marker}{' ' * marker_padding}  {Colors.DIM}{timestamp}{Colors.RESET}  {indexer_color}{indexer_display}{' ' * indexer_padding}{Colors.RESET}  {Colors.BRIGHT_GREEN}{' ' * tokens_padding}{tokens_str}{Colors.RESET}  {status_color}{status}{Colors.RESET} → closed {Colors.DIM}{closed}{Colors.RESET}")
             else:
                 print(f"  [{symbol}]{' ' * symbol_padding} {marker}{' ' * marker_padding}  {Colors.DIM}{timestamp}{Colors.RESET}  {indexer_color}{indexer_display}{' ' * indexer_padding}{Colors.RESET}  {Colors.BRIGHT_GREEN}{' ' * tokens_padding}{tokens_str}{Colors.RESET}  {status_color}{status}{Colors.RESET}")
@@ -1536,7 +1621,7 @@ def print_allocations_timeline(allocations: List[Dict], unallocations: List[Dict
             rewards_str = f"{rewards:,.2f} GRT collected"
             print(f"  [{symbol}]{' ' * symbol_padding} {marker}{' ' * marker_padding}  {Colors.DIM}{timestamp}{Colors.RESET}  {indexer_color}{indexer_display}{' ' * indexer_padding}{Colors.RESET}  {Colors.BRIGHT_CYAN}{' ' * tokens_padding}{tokens_str}{Colors.RESET}  {status_color}{rewards_str}{Colors.RESET}")
         else:  # unallocation
-            created = format_timestamp(str(event.get('createdAt', '0')))[:16]
+            created = format_timestamp(event.get('createdAt', '0'))[:16]
             # Show rewards collected at close
             rewards = event.get('rewards', 0) / 1e18
             rewards_info = f" → {Colors.BRIGHT_CYAN}{rewards:,.2f} GRT{Colors.RESET}" if rewards > 0 else ""
@@ -1566,7 +1651,7 @@ def print_curation_signal(signal_data: Optional[Dict]):
     if signal_data.get('isNewDeployment'):
         deployment_created_at = signal_data.get('deploymentCreatedAt')
         if deployment_created_at:
-            created_date = format_timestamp(str(deployment_created_at))[:16]
+            created_date = format_timestamp(deployment_created_at)[:16]
             print(f"{Colors.BRIGHT_YELLOW}⚠️  New deployment{Colors.RESET} (created {Colors.DIM}{created_date}{Colors.RESET})")
     
     signals = signal_data.get('signals', [])
@@ -1590,7 +1675,7 @@ def print_signal_changes(changes: List[Dict], hours: int = 48):
         amount = float(tokens) / 1e18
         signaller = change.get('signaller', 'Unknown')
         signaller_short = signaller[:10] + "..." if len(signaller) > 10 else signaller
-        timestamp = format_timestamp(str(change.get('timestamp', '0')))[:16]
+        timestamp = format_timestamp(change.get('timestamp', '0'))[:16]
         
         if change_type == 'upgrade_out':
             # Signal was transferred OUT to a new deployment (loss for this deployment)
@@ -1728,8 +1813,11 @@ Example:
     # But we can also have just the base URL if the network is directly accessible
     # For now, we use the URL as is since it should point to the network subgraph
     
+    # One HTTP session for all clients, so connections are reused across them
+    session = requests.Session()
+    
     # Create client to query network subgraph
-    client = TheGraphClient(network_url)
+    client = TheGraphClient(network_url, session=session)
     
     # Get subgraph ID for explorer link
     subgraph_id = client.get_subgraph_id(args.subgraph_hash)
@@ -1757,7 +1845,7 @@ Example:
     ens_url = get_ens_subgraph_url()
     if ens_url:
         try:
-            ens_client = ENSClient(ens_url)
+            ens_client = ENSClient(ens_url, session=session)
         except Exception as e:
             print(f"{Colors.DIM}Warning: Unable to initialize ENS client: {e}{Colors.RESET}\n", file=sys.stderr)
     
@@ -1766,7 +1854,7 @@ Example:
     analytics_url = get_analytics_subgraph_url()
     if analytics_url:
         try:
-            analytics_client = AnalyticsClient(analytics_url)
+            analytics_client = AnalyticsClient(analytics_url, session=session)
         except Exception as e:
             log.debug(f"Unable to initialize Analytics client: {e}")
     
@@ -1775,6 +1863,9 @@ Example:
     sync_context = None
     
     try:
+        # Prefetch metadata, allocations, POIs and signals in a single request
+        client.fetch_subgraph_bundle(args.subgraph_hash, args.hours)
+        
         # 1. Subgraph metadata
         subgraph_metadata = client.get_subgraph_metadata(args.subgraph_hash)
         print_subgraph_metadata(subgraph_metadata)
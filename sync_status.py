@@ -3,7 +3,7 @@
 Shared module for querying indexer sync status from Graph Node /status endpoints
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 import requests
 
 
@@ -16,11 +16,46 @@ class Colors:
     BRIGHT_YELLOW = '\033[93m'
 
 
+# Status query for every deployment on the indexer
+ALL_STATUSES_QUERY = '''
+{
+    indexingStatuses {
+        subgraph
+        synced
+        health
+        fatalError { message }
+        chains { 
+            network
+            latestBlock { number } 
+            chainHeadBlock { number } 
+        }
+    }
+}
+'''
+
+# Status query restricted to the given deployment hashes
+DEPLOYMENTS_STATUSES_QUERY = '''
+query($subgraphs: [String!]!) {
+    indexingStatuses(subgraphs: $subgraphs) {
+        subgraph
+        synced
+        health
+        fatalError { message }
+        chains { 
+            network
+            latestBlock { number } 
+            chainHeadBlock { number } 
+        }
+    }
+}
+'''
+
+
 class IndexerStatusClient:
     """Client to query indexer status endpoints for sync information"""
     
-    def __init__(self, timeout: int = 15):
-        self._session = requests.Session()
+    def __init__(self, timeout: int = 15, session: Optional[requests.Session] = None):
+        self._session = session or requests.Session()
         self._timeout = timeout
         self.last_error = None
         self.last_url = None
@@ -60,6 +95,34 @@ class IndexerStatusClient:
         
         On error, sets self.last_error with error details
         """
+        return self._query_statuses(indexer_url, ALL_STATUSES_QUERY)
+    
+    def get_deployments_status(self, indexer_url: str, deployment_hashes: Iterable[str]) -> Dict[str, Dict]:
+        """Get sync status for a subset of deployments from an indexer's status endpoint
+        
+        Only the requested deployments are fetched, which keeps the response small
+        for indexers serving hundreds of subgraphs. Falls back to fetching all
+        deployments if the endpoint rejects the subgraphs filter.
+        
+        Returns: same format as get_all_deployments_status, limited to the
+        requested hashes. On error, sets self.last_error with error details
+        """
+        hashes = sorted({h for h in deployment_hashes if h})
+        if not hashes:
+            self.last_error = None
+            return {}
+        
+        result = self._query_statuses(indexer_url, DEPLOYMENTS_STATUSES_QUERY, {'subgraphs': hashes})
+        if not result and self.last_error and self.last_error.startswith('GraphQL error'):
+            wanted = set(hashes)
+            result = {
+                h: status for h, status in self.get_all_deployments_status(indexer_url).items()
+                if h in wanted
+            }
+        return result
+    
+    def _query_statuses(self, indexer_url: str, query: str, variables: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Post an indexingStatuses query to an indexer's status endpoint and parse the result"""
         self.last_error = None
         self.last_url = None
         
@@ -73,26 +136,14 @@ class IndexerStatusClient:
         status_url = f"{indexer_url.rstrip('/')}/status"
         self.last_url = status_url
         
+        payload = {'query': query}
+        if variables:
+            payload['variables'] = variables
+        
         try:
             response = self._session.post(
                 status_url,
-                json={
-                    'query': '''
-                    {
-                        indexingStatuses {
-                            subgraph
-                            synced
-                            health
-                            fatalError { message }
-                            chains { 
-                                network
-                                latestBlock { number } 
-                                chainHeadBlock { number } 
-                            }
-                        }
-                    }
-                    '''
-                },
+                json=payload,
                 timeout=self._timeout
             )
             response.raise_for_status()
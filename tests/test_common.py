@@ -12,8 +12,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common import (
     Colors, terminal_link, format_deployment_link,
-    format_tokens, format_tokens_short, format_percentage,
-    format_timestamp, format_duration, strip_ansi, get_display_width
+    format_tokens, format_tokens_short, format_tokens_int, wei_to_grt, format_percentage,
+    format_timestamp, format_duration, strip_ansi, get_display_width, json_loads, json_dumps
 )
 
 
@@ -49,6 +49,25 @@ class TestFormatTokens:
         result = format_tokens_short('1000000000000000000000000')  # 1M GRT
         assert 'M' in result or '1000000' in result or '1,000,000' in result
 
+    def test_format_tokens_int_zero(self):
+        assert format_tokens_int(0) == '0'
+    
+    def test_format_tokens_int_rounds_to_whole_grt(self):
+        assert format_tokens_int(1_499_999_999_999_999_999) == '1'
+        assert format_tokens_int(1_500_000_000_000_000_000) == '2'
+    
+    def test_format_tokens_int_keeps_precision(self):
+        # 123,456,789,012,345,678 GRT is far beyond float's exact integer range
+        wei = 123_456_789_012_345_678 * 10**18
+        assert format_tokens_int(wei) == '123,456,789,012,345,678'
+    
+    def test_format_tokens_accepts_int(self):
+        assert format_tokens(1234 * 10**18) == format_tokens(str(1234 * 10**18)) == '1,234 GRT'
+    
+    def test_wei_to_grt(self):
+        assert wei_to_grt('2500000000000000000') == 2.5
+        assert wei_to_grt(10**18) == 1.0
+
 
 class TestFormatPercentage:
     """Tests for percentage formatting (input is PPM - parts per million)"""
@@ -86,6 +105,9 @@ class TestFormatTimestamp:
         # Should contain current year or time components
         assert len(result) > 0
     
+    def test_format_timestamp_int(self):
+        assert format_timestamp(1700000000) == format_timestamp('1700000000')
+    
     def test_format_timestamp_invalid(self):
         # Should handle invalid input gracefully
         result = format_timestamp('invalid')
@@ -185,6 +207,14 @@ class TestFormatDeploymentLink:
         result = format_deployment_link(ipfs_hash, subgraph_id)
         # Should contain the hash
         assert "QmXYZ" in result or "123" in result
+    
+    def test_format_deployment_link_follows_no_hyperlinks(self, monkeypatch):
+        """Memoized links must still honor NO_HYPERLINKS changes"""
+        monkeypatch.setenv("NO_HYPERLINKS", "0")
+        linked = format_deployment_link("QmXYZ", "0x1234")
+        monkeypatch.setenv("NO_HYPERLINKS", "1")
+        assert format_deployment_link("QmXYZ", "0x1234") == "QmXYZ"
+        assert linked != "QmXYZ" and "QmXYZ" in linked
 
 
 class TestColors:
@@ -207,6 +237,22 @@ class TestColors:
         assert Colors.BOLD.startswith('\033') or Colors.BOLD.startswith('\x1b')
 
 
+class TestJsonLoads:
+    """Tests for JSON parsing helper"""
+    
+    def test_json_loads_bytes(self):
+        assert json_loads(b'{"a": "1000000000000000000", "b": [1, 2]}') == {'a': '1000000000000000000', 'b': [1, 2]}
+    
+    def test_json_loads_str(self):
+        assert json_loads('{"data": null}') == {'data': None}
+    
+    def test_json_dumps_roundtrip(self):
+        obj = {'a': '1000000000000000000', 'b': [1, 2], 'c': None}
+        assert isinstance(json_dumps(obj), bytes)
+        assert json_loads(json_dumps(obj)) == obj
+        assert json_loads(json_dumps(obj, indent=True)) == obj
+        assert b'\n' in json_dumps(obj, indent=True)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
-
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for indexerinfo.py report helpers
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indexerinfo import (
+    _REWARD_BUCKETS, _reward_bucket_index, estimate_annual_rewards,
+    merge_recent_events, ActivityEvent,
+)
+
+
+def allocation(allocated: int, signal: int, staked: int) -> dict:
+    """Build an active allocation as returned by the network subgraph (amounts in GRT)"""
+    return {
+        'allocatedTokens': str(allocated * 10**18),
+        'subgraphDeployment': {
+            'signalledTokens': str(signal * 10**18),
+            'stakedTokens': str(staked * 10**18),
+        },
+    }
+
+
+class TestRewardBucketIndex:
+    """Tests for the rewards-by-expiration histogram buckets"""
+    
+    @pytest.mark.parametrize("epochs, expected", [
+        (-100, 0), (-1, 0),
+        (0, 1),
+        (1, 2), (3, 2),
+        (4, 3), (7, 3),
+        (8, 4), (14, 4),
+        (15, 5), (21, 5),
+        (22, 6), (28, 6),
+    ])
+    def test_bucket_edges(self, epochs, expected):
+        assert _reward_bucket_index(epochs) == expected
+    
+    def test_out_of_range(self):
+        assert _reward_bucket_index(29) is None
+        assert _reward_bucket_index(1000) is None
+    
+    def test_indexes_match_labels(self):
+        labels = [label for label, _, _ in _REWARD_BUCKETS]
+        assert labels[_reward_bucket_index(-1)] == "exp!"
+        assert labels[_reward_bucket_index(0)] == "0d"
+        assert labels[_reward_bucket_index(3)] == "1-3d"
+        assert labels[_reward_bucket_index(28)] == "22-28d"
+
+
+class TestEstimateAnnualRewards:
+    """Tests for the instant APR reward estimate"""
+    
+    def test_matches_per_allocation_formula(self):
+        allocations = [
+            allocation(100_000, 5_000, 400_000),
+            allocation(250_000, 12_345, 1_000_000),
+            allocation(1, 7, 3),
+        ]
+        annual_issuance = 100 * 2_628_000
+        total_signal = 2_000_000
+    
+        expected = sum(
+            annual_issuance * (signal / total_signal) * (alloc / staked)
+            for alloc, signal, staked in [(100_000, 5_000, 400_000), (250_000, 12_345, 1_000_000), (1, 7, 3)]
+        )
+        result = estimate_annual_rewards(allocations, annual_issuance, total_signal)
+        assert result == pytest.approx(expected, rel=1e-12)
+    
+    def test_displayed_apr_values(self):
+        """APR as printed by the report (same rounding as the display)"""
+        allocations = [allocation(100_000, 5_000, 400_000), allocation(250_000, 12_345, 1_000_000)]
+        total_expected_rewards = estimate_annual_rewards(allocations, 100 * 2_628_000, 2_000_000)
+        raw_reward_cut = 0.1
+    
+        apr_indexer = (total_expected_rewards * raw_reward_cut / 500_000) * 100
+        apr_delegators = (total_expected_rewards * (1 - raw_reward_cut) / 5_000_000) * 100
+    
+        assert f"{total_expected_rewards:,.0f}" == "569,783"
+        assert f"{apr_indexer:.1f}" == "11.4"
+        assert f"{apr_delegators:.2f}" == "10.26"
+    
+    def test_skips_deployments_without_stake(self):
+        allocations = [allocation(100, 10, 0), allocation(100, 10, 200)]
+        assert estimate_annual_rewards(allocations, 1_000, 100) == pytest.approx(1_000 * 0.1 * 0.5)
+    
+    def test_no_network_signal(self):
+        assert estimate_annual_rewards([allocation(100, 10, 200)], 1_000, 0) == 0
+    
+    def test_no_allocations(self):
+        assert estimate_annual_rewards([], 1_000, 100) == 0
+
+
+class TestMergeRecentEvents:
+    """Tests for the activity timeline merge"""
+    
+    @staticmethod
+    def events(event_type, *timestamps):
+        return [ActivityEvent(type=event_type, timestamp=ts, tokens='0') for ts in timestamps]
+    
+    def test_newest_first_across_lists(self):
+        allocates = self.events('allocate', 90, 50, 10)
+        unallocates = self.events('unallocate', 80, 40)
+        collects = self.events('collect', 100, 60, 20)
+    
+        merged = merge_recent_events(20, allocates, unallocates, collects)
+    
+        assert [e.timestamp for e in merged] == [100, 90, 80, 60, 50, 40, 20, 10]
+        assert [e.type for e in merged[:3]] == ['collect', 'allocate', 'unallocate']
+    
+    def test_truncates_to_limit(self):
+        delegates = self.events('delegate', *range(100, 80, -1))
+        undelegates = self.events('undelegate', *range(99, 79, -2))
+    
+        merged = merge_recent_events(15, delegates, undelegates)
+    
+        assert len(merged) == 15
+        expected = sorted([e.timestamp for e in delegates + undelegates], reverse=True)[:15]
+        assert [e.timestamp for e in merged] == expected
+    
+    def test_ties_keep_list_order(self):
+        merged = merge_recent_events(20, self.events('allocate', 50), self.events('unallocate', 50))
+        assert [e.type for e in merged] == ['allocate', 'unallocate']
+    
+    def test_empty_lists(self):
+        assert merge_recent_events(20, [], []) == []
+        assert merge_recent_events(0, self.events('allocate', 1)) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -41,6 +41,19 @@ class TestColoredFormatter:
         # Should contain ANSI codes when colors enabled
         assert 'Warning message' in result
     
+    def test_formatter_does_not_mutate_record(self):
+        """Colors must not leak into other handlers sharing the record"""
+        with patch.object(sys.stderr, 'isatty', return_value=True):
+            formatter = ColoredFormatter(use_colors=True)
+        record = logging.LogRecord(
+            name='test', level=logging.DEBUG, pathname='', lineno=0,
+            msg='Debug %s', args=('message',), exc_info=None
+        )
+        result = formatter.format(record)
+        assert result.startswith(ColoredFormatter.DIM + '[DEBUG] Debug message')
+        assert record.msg == 'Debug %s'
+        assert logging.Formatter('%(message)s').format(record) == 'Debug message'
+    
     def test_formatter_without_colors(self):
         formatter = ColoredFormatter(use_colors=False)
         record = logging.LogRecord(
@@ -98,6 +111,13 @@ class TestSetupLogging:
         logger = get_logger('test_debug')
         # At verbosity 2, effective level should be DEBUG
         assert logger.level <= logging.DEBUG
+    
+    def test_setup_verbosity_out_of_range(self):
+        """Extra -v flags stay at DEBUG, negative verbosity at WARNING"""
+        setup_logging(verbosity=5)
+        assert get_logger('test_many_v').level == logging.DEBUG
+        setup_logging(verbosity=-1)
+        assert get_logger('test_negative_v').level == logging.WARNING
 
 
 class TestConvenienceFunctions:
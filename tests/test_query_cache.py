@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for query_cache.py module
+"""
+
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from query_cache import QueryCache
+
+
+class TestQueryCache:
+    """Tests for QueryCache class"""
+    
+    def test_roundtrip(self, tmp_path):
+        cache = QueryCache(tmp_path / 'queries.sqlite')
+        key = QueryCache.make_key('http://x', '{ a }')
+        cache.set(key, {'a': ['1', '2']}, ttl=60)
+        assert cache.get(key) == {'a': ['1', '2']}
+    
+    def test_missing_key(self, tmp_path):
+        cache = QueryCache(tmp_path / 'queries.sqlite')
+        assert cache.get('nope') is None
+    
+    def test_expired_entry(self, tmp_path):
+        cache = QueryCache(tmp_path / 'queries.sqlite')
+        cache.set('k', {'a': 1}, ttl=10)
+        with patch('query_cache.time.time', return_value=time.time() + 11):
+            assert cache.get('k') is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        QueryCache(tmp_path / 'queries.sqlite').set('k', {'a': 1}, ttl=60)
+        assert QueryCache(tmp_path / 'queries.sqlite').get('k') == {'a': 1}
+    
+    def test_key_ignores_variable_order(self):
+        key1 = QueryCache.make_key('http://x', 'q', {'a': 1, 'b': 2})
+        key2 = QueryCache.make_key('http://x', 'q', {'b': 2, 'a': 1})
+        assert key1 == key2
+        assert key1 != QueryCache.make_key('http://y', 'q', {'a': 1, 'b': 2})
+
+
+class TestIndexerReportCache:
+    """Tests for caching of the indexerinfo report query"""
+    
+    def test_fetch_all_reuses_recent_run(self, tmp_path):
+        from indexerinfo import TheGraphClient
+        client = TheGraphClient('http://x', cache=QueryCache(tmp_path / 'queries.sqlite'))
+        with patch.object(TheGraphClient, '_query', return_value={'indexer': {'id': '0xabc'}}) as mock_query:
+            now = 1_700_000_000 - 1_700_000_000 % 60 + 10
+            client.fetch_all('0xABC', now - 48 * 3600)
+            client.fetch_all('0xABC', now + 5 - 48 * 3600)
+        assert mock_query.call_count == 1
+    
+    def test_sync_statuses_reused_from_cache(self, tmp_path):
+        from indexerinfo import get_sync_statuses
+        cache = QueryCache(tmp_path / 'queries.sqlite')
+        statuses = {'QmA': {'health': 'healthy', 'latestBlock': 10}}
+        with patch('indexerinfo.IndexerStatusClient') as status_client:
+            status_client.return_value.get_deployments_status.return_value = statuses
+            status_client.return_value.last_error = None
+            first = get_sync_statuses('https://idx.example', {'QmA'}, '0xABC', cache=cache)
+            second = get_sync_statuses('https://idx.example', {'QmA'}, '0xabc', cache=cache)
+        assert first == second == (statuses, None)
+        assert status_client.return_value.get_deployments_status.call_count == 1
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Unit tests for subgraph-health.py script
+"""
+
+import importlib.util
+import pytest
+import sys
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The script name has a dash, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    'subgraph_health',
+    Path(__file__).resolve().parent.parent / 'subgraph-health.py'
+)
+sh = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sh)
+
+
+def issue(ipfs_hash, issue_type='error'):
+    """Build a check_deployment_health-style result with one issue"""
+    return {'info': {'ipfsHash': ipfs_hash, 'network': 'mainnet'}, 'issues': [{'type': issue_type}]}
+
+
+class TestCache:
+    """Tests for the SQLite-backed Cache class"""
+    
+    def test_roundtrip(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        cache.set('k', {'a': [1, 2]})
+        assert cache.get('k') == {'a': [1, 2]}
+        assert cache.get('missing') is None
+    
+    def test_overwrite(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        cache.set('k', {'v': 1})
+        cache.set('k', {'v': 2})
+        assert cache.get('k') == {'v': 2}
+        assert sh.Cache(tmp_path).get('k') == {'v': 2}
+    
+    def test_reopen_existing_database(self, tmp_path):
+        sh.Cache(tmp_path).set('k', {'v': 1})
+        assert (tmp_path / 'cache.sqlite').exists()
+        assert sh.Cache(tmp_path).get('k') == {'v': 1}
+    
+    def test_ttl_expiry(self, tmp_path):
+        cache = sh.Cache(tmp_path, ttl_seconds=10)
+        cache.set('k', {'v': 1})
+        later = sh.time.time() + 11
+        with patch.object(sh.time, 'time', return_value=later):
+            assert cache.get('k') is None
+            assert sh.Cache(tmp_path, ttl_seconds=10).get('k') is None
+    
+    def test_expired_rows_dropped_on_open(self, tmp_path):
+        sh.Cache(tmp_path, ttl_seconds=10).set('k', {'v': 1})
+        later = sh.time.time() + 11
+        with patch.object(sh.time, 'time', return_value=later):
+            cache = sh.Cache(tmp_path)
+        assert cache._conn.execute('SELECT COUNT(*) FROM kv').fetchone()[0] == 0
+    
+    def test_corrupt_database_falls_back_to_memory(self, tmp_path):
+        (tmp_path / 'cache.sqlite').write_bytes(b'this is not a database' * 100)
+        cache = sh.Cache(tmp_path)
+        assert cache._conn is None
+        assert cache.get('k') is None
+        cache.set('k', {'v': 1})
+        assert cache.get('k') == {'v': 1}
+    
+    def test_legacy_json_files_ignored(self, tmp_path):
+        # Entries from the former one-file-per-key JSON cache are not read back
+        (tmp_path / 'k.json').write_text('{"data": {"v": 0}, "expires": 9999999999}')
+        cache = sh.Cache(tmp_path)
+        assert cache.get('k') is None
+        cache.set('k', {'v': 1})
+        assert sh.Cache(tmp_path).get('k') == {'v': 1}
+    
+    def test_get_many_skips_expired_and_missing(self, tmp_path):
+        cache = sh.Cache(tmp_path, ttl_seconds=10)
+        cache.set('fresh', {'v': 1})
+        now = sh.time.time()
+        with patch.object(sh.time, 'time', return_value=now - 20):
+            cache.set('old', {'v': 2})
+        
+        assert cache.get_many(['fresh', 'old', 'missing']) == {'fresh': {'v': 1}}
+        # Same answer from the database alone
+        assert sh.Cache(tmp_path).get_many(['fresh', 'old', 'missing']) == {'fresh': {'v': 1}}
+    
+    def test_get_many_large_key_list(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        for i in range(1200):
+            cache.set(f'k{i}', {'v': i})
+        found = sh.Cache(tmp_path).get_many([f'k{i}' for i in range(1300)])
+        assert len(found) == 1200
+        assert found['k1199'] == {'v': 1199}
+
+
+class TestHistoryManager:
+    """Tests for HistoryManager class"""
+    
+    def test_replay_matches_live_state(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        history.record_run([issue('QmA'), issue('QmB')])
+        history.record_run([issue('QmA')])
+        history.record_run([issue('QmA', 'sync_too_slow'), issue('QmC')])
+        
+        reloaded = sh.HistoryManager(tmp_path)
+        assert reloaded._data == history._data
+        assert set(reloaded._active_hashes) == {'QmA', 'QmC'}
+        assert reloaded._data['issues']['QmA']['issue_type'] == 'sync_too_slow'
+        assert reloaded._data['issues']['QmB']['resolved_at'] is not None
+        assert len(reloaded._data['runs']) == 3
+    
+    def test_events_only_hold_changes(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        history.record_run([issue('QmA'), issue('QmB')])
+        history.record_run([issue('QmA'), issue('QmB')])
+        history.record_run([issue('QmA')])
+        
+        with open(history.events_file, 'rb') as f:
+            events = [sh.json_loads(line) for line in f]
+        assert [sorted(e['issues']) for e in events] == [['QmA', 'QmB'], [], ['QmB']]
+        assert [e['seq'] for e in events] == [1, 2, 3]
+    
+    def test_compaction(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        for _ in range(sh.HistoryManager.COMPACT_EVERY):
+            history.record_run([issue('QmA')])
+        
+        assert not history.events_file.exists()
+        assert history._data['seq'] == sh.HistoryManager.COMPACT_EVERY
+        history.record_run([])
+        
+        reloaded = sh.HistoryManager(tmp_path)
+        assert reloaded._data['seq'] == sh.HistoryManager.COMPACT_EVERY + 1
+        assert len(reloaded._data['runs']) == sh.HistoryManager.COMPACT_EVERY + 1
+        assert reloaded._data['issues']['QmA']['resolved_at'] is not None
+        assert reloaded._event_count == 1
+    
+    def test_torn_trailing_line(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        history.record_run([issue('QmA')])
+        with open(history.events_file, 'ab') as f:
+            f.write(b'{"seq": 2, "t": "2026-')
+        
+        history = sh.HistoryManager(tmp_path)
+        assert len(history._data['runs']) == 1
+        history.record_run([issue('QmA'), issue('QmB')])
+        
+        reloaded = sh.HistoryManager(tmp_path)
+        assert len(reloaded._data['runs']) == 2
+        assert set(reloaded._active_hashes) == {'QmA', 'QmB'}
+    
+    def test_crash_between_snapshot_and_log_removal(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        with patch.object(Path, 'unlink', side_effect=OSError('crash')):
+            with pytest.raises(OSError):
+                for _ in range(sh.HistoryManager.COMPACT_EVERY):
+                    history.record_run([issue('QmA')])
+        assert history.events_file.exists()
+        
+        reloaded = sh.HistoryManager(tmp_path)
+        assert len(reloaded._data['runs']) == sh.HistoryManager.COMPACT_EVERY
+        assert reloaded._data['seq'] == sh.HistoryManager.COMPACT_EVERY
+        
+        # The stale log is dropped at the next compaction
+        reloaded.record_run([issue('QmA')])
+        assert not reloaded.events_file.exists()
+        assert len(sh.HistoryManager(tmp_path)._data['runs']) == sh.HistoryManager.COMPACT_EVERY + 1
+
+    
+    def test_record_run_resolves_only_missing_issues(self, tmp_path):
+        history = sh.HistoryManager(tmp_path)
+        changes = history.record_run([issue('QmA'), issue('QmB'), issue('QmC')])
+        assert sorted(i['ipfsHash'] for i in changes['new']) == ['QmA', 'QmB', 'QmC']
+        
+        changes = history.record_run([issue('QmB'), issue('QmD')])
+        assert [i['ipfsHash'] for i in changes['resolved']] == ['QmA', 'QmC']
+        assert [i['ipfsHash'] for i in changes['new']] == ['QmD']
+        assert set(history._active_hashes) == {'QmB', 'QmD'}
+        issues = history._data['issues']
+        assert issues['QmA']['resolved_at'] is not None
+        assert issues['QmC']['resolved_at'] is not None
+        assert issues['QmB']['resolved_at'] is None
+        assert issues['QmD']['resolved_at'] is None
+        
+        # A resolved issue that comes back is new again
+        changes = history.record_run([issue('QmA'), issue('QmB'), issue('QmD')])
+        assert [i['ipfsHash'] for i in changes['new']] == ['QmA']
+        assert changes['resolved'] == []
+        assert issues['QmA']['resolved_at'] is None
+
+
+class TestCheckOtherIndexersStatus:
+    """Tests for check_other_indexers_status"""
+    
+    def test_shared_url_probed_once(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        probes = []
+        
+        def fake_probe(indexer_url, heads):
+            probes.append((indexer_url, dict(heads)))
+            return {d: {'latestBlock': 200, 'healthy': True} for d in heads}
+        
+        # Two indexer ids behind one URL, for two deployments
+        peers = [{'id': '0xa', 'url': 'idx.example/'}, {'id': '0xb', 'url': 'https://idx.example'}]
+        checks = [('QmA', 100, peers), ('QmB', 150, peers)]
+        with patch.object(sh, '_probe_indexer', side_effect=fake_probe):
+            summaries = sh.check_other_indexers_status(checks, cache)
+        
+        assert probes == [('https://idx.example', {'QmA': 100, 'QmB': 150})]
+        assert summaries == [(2, 0, None), (2, 0, None)]
+        for key in ('status_0xa_QmA', 'status_0xb_QmA', 'status_0xa_QmB', 'status_0xb_QmB'):
+            assert cache.get(key) == {'latestBlock': 200, 'healthy': True}
+    
+    def test_cached_pairs_not_probed(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        cache.set('status_0xa_QmA', {'latestBlock': 90, 'failed': True})
+        peers = [{'id': '0xa', 'url': 'https://a.example'}, {'id': '0xb', 'url': 'https://b.example'}]
+        with patch.object(sh, '_probe_indexer',
+                          return_value={'QmA': {'latestBlock': 95, 'failed': True}}) as probe:
+            summaries = sh.check_other_indexers_status([('QmA', 100, peers)], cache)
+        
+        probe.assert_called_once_with('https://b.example', {'QmA': 100})
+        assert summaries == [(0, 2, 90)]
+
+
+class TestNetworkSubgraphClient:
+    """Tests for NetworkSubgraphClient allocation paging"""
+    
+    @staticmethod
+    def fake_subgraph(ids):
+        """Stub for NetworkSubgraphClient.query serving allocations with the given ids"""
+        ids = sorted(ids)
+        calls = []
+        
+        def query(q, variables=None):
+            calls.append((variables['lastId'], variables['maxId']))
+            page = [i for i in ids if variables['lastId'] < i <= variables['maxId']][:variables['first']]
+            data = {'allocations': [{'id': i} for i in page]}
+            if 'allocationCount' in q:
+                data['indexer'] = {'allocationCount': len(ids)}
+            return data
+        return query, calls
+    
+    def test_parallel_ranges_keep_boundary_ids(self):
+        first_page = ['0x%040x' % i for i in range(1, 1001)]
+        # Same split as get_indexer_allocations: 2500 remaining ids -> 3 ranges
+        start = 1000
+        end = int(sh.NetworkSubgraphClient.MAX_ALLOCATION_ID, 16)
+        bounds = [start + (end - start) * i // 3 for i in (1, 2)]
+        rest = set()
+        for b in bounds:
+            rest.update('0x%040x' % n for n in (b - 1, b, b + 1))
+        # Enough ids in the first range for it to need several pages
+        rest.update('0x%040x' % n for n in range(2000, 3500))
+        rest.update('0x%040x' % (bounds[1] + 10 + n) for n in range(993))
+        rest.add(sh.NetworkSubgraphClient.MAX_ALLOCATION_ID)
+        assert len(rest) == 2500
+        
+        client = sh.NetworkSubgraphClient('http://subgraph')
+        query, calls = self.fake_subgraph(first_page + sorted(rest))
+        with patch.object(client, 'query', side_effect=query):
+            allocations = client.get_indexer_allocations('0xINDEXER')
+        
+        ids = [a['id'] for a in allocations]
+        assert len(ids) == len(set(ids)) == 3500
+        assert set(ids) == set(first_page) | rest
+        # First page, two pages for the first range, one each for the others
+        assert len(calls) == 5
+        # Ranges end exactly at the split points
+        assert {max_id for _, max_id in calls[1:]} == {
+            '0x%040x' % bounds[0], '0x%040x' % bounds[1], sh.NetworkSubgraphClient.MAX_ALLOCATION_ID
+        }
+    
+    def test_single_page(self):
+        client = sh.NetworkSubgraphClient('http://subgraph')
+        query, calls = self.fake_subgraph(['0x%040x' % i for i in range(1, 11)])
+        with patch.object(client, 'query', side_effect=query):
+            assert len(client.get_indexer_allocations('0xindexer')) == 10
+        assert len(calls) == 1
+
+
+class TestProbeIndexer:
+    """Tests for _probe_indexer"""
+    
+    @staticmethod
+    def status(deployment, health='healthy', block=200):
+        return {'subgraph': deployment, 'health': health, 'chains': [{'latestBlock': {'number': str(block)}}]}
+    
+    def test_batched_statuses(self):
+        statuses = [self.status('QmA'), self.status('QmB', 'failed', 150)]
+        with patch.object(sh, '_fetch_indexing_statuses', return_value=statuses) as fetch:
+            results = sh._probe_indexer('https://idx.example', {'QmA': 100, 'QmB': 100, 'QmC': 100})
+        fetch.assert_called_once_with('https://idx.example/status', ['QmA', 'QmB', 'QmC'])
+        assert results == {
+            'QmA': {'latestBlock': 200, 'healthy': True},
+            'QmB': {'latestBlock': 150, 'failed': True},
+            'QmC': {'unknown': True},
+        }
+    
+    def test_falls_back_to_single_deployments(self):
+        def fetch(status_url, deployments):
+            if len(deployments) > 1 or deployments == ['QmBad']:
+                raise ValueError('unknown deployment')
+            return [self.status(deployments[0])]
+        
+        with patch.object(sh, '_fetch_indexing_statuses', side_effect=fetch) as mock_fetch:
+            results = sh._probe_indexer('https://idx.example', {'QmA': 100, 'QmBad': 100, 'QmC': 100})
+        assert mock_fetch.call_count == 4
+        assert results == {
+            'QmA': {'latestBlock': 200, 'healthy': True},
+            'QmBad': {'unknown': True},
+            'QmC': {'latestBlock': 200, 'healthy': True},
+        }
+    
+    def test_unreachable_indexer_not_retried(self):
+        error = sh.requests.exceptions.ConnectionError('refused')
+        with patch.object(sh, '_fetch_indexing_statuses', side_effect=error) as fetch:
+            results = sh._probe_indexer('https://idx.example', {'QmA': 100, 'QmB': 100})
+        assert fetch.call_count == 1
+        assert results == {'QmA': {'unknown': True}, 'QmB': {'unknown': True}}
+
+
+class TestAddOtherIndexersStatus:
+    """Tests for add_other_indexers_status"""
+    
+    @staticmethod
+    def failed_result(ipfs_hash, head):
+        return {'info': {'ipfsHash': ipfs_hash}, 'issues': [{'type': 'error'}], 'pendingPeerCheck': {'head': head}}
+    
+    def test_pending_checks_resolved(self, tmp_path):
+        cache = sh.Cache(tmp_path)
+        # QmCached is answered from the cache, QmProbed needs a request, QmAlone has no peers
+        cache.set('status_0xpeer_QmCached', {'latestBlock': 500, 'healthy': True})
+        allocations = [
+            {'id': '0x1', 'subgraphDeployment': {'ipfsHash': 'QmCached'},
+             'indexer': {'id': '0xpeer', 'url': 'https://peer.example'}},
+            {'id': '0x2', 'subgraphDeployment': {'ipfsHash': 'QmProbed'},
+             'indexer': {'id': '0xpeer', 'url': 'https://peer.example'}},
+        ]
+        client = sh.NetworkSubgraphClient('http://subgraph')
+        results = [
+            self.failed_result('QmCached', 400),
+            self.failed_result('QmProbed', 1000),
+            self.failed_result('QmAlone', 10),
+            {'info': {'ipfsHash': 'QmHealthy'}, 'issues': []},
+        ]
+        with patch.object(client, 'query', return_value={'allocations': allocations}), \
+                patch.object(sh, '_probe_indexer',
+                             return_value={'QmProbed': {'latestBlock': 1010, 'failed': True}}) as probe:
+            sh.add_other_indexers_status(results, client, '0xME', cache)
+        
+        probe.assert_called_once_with('https://peer.example', {'QmProbed': 1000})
+        assert all('pendingPeerCheck' not in r for r in results)
+        cached, probed, alone, healthy = (r['info'] for r in results)
+        assert cached['othersHealthy'] is True
+        assert cached['othersHealthyCount'] == 1
+        assert probed['othersHealthy'] is False
+        assert probed['othersFailed'] == 1
+        assert probed['commonFailBlock'] == 1010
+        assert probed['sameBlockFailure'] is True
+        assert 'othersHealthy' not in alone
+        assert healthy == {'ipfsHash': 'QmHealthy'}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -25,6 +25,11 @@ class TestIndexerStatusClient:
         client = IndexerStatusClient(timeout=30)
         assert client._timeout == 30
     
+    def test_init_shared_session(self):
+        session = Mock()
+        client = IndexerStatusClient(session=session)
+        assert client._session is session
+    
     def test_get_all_deployments_status_no_url(self):
         client = IndexerStatusClient()
         result = client.get_all_deployments_status("")
@@ -74,6 +79,50 @@ class TestIndexerStatusClient:
             assert result['health'] == 'healthy'
 
 
+class TestGetDeploymentsStatus:
+    """Tests for filtered deployment status queries"""
+    
+    @staticmethod
+    def _response(payload):
+        response = Mock()
+        response.json.return_value = payload
+        response.raise_for_status = Mock()
+        return response
+    
+    def test_empty_hashes_skips_request(self):
+        client = IndexerStatusClient()
+        with patch.object(client._session, 'post') as mock_post:
+            result = client.get_deployments_status("https://example.com", [])
+            assert result == {}
+            mock_post.assert_not_called()
+    
+    def test_sends_subgraphs_filter(self):
+        client = IndexerStatusClient()
+        payload = {'data': {'indexingStatuses': [{
+            'subgraph': 'QmA',
+            'synced': True,
+            'health': 'healthy',
+            'chains': [{'network': 'mainnet', 'latestBlock': {'number': '100'}, 'chainHeadBlock': {'number': '105'}}]
+        }]}}
+        with patch.object(client._session, 'post', return_value=self._response(payload)) as mock_post:
+            result = client.get_deployments_status("https://example.com", ['QmB', 'QmA', None])
+            
+            variables = mock_post.call_args[1]['json']['variables']
+            assert variables == {'subgraphs': ['QmA', 'QmB']}
+            assert result['QmA']['blocksBehind'] == 5
+    
+    def test_falls_back_to_all_deployments_on_graphql_error(self):
+        client = IndexerStatusClient()
+        error = {'errors': [{'message': 'Unknown argument "subgraphs"'}]}
+        all_statuses = {'data': {'indexingStatuses': [
+            {'subgraph': 'QmA', 'synced': True, 'health': 'healthy', 'chains': []},
+            {'subgraph': 'QmOther', 'synced': True, 'health': 'healthy', 'chains': []},
+        ]}}
+        with patch.object(client._session, 'post', side_effect=[self._response(error), self._response(all_statuses)]):
+            result = client.get_deployments_status("https://example.com", ['QmA'])
+            assert list(result.keys()) == ['QmA']
+
+
 class TestFormatSyncStatus:
     """Tests for format_sync_status function"""
     